@@ -18,26 +18,255 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+# Enum types are declared once and created explicitly at the top of upgrade();
+# create_type=False stops create_table from re-emitting CREATE TYPE for every
+# column that references them.
+verification_method = postgresql.ENUM(
+    'EMAIL', 'PHONE', 'IN_PERSON_TWO_PARTY', 'GOVERNMENT_ID', 'BIOMETRIC',
+    'PERSONAL_REFERENCE', 'BUSINESS_LICENSE', 'TAX_ID_BUSINESS', 'BUSINESS_ADDRESS',
+    'BUSINESS_INSURANCE', 'OWNER_VERIFICATION', 'NONPROFIT_STATUS', 'TAX_ID_NONPROFIT',
+    'ORGANIZATION_BYLAWS', 'BOARD_VERIFICATION', 'MISSION_ALIGNMENT',
+    'NOTARY_VERIFICATION', 'PROFESSIONAL_LICENSE', 'COMMUNITY_ENDORSEMENT',
+    name='verificationmethod',
+    create_type=False,
+)
+verification_level = postgresql.ENUM(
+    'UNVERIFIED', 'MINIMAL', 'STANDARD', 'ENHANCED', 'COMPLETE',
+    name='verificationlevel',
+    create_type=False,
+)
+verifier_credential = postgresql.ENUM(
+    'NOTARY_PUBLIC', 'ATTORNEY', 'COMMUNITY_LEADER', 'VERIFIED_BUSINESS_OWNER',
+    'ORGANIZATION_DIRECTOR', 'GOVERNMENT_OFFICIAL', 'TRUSTED_VERIFIER',
+    name='verifiercredential',
+    create_type=False,
+)
+# verificationstatus already exists (created by 6e9429e95787 for users and
+# verifications); this migration only adds the two new labels it needs.
+verification_status = postgresql.ENUM(
+    'PENDING', 'IN_PROGRESS', 'VERIFIED', 'REJECTED', 'EXPIRED', 'REVOKED',
+    name='verificationstatus',
+    create_type=False,
+)
+
+
+# Secondary indexes, built CONCURRENTLY outside the migration transaction so
+# that reads/writes against the parent tables are never blocked while they
+# build. Each entry is (index name, definition, unique).
+#
+# JSONB columns get GIN indexes with the jsonb_path_ops operator class: the app
+# only ever asks containment questions of them (``completed_methods @> '["email"]'``,
+# ``credentials @> '["notary_public"]'``), and jsonb_path_ops indexes are
+# considerably smaller and faster than the default jsonb_ops for ``@>``.
+#
+# The hot per-user lookups (``WHERE user_id = ? AND status = ?`` and
+# ``WHERE user_id = ? ORDER BY created_at DESC``) are served by composite
+# indexes rather than separate single-column ones; the leading user_id column
+# covers plain user_id filters as well.
+_INDEXES: list[tuple[str, str] | tuple[str, str, bool]] = [
+    # verification_records
+    ("ix_verification_records_method", "ON verification_records (method)"),
+    ("ix_verification_records_user_status", "ON verification_records (user_id, status)"),
+    ("ix_verification_records_user_created", "ON verification_records (user_id, created_at DESC)"),
+    ("ix_verification_records_temporal_workflow_id", "ON verification_records (temporal_workflow_id)"),
+    ("ix_verification_records_verifier1_id", "ON verification_records (verifier1_id)"),
+    ("ix_verification_records_verifier1_token_sha256", "ON verification_records (verifier1_token_sha256)", True),
+    ("ix_verification_records_verifier2_id", "ON verification_records (verifier2_id)"),
+    ("ix_verification_records_verifier2_token_sha256", "ON verification_records (verifier2_token_sha256)", True),
+    # Partial: most records (two-party flow) carry no document at all
+    ("ix_verification_records_document_hash", "ON verification_records (document_hash) WHERE document_hash IS NOT NULL"),
+    ("ix_verification_records_credential_data_gin", "ON verification_records USING GIN (credential_data jsonb_path_ops)"),
+
+    # user_verification_levels
+    ("ix_user_verification_levels_current_level", "ON user_verification_levels (current_level)"),
+    ("ix_user_verification_levels_user_id", "ON user_verification_levels (user_id)", True),
+    ("ix_user_verification_levels_completed_methods_gin", "ON user_verification_levels USING GIN (completed_methods jsonb_path_ops)"),
+    ("ix_user_verification_levels_in_progress_methods_gin", "ON user_verification_levels USING GIN (in_progress_methods jsonb_path_ops)"),
+
+    # verifier_profiles
+    ("ix_verifier_profiles_user_id", "ON verifier_profiles (user_id)", True),
+    # Partial index holding only selectable (active) verifiers
+    ("ix_verifier_profiles_active", "ON verifier_profiles (user_id) WHERE is_authorized AND NOT revoked"),
+    ("ix_verifier_profiles_credentials_gin", "ON verifier_profiles USING GIN (credentials jsonb_path_ops)"),
+
+    # verifier_credential_validations
+    ("ix_verifier_credential_validations_is_valid", "ON verifier_credential_validations (is_valid)"),
+    ("ix_verifier_credential_validations_verifier_profile_id", "ON verifier_credential_validations (verifier_profile_id)"),
+]
+
+# verification_events is partitioned, and PostgreSQL cannot build an index
+# CONCURRENTLY on a partitioned table. The table is brand new and empty here,
+# so these are created inside the migration transaction and cascade to every
+# partition (present and future) as local indexes.
+_EVENT_INDEXES: list[tuple[str, str]] = [
+    ("ix_verification_events_user_created", "ON verification_events (user_id, created_at DESC)"),
+    ("ix_verification_events_event_type", "ON verification_events (event_type)"),
+    ("ix_verification_events_temporal_workflow_id", "ON verification_events (temporal_workflow_id)"),
+    (
+        "ix_verification_events_record_created",
+        "ON verification_events (verification_record_id, created_at DESC)"
+        " WHERE verification_record_id IS NOT NULL",
+    ),
+    # event_data is only ever filtered on its "method" key, so index that path
+    # alone rather than the whole document.
+    (
+        "ix_verification_events_method",
+        "ON verification_events ((event_data ->> 'method'))"
+        " WHERE event_data ->> 'method' IS NOT NULL",
+    ),
+]
+
+# Creates (idempotently) the monthly verification_events partition covering
+# the given date, with month boundaries in UTC, and returns its name. Called
+# below for the current and next two months. After that, the application
+# keeps partitions created ahead (nabr.db.maintenance, run by every API
+# process) and pg_cron does the same monthly where that extension is
+# installed. Operators running without the API must call this function
+# themselves before each month starts. verification_events_default only
+# catches stray rows and must stay empty: once it holds rows for a month,
+# creating that month's partition fails.
+_CREATE_EVENT_PARTITION_FUNCTION = """
+CREATE OR REPLACE FUNCTION create_verification_events_partition(month date)
+RETURNS text
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    start_date date := date_trunc('month', month)::date;
+    partition_name text := 'verification_events_' || to_char(start_date, 'YYYY_MM');
+BEGIN
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %I PARTITION OF verification_events '
+        'FOR VALUES FROM (%L) TO (%L)',
+        partition_name,
+        start_date::timestamp AT TIME ZONE 'UTC',
+        (start_date + interval '1 month')::timestamp AT TIME ZONE 'UTC'
+    );
+    RETURN partition_name;
+END;
+$$
+"""
+
+# Retention: detaches and drops every monthly partition whose range ended
+# more than `retention` ago, returning the dropped names. Dropping a whole
+# partition is a catalog operation, unlike a DELETE that scans the table and
+# leaves a dead tuple per row. Run by the application's maintenance job
+# (nabr.db.maintenance) and nightly by pg_cron where installed. The DEFAULT
+# partition is never touched: rows that land there are outside retention
+# and have to be moved or deleted by hand, which is why partitions are kept
+# created ahead of time.
+_DROP_EXPIRED_EVENT_PARTITIONS_FUNCTION = """
+CREATE OR REPLACE FUNCTION drop_expired_verification_events_partitions(
+    retention interval DEFAULT interval '1 year'
+)
+RETURNS SETOF text
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    partition_name text;
+BEGIN
+    FOR partition_name IN
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.relname = 'verification_events'
+          AND child.relname ~ '^verification_events_[0-9]{4}_[0-9]{2}$'
+          AND to_date(right(child.relname, 7), 'YYYY_MM') + interval '1 month'
+              <= (now() AT TIME ZONE 'UTC') - retention
+        ORDER BY child.relname
+    LOOP
+        EXECUTE format('ALTER TABLE verification_events DETACH PARTITION %I', partition_name);
+        EXECUTE format('DROP TABLE %I', partition_name);
+        RETURN NEXT partition_name;
+    END LOOP;
+END;
+$$
+"""
+
+_SCHEDULE_EVENT_PARTITION_JOBS = """
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+        PERFORM cron.schedule(
+            'verification-events-next-partition',
+            '0 0 25 * *',
+            'SELECT create_verification_events_partition((current_date + interval ''1 month'')::date)'
+        );
+        PERFORM cron.schedule(
+            'verification-events-retention',
+            '30 3 * * *',
+            'SELECT drop_expired_verification_events_partitions()'
+        );
+    END IF;
+END
+$$
+"""
+
+
+_HOT_UPDATE_TABLES = ("verification_records", "user_verification_levels", "verifier_profiles")
+
+# Foreign keys of the non-partitioned tables, as (table, column, target,
+# ON DELETE). They are added NOT VALID once every table exists and validated
+# afterwards, outside the migration transaction: VALIDATE CONSTRAINT only takes
+# a SHARE UPDATE EXCLUSIVE lock, so this stays non-blocking if the migration is
+# ever replayed against populated tables. verification_events keeps its
+# foreign keys inline because PostgreSQL does not allow NOT VALID foreign keys
+# on a partitioned table.
+_FOREIGN_KEYS: list[tuple[str, str, str, str]] = [
+    ("verification_records", "user_id", "users(id)", "CASCADE"),
+    ("verification_records", "verifier1_id", "users(id)", "SET NULL"),
+    ("verification_records", "verifier2_id", "users(id)", "SET NULL"),
+    ("user_verification_levels", "user_id", "users(id)", "CASCADE"),
+    ("verifier_profiles", "user_id", "users(id)", "CASCADE"),
+    ("verifier_credential_validations", "verifier_profile_id", "verifier_profiles(id)", "CASCADE"),
+]
+
+
+def _foreign_key_name(table: str, column: str) -> str:
+    """PostgreSQL's default constraint name, matching inline REFERENCES."""
+    return f"{table}_{column}_fkey"
+
+
+def _create_index_concurrently(name: str, definition: str, unique: bool = False) -> None:
+    """Emit CREATE INDEX CONCURRENTLY; must run inside an autocommit block."""
+    op.execute(
+        f"CREATE {'UNIQUE ' if unique else ''}INDEX CONCURRENTLY IF NOT EXISTS "
+        f"{name} {definition}"
+    )
+
+
+def _create_index(name: str, definition: str) -> None:
+    """Emit a plain (transactional) CREATE INDEX."""
+    op.execute(f"CREATE INDEX IF NOT EXISTS {name} {definition}")
+
+
 def upgrade() -> None:
+    bind = op.get_bind()
+    verification_method.create(bind, checkfirst=True)
+    verification_level.create(bind, checkfirst=True)
+    verifier_credential.create(bind, checkfirst=True)
+    op.execute("ALTER TYPE verificationstatus ADD VALUE IF NOT EXISTS 'IN_PROGRESS'")
+    op.execute("ALTER TYPE verificationstatus ADD VALUE IF NOT EXISTS 'REVOKED'")
+
     # Create verification_records table
     op.create_table(
         'verification_records',
         sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('method', sa.Enum('EMAIL', 'PHONE', 'IN_PERSON_TWO_PARTY', 'GOVERNMENT_ID', 'BIOMETRIC', 'PERSONAL_REFERENCE', 'BUSINESS_LICENSE', 'TAX_ID_BUSINESS', 'BUSINESS_ADDRESS', 'BUSINESS_INSURANCE', 'OWNER_VERIFICATION', 'NONPROFIT_STATUS', 'TAX_ID_NONPROFIT', 'ORGANIZATION_BYLAWS', 'BOARD_VERIFICATION', 'MISSION_ALIGNMENT', 'NOTARY_VERIFICATION', 'PROFESSIONAL_LICENSE', 'COMMUNITY_ENDORSEMENT', name='verificationmethod'), nullable=False),
-        sa.Column('status', sa.Enum('PENDING', 'IN_PROGRESS', 'VERIFIED', 'REJECTED', 'EXPIRED', 'REVOKED', name='verificationstatus'), nullable=False),
+        sa.Column('method', verification_method, nullable=False),
+        sa.Column('status', verification_status, nullable=False),
         sa.Column('verifier1_id', postgresql.UUID(as_uuid=True), nullable=True),
         sa.Column('verifier2_id', postgresql.UUID(as_uuid=True), nullable=True),
-        sa.Column('verifier1_confirmed_at', sa.DateTime(), nullable=True),
-        sa.Column('verifier2_confirmed_at', sa.DateTime(), nullable=True),
+        sa.Column('verifier1_confirmed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('verifier2_confirmed_at', sa.DateTime(timezone=True), nullable=True),
         sa.Column('verifier1_location', sa.Text(), nullable=True),
         sa.Column('verifier2_location', sa.Text(), nullable=True),
         sa.Column('verifier1_notes', sa.Text(), nullable=True),
         sa.Column('verifier2_notes', sa.Text(), nullable=True),
-        sa.Column('verifier1_token', sa.String(length=255), nullable=True),
-        sa.Column('verifier2_token', sa.String(length=255), nullable=True),
-        sa.Column('qr_expires_at', sa.DateTime(), nullable=True),
-        sa.Column('document_hash', sa.String(length=255), nullable=True),
+        sa.Column('verifier1_token_sha256', sa.LargeBinary(length=32), nullable=True),
+        sa.Column('verifier2_token_sha256', sa.LargeBinary(length=32), nullable=True),
+        sa.Column('qr_expires_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('document_hash', sa.LargeBinary(length=32), nullable=True),
         sa.Column('document_type', sa.String(length=100), nullable=True),
         sa.Column('credential_number', sa.String(length=255), nullable=True),
         sa.Column('credential_data', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
@@ -49,82 +278,65 @@ def upgrade() -> None:
         sa.Column('revocation_reason', sa.Text(), nullable=True),
         sa.Column('revoked_by', postgresql.UUID(as_uuid=True), nullable=True),
         sa.Column('temporal_workflow_id', sa.String(length=255), nullable=True),
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.Column('verified_at', sa.DateTime(), nullable=True),
-        sa.Column('expires_at', sa.DateTime(), nullable=True),
-        sa.Column('revoked_at', sa.DateTime(), nullable=True),
-        sa.ForeignKeyConstraint(['revoked_by'], ['users.id'], ondelete='SET NULL'),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
-        sa.ForeignKeyConstraint(['verifier1_id'], ['users.id'], ondelete='SET NULL'),
-        sa.ForeignKeyConstraint(['verifier2_id'], ['users.id'], ondelete='SET NULL'),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('verified_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('revoked_at', sa.DateTime(timezone=True), nullable=True),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_verification_records_method'), 'verification_records', ['method'], unique=False)
-    op.create_index(op.f('ix_verification_records_status'), 'verification_records', ['status'], unique=False)
-    op.create_index(op.f('ix_verification_records_temporal_workflow_id'), 'verification_records', ['temporal_workflow_id'], unique=False)
-    op.create_index(op.f('ix_verification_records_user_id'), 'verification_records', ['user_id'], unique=False)
-    op.create_index(op.f('ix_verification_records_verifier1_id'), 'verification_records', ['verifier1_id'], unique=False)
-    op.create_index(op.f('ix_verification_records_verifier1_token'), 'verification_records', ['verifier1_token'], unique=True)
-    op.create_index(op.f('ix_verification_records_verifier2_id'), 'verification_records', ['verifier2_id'], unique=False)
-    op.create_index(op.f('ix_verification_records_verifier2_token'), 'verification_records', ['verifier2_token'], unique=True)
 
     # Create user_verification_levels table
     op.create_table(
         'user_verification_levels',
         sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('current_level', sa.Enum('UNVERIFIED', 'MINIMAL', 'STANDARD', 'ENHANCED', 'COMPLETE', name='verificationlevel'), nullable=False),
+        sa.Column('current_level', verification_level, nullable=False),
         sa.Column('completed_methods', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
         sa.Column('in_progress_methods', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
-        sa.Column('total_methods_completed', sa.Integer(), nullable=False),
+        sa.Column('total_methods_completed', sa.Integer(), sa.Computed('jsonb_array_length(completed_methods)', persisted=True), nullable=False),
         sa.Column('level_progress_percentage', sa.Float(), nullable=False),
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), nullable=True),
-        sa.Column('level_achieved_at', sa.DateTime(), nullable=True),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('level_achieved_at', sa.DateTime(timezone=True), nullable=True),
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('user_id')
     )
-    op.create_index(op.f('ix_user_verification_levels_current_level'), 'user_verification_levels', ['current_level'], unique=False)
-    op.create_index(op.f('ix_user_verification_levels_user_id'), 'user_verification_levels', ['user_id'], unique=True)
 
     # Create verifier_profiles table
     op.create_table(
         'verifier_profiles',
+        # Columns are ordered widest-alignment first (UUID/8-byte, then
+        # integers, then the booleans packed together, then variable-length)
+        # so the heap row carries no alignment padding.
         sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('is_authorized', sa.Boolean(), nullable=False),
-        sa.Column('auto_qualified', sa.Boolean(), nullable=False),
-        sa.Column('credentials', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('revoked_by', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('verifier_rating', sa.Float(), nullable=False),
+        sa.Column('revoked_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('training_completed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_activity_check', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('authorized_at', sa.DateTime(timezone=True), nullable=True),
         sa.Column('total_verifications_performed', sa.Integer(), nullable=False),
         sa.Column('successful_verifications', sa.Integer(), nullable=False),
-        sa.Column('rejected_verifications', sa.Integer(), nullable=False),
-        sa.Column('verifier_rating', sa.Float(), nullable=False),
+        sa.Column('rejected_verifications', sa.SmallInteger(), nullable=False),
+        sa.Column('is_authorized', sa.Boolean(), nullable=False),
+        sa.Column('auto_qualified', sa.Boolean(), nullable=False),
         sa.Column('revoked', sa.Boolean(), nullable=False),
-        sa.Column('revoked_at', sa.DateTime(), nullable=True),
-        sa.Column('revocation_reason', sa.Text(), nullable=True),
-        sa.Column('revoked_by', postgresql.UUID(as_uuid=True), nullable=True),
         sa.Column('training_completed', sa.Boolean(), nullable=False),
-        sa.Column('training_completed_at', sa.DateTime(), nullable=True),
-        sa.Column('last_activity_check', sa.DateTime(), nullable=True),
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), nullable=True),
-        sa.Column('authorized_at', sa.DateTime(), nullable=True),
-        sa.ForeignKeyConstraint(['revoked_by'], ['users.id'], ondelete='SET NULL'),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.Column('credentials', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('revocation_reason', sa.Text(), nullable=True),
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('user_id')
     )
-    op.create_index(op.f('ix_verifier_profiles_is_authorized'), 'verifier_profiles', ['is_authorized'], unique=False)
-    op.create_index(op.f('ix_verifier_profiles_revoked'), 'verifier_profiles', ['revoked'], unique=False)
-    op.create_index(op.f('ix_verifier_profiles_user_id'), 'verifier_profiles', ['user_id'], unique=True)
 
     # Create verifier_credential_validations table
     op.create_table(
         'verifier_credential_validations',
         sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('verifier_profile_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('credential_type', sa.Enum('NOTARY_PUBLIC', 'ATTORNEY', 'COMMUNITY_LEADER', 'VERIFIED_BUSINESS_OWNER', 'ORGANIZATION_DIRECTOR', 'GOVERNMENT_OFFICIAL', 'TRUSTED_VERIFIER', name='verifiercredential'), nullable=False),
+        sa.Column('credential_type', verifier_credential, nullable=False),
         sa.Column('is_valid', sa.Boolean(), nullable=False),
         sa.Column('validation_method', sa.String(length=100), nullable=True),
         sa.Column('credential_number', sa.String(length=255), nullable=True),
@@ -132,35 +344,15 @@ def upgrade() -> None:
         sa.Column('credential_data', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
         sa.Column('notes', sa.Text(), nullable=True),
         sa.Column('validation_source', sa.String(length=255), nullable=True),
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.Column('validated_at', sa.DateTime(), nullable=True),
-        sa.Column('expires_at', sa.DateTime(), nullable=True),
-        sa.Column('last_checked_at', sa.DateTime(), nullable=True),
-        sa.ForeignKeyConstraint(['verifier_profile_id'], ['verifier_profiles.id'], ondelete='CASCADE'),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('validated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_checked_at', sa.DateTime(timezone=True), nullable=True),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_verifier_credential_validations_is_valid'), 'verifier_credential_validations', ['is_valid'], unique=False)
-    op.create_index(op.f('ix_verifier_credential_validations_verifier_profile_id'), 'verifier_credential_validations', ['verifier_profile_id'], unique=False)
-
-    # Create verification_method_completions table
-    op.create_table(
-        'verification_method_completions',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('method', sa.Enum('EMAIL', 'PHONE', 'IN_PERSON_TWO_PARTY', 'GOVERNMENT_ID', 'BIOMETRIC', 'PERSONAL_REFERENCE', 'BUSINESS_LICENSE', 'TAX_ID_BUSINESS', 'BUSINESS_ADDRESS', 'BUSINESS_INSURANCE', 'OWNER_VERIFICATION', 'NONPROFIT_STATUS', 'TAX_ID_NONPROFIT', 'ORGANIZATION_BYLAWS', 'BOARD_VERIFICATION', 'MISSION_ALIGNMENT', 'NOTARY_VERIFICATION', 'PROFESSIONAL_LICENSE', 'COMMUNITY_ENDORSEMENT', name='verificationmethod'), nullable=False),
-        sa.Column('verification_record_id', postgresql.UUID(as_uuid=True), nullable=True),
-        sa.Column('completed_at', sa.DateTime(), nullable=False),
-        sa.Column('level_before', sa.Enum('UNVERIFIED', 'MINIMAL', 'STANDARD', 'ENHANCED', 'COMPLETE', name='verificationlevel'), nullable=True),
-        sa.Column('level_after', sa.Enum('UNVERIFIED', 'MINIMAL', 'STANDARD', 'ENHANCED', 'COMPLETE', name='verificationlevel'), nullable=True),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
-        sa.ForeignKeyConstraint(['verification_record_id'], ['verification_records.id'], ondelete='SET NULL'),
-        sa.PrimaryKeyConstraint('id'),
-        sa.UniqueConstraint('user_id', 'method', name='uq_user_method')
-    )
-    op.create_index(op.f('ix_verification_method_completions_method'), 'verification_method_completions', ['method'], unique=False)
-    op.create_index(op.f('ix_verification_method_completions_user_id'), 'verification_method_completions', ['user_id'], unique=False)
 
-    # Create verification_events table
+    # Create verification_events table (append-only audit log, partitioned by
+    # month on created_at so old months can be detached instead of deleted)
     op.create_table(
         'verification_events',
         sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
@@ -172,172 +364,71 @@ def upgrade() -> None:
         sa.Column('temporal_workflow_id', sa.String(length=255), nullable=True),
         sa.Column('ip_address', sa.String(length=45), nullable=True),
         sa.Column('user_agent', sa.Text(), nullable=True),
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.ForeignKeyConstraint(['actor_id'], ['users.id'], ondelete='SET NULL'),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
         sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
         sa.ForeignKeyConstraint(['verification_record_id'], ['verification_records.id'], ondelete='SET NULL'),
-        sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index(op.f('ix_verification_events_created_at'), 'verification_events', ['created_at'], unique=False)
-    op.create_index(op.f('ix_verification_events_event_type'), 'verification_events', ['event_type'], unique=False)
-    op.create_index(op.f('ix_verification_events_temporal_workflow_id'), 'verification_events', ['temporal_workflow_id'], unique=False)
-    op.create_index(op.f('ix_verification_events_user_id'), 'verification_events', ['user_id'], unique=False)
-    op.create_index(op.f('ix_verification_events_verification_record_id'), 'verification_events', ['verification_record_id'], unique=False)
-
-    # Create user_verification_levels table
-    op.create_table(
-        'user_verification_levels',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('current_level', sa.Enum('UNVERIFIED', 'MINIMAL', 'STANDARD', 'ENHANCED', 'COMPLETE', name='verificationlevel'), nullable=False),
-        sa.Column('completed_methods', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
-        sa.Column('in_progress_methods', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
-        sa.Column('total_methods_completed', sa.Integer(), nullable=False),
-        sa.Column('level_progress_percentage', sa.Float(), nullable=False),
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), nullable=True),
-        sa.Column('level_achieved_at', sa.DateTime(), nullable=True),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id'),
-        sa.UniqueConstraint('user_id')
-    )
-    op.create_index(op.f('ix_user_verification_levels_current_level'), 'user_verification_levels', ['current_level'], unique=False)
-    op.create_index(op.f('ix_user_verification_levels_user_id'), 'user_verification_levels', ['user_id'], unique=True)
-
-    # Create verifier_profiles table
-    op.create_table(
-        'verifier_profiles',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('is_authorized', sa.Boolean(), nullable=False),
-        sa.Column('auto_qualified', sa.Boolean(), nullable=False),
-        sa.Column('credentials', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
-        sa.Column('total_verifications_performed', sa.Integer(), nullable=False),
-        sa.Column('successful_verifications', sa.Integer(), nullable=False),
-        sa.Column('rejected_verifications', sa.Integer(), nullable=False),
-        sa.Column('verifier_rating', sa.Float(), nullable=False),
-        sa.Column('revoked', sa.Boolean(), nullable=False),
-        sa.Column('revoked_at', sa.DateTime(), nullable=True),
-        sa.Column('revocation_reason', sa.Text(), nullable=True),
-        sa.Column('revoked_by', postgresql.UUID(as_uuid=True), nullable=True),
-        sa.Column('training_completed', sa.Boolean(), nullable=False),
-        sa.Column('training_completed_at', sa.DateTime(), nullable=True),
-        sa.Column('last_activity_check', sa.DateTime(), nullable=True),
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.Column('updated_at', sa.DateTime(), nullable=True),
-        sa.Column('authorized_at', sa.DateTime(), nullable=True),
-        sa.ForeignKeyConstraint(['revoked_by'], ['users.id'], ondelete='SET NULL'),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id'),
-        sa.UniqueConstraint('user_id')
+        sa.PrimaryKeyConstraint('id', 'created_at'),
+        postgresql_partition_by='RANGE (created_at)',
     )
-    op.create_index(op.f('ix_verifier_profiles_is_authorized'), 'verifier_profiles', ['is_authorized'], unique=False)
-    op.create_index(op.f('ix_verifier_profiles_revoked'), 'verifier_profiles', ['revoked'], unique=False)
-    op.create_index(op.f('ix_verifier_profiles_user_id'), 'verifier_profiles', ['user_id'], unique=True)
+    op.execute("CREATE TABLE verification_events_default PARTITION OF verification_events DEFAULT")
+    op.execute(_CREATE_EVENT_PARTITION_FUNCTION)
+    for months_ahead in range(3):
+        op.execute(
+            "SELECT create_verification_events_partition("
+            f"(current_date + interval '{months_ahead} month')::date)"
+        )
+    op.execute(_DROP_EXPIRED_EVENT_PARTITIONS_FUNCTION)
+    op.execute(_SCHEDULE_EVENT_PARTITION_JOBS)
+    for index in _EVENT_INDEXES:
+        _create_index(*index)
 
-    # Create verifier_credential_validations table
-    op.create_table(
-        'verifier_credential_validations',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('verifier_profile_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('credential_type', sa.Enum('NOTARY_PUBLIC', 'ATTORNEY', 'COMMUNITY_LEADER', 'VERIFIED_BUSINESS_OWNER', 'ORGANIZATION_DIRECTOR', 'GOVERNMENT_OFFICIAL', 'TRUSTED_VERIFIER', name='verifiercredential'), nullable=False),
-        sa.Column('is_valid', sa.Boolean(), nullable=False),
-        sa.Column('validation_method', sa.String(length=100), nullable=True),
-        sa.Column('credential_number', sa.String(length=255), nullable=True),
-        sa.Column('issuing_authority', sa.String(length=255), nullable=True),
-        sa.Column('credential_data', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
-        sa.Column('notes', sa.Text(), nullable=True),
-        sa.Column('validation_source', sa.String(length=255), nullable=True),
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.Column('validated_at', sa.DateTime(), nullable=True),
-        sa.Column('expires_at', sa.DateTime(), nullable=True),
-        sa.Column('last_checked_at', sa.DateTime(), nullable=True),
-        sa.ForeignKeyConstraint(['verifier_profile_id'], ['verifier_profiles.id'], ondelete='CASCADE'),
-        sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index(op.f('ix_verifier_credential_validations_is_valid'), 'verifier_credential_validations', ['is_valid'], unique=False)
-    op.create_index(op.f('ix_verifier_credential_validations_verifier_profile_id'), 'verifier_credential_validations', ['verifier_profile_id'], unique=False)
+    # These tables are updated in place constantly (status changes, counters,
+    # timestamps); fillfactor 70 leaves room on each page so those updates can
+    # be HOT. verification_events is append-only and keeps the default of 100.
+    for table in _HOT_UPDATE_TABLES:
+        op.execute(f"ALTER TABLE {table} SET (fillfactor = 70)")
 
-    # Create verification_method_completions table
-    op.create_table(
-        'verification_method_completions',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('method', sa.Enum('EMAIL', 'PHONE', 'IN_PERSON_TWO_PARTY', 'GOVERNMENT_ID', 'BIOMETRIC', 'PERSONAL_REFERENCE', 'BUSINESS_LICENSE', 'TAX_ID_BUSINESS', 'BUSINESS_ADDRESS', 'BUSINESS_INSURANCE', 'OWNER_VERIFICATION', 'NONPROFIT_STATUS', 'TAX_ID_NONPROFIT', 'ORGANIZATION_BYLAWS', 'BOARD_VERIFICATION', 'MISSION_ALIGNMENT', 'NOTARY_VERIFICATION', 'PROFESSIONAL_LICENSE', 'COMMUNITY_ENDORSEMENT', name='verificationmethod'), nullable=False),
-        sa.Column('verification_record_id', postgresql.UUID(as_uuid=True), nullable=True),
-        sa.Column('completed_at', sa.DateTime(), nullable=False),
-        sa.Column('level_before', sa.Enum('UNVERIFIED', 'MINIMAL', 'STANDARD', 'ENHANCED', 'COMPLETE', name='verificationlevel'), nullable=True),
-        sa.Column('level_after', sa.Enum('UNVERIFIED', 'MINIMAL', 'STANDARD', 'ENHANCED', 'COMPLETE', name='verificationlevel'), nullable=True),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
-        sa.ForeignKeyConstraint(['verification_record_id'], ['verification_records.id'], ondelete='SET NULL'),
-        sa.PrimaryKeyConstraint('id'),
-        sa.UniqueConstraint('user_id', 'method', name='uq_user_method')
-    )
-    op.create_index(op.f('ix_verification_method_completions_method'), 'verification_method_completions', ['method'], unique=False)
-    op.create_index(op.f('ix_verification_method_completions_user_id'), 'verification_method_completions', ['user_id'], unique=False)
+    for table, column, target, ondelete in _FOREIGN_KEYS:
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT {_foreign_key_name(table, column)} "
+            f"FOREIGN KEY ({column}) REFERENCES {target} ON DELETE {ondelete} NOT VALID"
+        )
 
-    # Create verification_events table
-    op.create_table(
-        'verification_events',
-        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
-        sa.Column('verification_record_id', postgresql.UUID(as_uuid=True), nullable=True),
-        sa.Column('event_type', sa.String(length=100), nullable=False),
-        sa.Column('event_data', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
-        sa.Column('actor_id', postgresql.UUID(as_uuid=True), nullable=True),
-        sa.Column('temporal_workflow_id', sa.String(length=255), nullable=True),
-        sa.Column('ip_address', sa.String(length=45), nullable=True),
-        sa.Column('user_agent', sa.Text(), nullable=True),
-        sa.Column('created_at', sa.DateTime(), nullable=False),
-        sa.ForeignKeyConstraint(['actor_id'], ['users.id'], ondelete='SET NULL'),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
-        sa.ForeignKeyConstraint(['verification_record_id'], ['verification_records.id'], ondelete='SET NULL'),
-        sa.PrimaryKeyConstraint('id')
-    )
-    op.create_index(op.f('ix_verification_events_created_at'), 'verification_events', ['created_at'], unique=False)
-    op.create_index(op.f('ix_verification_events_event_type'), 'verification_events', ['event_type'], unique=False)
-    op.create_index(op.f('ix_verification_events_temporal_workflow_id'), 'verification_events', ['temporal_workflow_id'], unique=False)
-    op.create_index(op.f('ix_verification_events_user_id'), 'verification_events', ['user_id'], unique=False)
-    op.create_index(op.f('ix_verification_events_verification_record_id'), 'verification_events', ['verification_record_id'], unique=False)
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block, so the
+    # table DDL above is committed first and the indexes are built afterwards.
+    with op.get_context().autocommit_block():
+        for table, column, _, _ in _FOREIGN_KEYS:
+            op.execute(
+                f"ALTER TABLE {table} VALIDATE CONSTRAINT {_foreign_key_name(table, column)}"
+            )
+        for index in _INDEXES:
+            _create_index_concurrently(*index)
 
 
 def downgrade() -> None:
-    # Drop all tables in reverse order
-    op.drop_index(op.f('ix_verification_events_verification_record_id'), table_name='verification_events')
-    op.drop_index(op.f('ix_verification_events_user_id'), table_name='verification_events')
-    op.drop_index(op.f('ix_verification_events_temporal_workflow_id'), table_name='verification_events')
-    op.drop_index(op.f('ix_verification_events_event_type'), table_name='verification_events')
-    op.drop_index(op.f('ix_verification_events_created_at'), table_name='verification_events')
-    op.drop_table('verification_events')
-    
-    op.drop_index(op.f('ix_verification_method_completions_user_id'), table_name='verification_method_completions')
-    op.drop_index(op.f('ix_verification_method_completions_method'), table_name='verification_method_completions')
-    op.drop_table('verification_method_completions')
-    
-    op.drop_index(op.f('ix_verifier_credential_validations_verifier_profile_id'), table_name='verifier_credential_validations')
-    op.drop_index(op.f('ix_verifier_credential_validations_is_valid'), table_name='verifier_credential_validations')
-    op.drop_table('verifier_credential_validations')
-    
-    op.drop_index(op.f('ix_verifier_profiles_user_id'), table_name='verifier_profiles')
-    op.drop_index(op.f('ix_verifier_profiles_revoked'), table_name='verifier_profiles')
-    op.drop_index(op.f('ix_verifier_profiles_is_authorized'), table_name='verifier_profiles')
-    op.drop_table('verifier_profiles')
-    
-    op.drop_index(op.f('ix_user_verification_levels_user_id'), table_name='user_verification_levels')
-    op.drop_index(op.f('ix_user_verification_levels_current_level'), table_name='user_verification_levels')
-    op.drop_table('user_verification_levels')
-    
-    op.drop_index(op.f('ix_verification_records_verifier2_token'), table_name='verification_records')
-    op.drop_index(op.f('ix_verification_records_verifier2_id'), table_name='verification_records')
-    op.drop_index(op.f('ix_verification_records_verifier1_token'), table_name='verification_records')
-    op.drop_index(op.f('ix_verification_records_verifier1_id'), table_name='verification_records')
-    op.drop_index(op.f('ix_verification_records_user_id'), table_name='verification_records')
-    op.drop_index(op.f('ix_verification_records_temporal_workflow_id'), table_name='verification_records')
-    op.drop_index(op.f('ix_verification_records_status'), table_name='verification_records')
-    op.drop_index(op.f('ix_verification_records_method'), table_name='verification_records')
-    op.drop_table('verification_records')
-    
-    # Drop enums
-    op.execute('DROP TYPE IF EXISTS verificationmethod')
-    op.execute('DROP TYPE IF EXISTS verificationlevel')
-    op.execute('DROP TYPE IF EXISTS verifiercredential')
+    # A single script: indexes and partitions are dropped along with their
+    # tables, and the IF EXISTS guards keep it safe against a partially
+    # applied upgrade.
+    op.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+                PERFORM cron.unschedule(jobid) FROM cron.job
+                WHERE jobname IN (
+                    'verification-events-next-partition',
+                    'verification-events-retention'
+                );
+            END IF;
+        END
+        $$;
+        DROP TABLE IF EXISTS verification_events CASCADE;
+        DROP TABLE IF EXISTS verifier_credential_validations CASCADE;
+        DROP TABLE IF EXISTS verifier_profiles CASCADE;
+        DROP TABLE IF EXISTS user_verification_levels CASCADE;
+        DROP TABLE IF EXISTS verification_records CASCADE;
+        DROP FUNCTION IF EXISTS create_verification_events_partition(date);
+        DROP FUNCTION IF EXISTS drop_expired_verification_events_partitions(interval);
+        DROP TYPE IF EXISTS verificationmethod;
+        DROP TYPE IF EXISTS verificationlevel;
+        DROP TYPE IF EXISTS verifiercredential;
+    """)
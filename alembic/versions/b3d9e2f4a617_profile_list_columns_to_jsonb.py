@@ -0,0 +1,71 @@
+"""profile_list_columns_to_jsonb
+
+Revision ID: b3d9e2f4a617
+Revises: 8a7f3c9d4e21
+Create Date: 2025-10-03 10:00:00.000000
+
+Profile list columns (skills, services_offered, programs_offered, ...)
+were JSON arrays serialized into TEXT. Store them as native JSONB with a
+server-side '[]' default so inserts need not send the literal and the
+values are indexable.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d9e2f4a617'
+down_revision: Union[str, None] = '8a7f3c9d4e21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_LIST_COLUMNS = {
+    'individual_profiles': (
+        'skills',
+        'interests',
+        'preferred_assistance_types',
+        'languages_spoken',
+    ),
+    'business_profiles': (
+        'services_offered',
+        'resources_available',
+    ),
+    'organization_profiles': (
+        'programs_offered',
+        'service_areas',
+        'accreditation',
+    ),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, columns in _LIST_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                existing_type=sa.Text(),
+                type_=postgresql.JSONB(astext_type=sa.Text()),
+                postgresql_using=f"NULLIF({column}, '')::jsonb",
+                server_default=sa.text("'[]'::jsonb"),
+                existing_nullable=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, columns in _LIST_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                existing_type=postgresql.JSONB(astext_type=sa.Text()),
+                type_=sa.Text(),
+                postgresql_using=f"{column}::text",
+                server_default=None,
+                existing_nullable=True,
+            )
@@ -0,0 +1,45 @@
+"""users_email_lower_unique_index
+
+Revision ID: c5e1a7b2d940
+Revises: b3d9e2f4a617
+Create Date: 2025-10-04 10:00:00.000000
+
+The API now lower-cases emails before storing or querying them. Existing
+rows are normalized to match, and a unique index on lower(email) keeps
+case variants of one address from becoming separate accounts. The plain
+unique index on email stays: it serves the equality lookups and is the
+arbiter for register's ON CONFLICT (email).
+
+The UPDATE fails on the existing unique index if two rows differ only by
+case; such accounts must be merged by hand before upgrading.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e1a7b2d940'
+down_revision: Union[str, None] = 'b3d9e2f4a617'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "UPDATE users SET email = lower(btrim(email)) "
+        "WHERE email IS NOT NULL AND email <> lower(btrim(email))"
+    )
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_users_email_lower "
+            "ON users (lower(email))"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_users_email_lower")
@@ -3,11 +3,20 @@ import asyncio
 from nabr.db.session import engine, Base
 from nabr.models import *  # noqa: F403, F401
 
+# Tables created per transaction. Each batch commits before the next one
+# starts, so DDL locks are held briefly and a failed run can simply be
+# re-run: already-created tables are skipped (checkfirst).
+BATCH_SIZE = 20
+
 
 async def create_tables():
-    """Create all tables."""
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    """Create all tables in dependency order, committing batch by batch."""
+    tables = Base.metadata.sorted_tables
+    for start in range(0, len(tables), BATCH_SIZE):
+        batch = tables[start:start + BATCH_SIZE]
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all, tables=batch, checkfirst=True)
+        print(f"✅ Created {', '.join(table.name for table in batch)}")
     print("✅ All tables created successfully!")
 
 
@@ -77,12 +77,10 @@ class TwoPartyVerificationFlowProps(TypedDict):
     Shows QR codes for verifiers to scan and tracks confirmation status.
     """
     user_id: str
-    qr_code_1: Optional[str]  # Base64-encoded QR code image
-    qr_code_2: Optional[str]  # Base64-encoded QR code image
+    workflow_id: str  # Two-party child workflow ID (used in QR image URLs)
     verifier_1_confirmed: bool  # Whether verifier 1 confirmed
     verifier_2_confirmed: bool  # Whether verifier 2 confirmed
-    timeout_hours: int  # Hours until timeout
-    started_at: Optional[str]  # ISO datetime when started
+    expires_at: Optional[str]  # ISO datetime; countdown is computed client-side
     on_cancel: callable  # Callback to cancel verification
 
 
@@ -92,7 +90,7 @@ class VerificationHistoryProps(TypedDict):
     Timeline of all completed verification methods with dates and points.
     """
     user_id: str
-    completed_methods: dict  # Dict of method -> completion data
+    history_version: str  # From /verification/status; refetch pages when it changes
     show_expired: bool  # Whether to show expired methods
     sort_by: str  # Sort order (date_desc, date_asc, points_desc)
 
@@ -127,12 +125,14 @@ Features:
 - Shows points needed and link to suggested paths
 
 API Integration:
-- GET /api/verification/status → trust_score, verification_level
-- GET /api/verification/next-level → points_needed, next_level
+- GET /api/verification/status → trust_score, verification_level, next_level,
+  points_needed (one request; no separate /next-level call for this card)
 
 State Management:
-- Poll status every 30 seconds when verifications are active
-- Use Temporal workflow queries for real-time updates
+- Live updates are pushed over WebSocket /api/verification/ws/{workflow_id}
+  (see useVerificationWebSocket); no polling while the socket is connected
+- Fall back to polling GET /api/verification/status only after the socket
+  errors or closes
 - Update immediately when verification completes
 """
 
@@ -251,7 +251,8 @@ CRITICAL Messaging:
 - Label email/phone as "OPTIONAL" wherever shown
 
 API Integration:
-- GET /api/verification/next-level → suggested_paths
+- GET /api/verification/next-level → suggested_paths, refetched only when
+  suggested_paths_etag from GET /api/verification/status changes
 - POST /api/verification/start → Start selected method
 """
 
@@ -355,14 +356,26 @@ Features:
 
 API Integration:
 - POST /api/verification/start (method=IN_PERSON_TWO_PARTY) → Start workflow, get workflow_id
+- GET /api/verification/qr/{workflow_id}/{1|2} → QR code PNG, encoded once
+  per workflow on the server and sent with Cache-Control: private,
+  max-age=<seconds until expires_at>, immutable. Render with <img>; re-renders
+  and status updates never re-download or re-encode it
 - WebSocket /api/verification/ws/{workflow_id} → Real-time status updates
-- OR Poll: GET /api/verification/status every 5 seconds while active
+  (the only live transport; server pushes one message per workflow signal).
+  Messages carry {verifier_1_confirmed, verifier_2_confirmed} flags only,
+  never the images
+- Fallback only when the socket errors/closes: poll GET /api/verification/status
 - Child workflow signals verifier confirmations automatically
 
 State Management:
 - Use workflow queries to check confirmation status
-- Update UI immediately when confirmations received
-- Show toast notifications for each confirmation
+- Apply confirmation updates throttled (not debounced) to at most one cache
+  write per 250ms, so a burst of signals cannot cause a render storm
+- Toast each confirmation, collapsing confirmations that arrive within 250ms
+  into a single toast
+- Drive the "Expires in" countdown from one requestAnimationFrame loop that
+  writes a ref and calls setState only when the displayed minute changes
+  (no setInterval re-rendering the whole card every second)
 - Redirect to success screen when both confirmed
 """
 
@@ -413,9 +426,15 @@ Features:
 - Option to filter out expired methods
 - Summary statistics at bottom
 - Click to expand details for each method
+- Virtualized list (@tanstack/react-virtual): only the visible rows are in
+  the DOM, more pages load as the user scrolls
 
 API Integration:
-- GET /api/verification/status → completed_methods
+- GET /api/verification/history?cursor=…&limit=20 → items, next_cursor
+  (keyset pagination, newest first; fetched when the history tab opens)
+- GET /api/verification/status → completed_method_count, active_points,
+  expired_points, history_version (summary statistics come from the server,
+  not from summing rows client-side)
 """
 
 METHOD_SELECTOR_SPEC = """
@@ -557,6 +576,11 @@ Features:
 
 API Integration:
 - POST /api/verification/verifier/confirm → Signal workflow with confirmation
+  (single "Confirm Identity →" flow; synchronous)
+- POST /api/verification/verifier/confirm-batch → Bulk mode for verification
+  events: queue confirmations locally and flush every 500ms or 10 entries,
+  whichever comes first. Show optimistic check-marks immediately and
+  reconcile each row against the per-item results in the response
 - GET /api/user/me → Get verifier credentials and stats
 
 Security:
@@ -578,15 +602,24 @@ Recommended: React Query + Context for verification state
 
 1. Global Verification Context:
    - Current user's trust score and level
-   - Completed methods with metadata
+   - History totals and history_version (method details are paged on demand)
    - Active verification workflow IDs
    - Last updated timestamp
 
 2. React Query Queries:
-   - useVerificationStatus() → Poll every 30s when active
-   - useVerificationMethods() → Cache for 5 minutes
-   - useNextLevelInfo() → Update when score changes
-   - useMethodDetails(method) → Cache for 1 hour
+   - useVerificationStatus() → No polling while the WebSocket is connected;
+     poll (5s active / 30s idle) only as a fallback when it is not
+   - useVerificationHistory(historyVersion) → paged /history, refetched only
+     when history_version changes
+   - useVerificationMethods() → staleTime 1 hour (server sends
+     Cache-Control: private, max-age=3600)
+   - useNextLevelInfo() → select-projection of the ['verification', 'status']
+     query (next_level, points_needed), not a second request
+   - useSuggestedPaths() → keyed by suggested_paths_etag, so it refetches only
+     when the suggestions change
+   - useMethodDetails(method) → staleTime: 3_600_000, gcTime: 86_400_000;
+     one fetch per method shared by every card (server sends
+     Cache-Control: public, max-age=3600, immutable)
 
 3. React Query Mutations:
    - useStartVerification() → Start method
@@ -595,31 +628,74 @@ Recommended: React Query + Context for verification state
 
 4. Real-time Updates:
    - WebSocket connection when verification active
-   - Listen for workflow signals (confirmation, completion)
-   - Update React Query cache on events
+   - Server pushes a message for each workflow signal (verifier_confirmed,
+     completed); clients do not re-query on a timer
+   - Update React Query cache on events (setQueryData, no refetch)
    - Show toast notifications for status changes
 
 Example:
 ```typescript
 // hooks/useVerificationStatus.ts
-export function useVerificationStatus() {
+export function useVerificationStatus(liveConnected = false) {
   const query = useQuery({
     queryKey: ['verification', 'status'],
     queryFn: () => api.get('/verification/status'),
-    refetchInterval: (data) => 
-      data?.active_verifications.length > 0 ? 5000 : 30000,
+    // Pushed updates keep the cache fresh; poll only without a live socket
+    refetchInterval: (data) =>
+      liveConnected
+        ? false
+        : data?.active_verifications.length > 0 ? 5000 : 30000,
     staleTime: 10000,
   });
   
   return {
     trustScore: query.data?.trust_score,
     level: query.data?.verification_level,
-    completedMethods: query.data?.completed_methods,
+    activePoints: query.data?.active_points,
+    historyVersion: query.data?.history_version,
     isLoading: query.isLoading,
     refetch: query.refetch,
   };
 }
 
+// hooks/useVerificationHistory.ts
+export function useVerificationHistory(historyVersion?: string) {
+  return useInfiniteQuery({
+    queryKey: ['verification', 'history', historyVersion],
+    queryFn: ({ pageParam }) =>
+      api.get('/verification/history', { params: { cursor: pageParam, limit: 20 } }),
+    initialPageParam: undefined,
+    getNextPageParam: (lastPage) => lastPage.next_cursor ?? undefined,
+    enabled: !!historyVersion,
+  });
+}
+
+// hooks/useNextLevelInfo.ts
+// Same query key as useVerificationStatus: React Query dedupes the request
+// and both components re-render from one cache entry.
+export function useNextLevelInfo() {
+  return useQuery({
+    queryKey: ['verification', 'status'],
+    queryFn: () => api.get('/verification/status'),
+    select: (data) => ({
+      nextLevel: data.next_level,
+      pointsNeeded: data.points_needed,
+      suggestedPathsEtag: data.suggested_paths_etag,
+    }),
+  });
+}
+
+// hooks/useSuggestedPaths.ts
+export function useSuggestedPaths() {
+  const { data } = useNextLevelInfo();
+  return useQuery({
+    queryKey: ['verification', 'paths', data?.suggestedPathsEtag],
+    queryFn: () => api.get('/verification/next-level'),
+    enabled: !!data?.suggestedPathsEtag,
+    staleTime: Infinity,  // a new ETag means a new query key
+  });
+}
+
 // hooks/useStartVerification.ts
 export function useStartVerification() {
   const queryClient = useQueryClient();
@@ -641,29 +717,84 @@ export function useStartVerification() {
 // hooks/useVerificationWebSocket.ts
 export function useVerificationWebSocket(workflowId?: string) {
   const queryClient = useQueryClient();
+  const [connected, setConnected] = useState(false);
   
   useEffect(() => {
     if (!workflowId) return;
     
     const ws = new WebSocket(`/api/verification/ws/${workflowId}`);
     
-    ws.onmessage = (event) => {
-      const data = JSON.parse(event.data);
-      
-      // Update cache with new data
+    ws.onopen = () => setConnected(true);
+    // Any failure hands back to useVerificationStatus polling
+    ws.onerror = () => setConnected(false);
+    ws.onclose = () => setConnected(false);
+    
+    // Throttle, not debounce: a steady stream of messages must still flush
+    // every 250ms instead of being postponed until the stream goes quiet.
+    let pending = {};
+    const flush = throttle(() => {
+      const update = pending;
+      pending = {};
       queryClient.setQueryData(['verification', 'status'], (old) => ({
         ...old,
-        ...data,
+        ...update,
       }));
+    }, 250, { leading: true, trailing: true });
+    
+    // Leading edge only: one toast per burst of confirmations
+    const notifyConfirmed = throttle(
+      (verifierNumber) => toast.info(`Verifier ${verifierNumber} confirmed!`),
+      250,
+      { leading: true, trailing: false },
+    );
+    
+    ws.onmessage = (event) => {
+      const data = JSON.parse(event.data);
+      
+      // Merge into the pending update; flushed to the cache at most every 250ms
+      pending = { ...pending, ...data };
+      flush();
       
-      // Show notification
       if (data.event === 'verifier_confirmed') {
-        toast.info(`Verifier ${data.verifier_number} confirmed!`);
+        notifyConfirmed(data.verifier_number);
       }
     };
     
-    return () => ws.close();
+    return () => {
+      flush.cancel();
+      notifyConfirmed.cancel();
+      ws.close();
+    };
   }, [workflowId, queryClient]);
+  
+  return connected;
+}
+
+// Usage: the socket state decides whether status polling runs at all
+const connected = useVerificationWebSocket(workflowId);
+const status = useVerificationStatus(connected);
+
+// hooks/useMinutesRemaining.ts
+// Countdown for "Expires in ...": one rAF loop, re-renders once per minute
+export function useMinutesRemaining(expiresAt: Date) {
+  const [minutes, setMinutes] = useState(() => minutesUntil(expiresAt));
+  const shown = useRef(minutes);
+  
+  useEffect(() => {
+    let frame: number;
+    const tick = () => {
+      const next = minutesUntil(expiresAt);
+      if (next !== shown.current) {
+        shown.current = next;
+        setMinutes(next);
+      }
+      frame = requestAnimationFrame(tick);
+    };
+    frame = requestAnimationFrame(tick);
+    return () => cancelAnimationFrame(frame);
+  }, [expiresAt]);
+  
+  return minutes;
 }
 ```
 """
@@ -784,6 +915,9 @@ Testing Requirements for Verification UI Components
    - WebSocket connection handling
    - Real-time update latency
    - QR code generation speed
+   - Render count under a burst: M verifier_confirmed messages within 1s
+     must cause at most N renders of TwoPartyVerificationFlow (throttled cache
+     writes) and a single toast
 
 Example Test:
 ```typescript
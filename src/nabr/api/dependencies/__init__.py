@@ -1,19 +1,35 @@
 """API dependencies for dependency injection."""
 
 from nabr.api.dependencies.auth import (
+    get_current_claims,
     get_current_user,
+    get_current_user_id,
+    get_current_user_read,
+    get_current_user_snapshot,
     get_current_verified_user,
     require_user_type,
 )
 from nabr.api.dependencies.temporal import (
     get_temporal_client,
+    connect_temporal_client,
     close_temporal_client,
 )
+from nabr.api.dependencies.verification import (
+    get_trust_snapshot,
+    verification_workflow_handle,
+)
 
 __all__ = [
+    "get_current_claims",
     "get_current_user",
+    "get_current_user_id",
+    "get_current_user_read",
+    "get_current_user_snapshot",
     "get_current_verified_user",
     "require_user_type",
     "get_temporal_client",
+    "connect_temporal_client",
     "close_temporal_client",
+    "get_trust_snapshot",
+    "verification_workflow_handle",
 ]
@@ -4,7 +4,7 @@ These dependencies provide user authentication and authorization
 for protected endpoints using JWT tokens.
 """
 
-from typing import Annotated
+from typing import Annotated, Any
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
@@ -13,7 +13,8 @@ from jose import JWTError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from nabr.core.security import decode_token
+from nabr.api.dependencies.user_cache import CachedUser, cache_user, load_user_snapshot
+from nabr.core.security import ACCESS_TOKEN, decode_token_cached, token_kind, user_claims
 from nabr.db.session import get_db
 from nabr.models.user import User, UserType
 from nabr.schemas.user import UserRead
@@ -21,119 +22,272 @@ from nabr.schemas.user import UserRead
 # HTTP Bearer token security scheme
 security = HTTPBearer()
 
+# User columns serialized by UserRead
+USER_READ_COLUMNS = tuple(getattr(User, name) for name in UserRead.model_fields)
 
-async def get_current_user(
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _inactive_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="User account is inactive",
+    )
+
+
+async def get_current_claims(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> User:
-    """Get the current authenticated user from JWT token.
+) -> dict[str, Any]:
+    """Get the verified access-token payload without a DB query.
+    
+    Tokens issued at login carry ``ut`` (user type), ``act`` and ``ver``
+    claims (see :func:`nabr.core.security.user_claims`); tokens issued
+    before those claims existed only have ``sub``.
     
     Args:
         credentials: Bearer token from Authorization header
-        db: Database session
         
     Returns:
-        User: The authenticated user
+        dict: The verified token payload
         
     Raises:
-        HTTPException: 401 if token is invalid or user not found
+        HTTPException: 401 if token is invalid
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+    credentials_exception = _credentials_exception()
     
     try:
         # Decode JWT token
-        payload = decode_token(credentials.credentials)
+        payload = decode_token_cached(credentials.credentials)
         
-        # Verify token type
-        token_type = payload.get("type")
-        if token_type != "access":
+        # Verify token kind
+        if token_kind(payload) != ACCESS_TOKEN:
             raise credentials_exception
         
-        # Extract user ID
-        user_id_str: str | None = payload.get("sub")
-        if user_id_str is None:
-            raise credentials_exception
+        # Verify subject is a user ID
+        UUID(payload["sub"])
         
-        user_id = UUID(user_id_str)
+    except (JWTError, KeyError, TypeError, ValueError):
+        raise credentials_exception from None
+    
+    return payload
+
+
+async def get_current_user_id(
+    claims: Annotated[dict[str, Any], Depends(get_current_claims)],
+) -> UUID:
+    """Get the authenticated user's ID from the JWT token without a DB query.
+    
+    Args:
+        claims: Verified access-token payload
         
-    except (JWTError, ValueError):
-        raise credentials_exception
+    Returns:
+        UUID: The user ID from the token's ``sub`` claim
+    """
+    return UUID(claims["sub"])
+
+
+async def get_current_user(
+    user_id: Annotated[UUID, Depends(get_current_user_id)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> User:
+    """Get the current authenticated user's full row from the database.
+    
+    Use this only when the endpoint needs more than the fields on
+    :class:`CachedUser`; otherwise prefer :func:`get_current_user_snapshot`.
+    
+    Args:
+        user_id: Authenticated user ID from the JWT token
+        db: Database session
+        
+    Returns:
+        User: The authenticated user
+        
+    Raises:
+        HTTPException: 401 if user not found, 403 if inactive
+    """
+    # Primary-key fetch; served from the session's identity map when the
+    # row is already loaded in this request
+    user = await db.get(User, user_id)
+    
+    if user is None:
+        raise _credentials_exception()
+    
+    cache_user(_snapshot(user))
+    
+    if not user.is_active:
+        raise _inactive_exception()
+    
+    return user
+
+
+async def get_current_user_read(
+    user_id: Annotated[UUID, Depends(get_current_user_id)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> UserRead:
+    """Get the current user as the public ``UserRead`` schema.
     
-    # Fetch user from database
+    Selects only the columns ``UserRead`` serializes, as a plain row, so
+    no ORM entity (or any of its relationships) is loaded.
+    
+    Args:
+        user_id: Authenticated user ID from the JWT token
+        db: Database session
+        
+    Returns:
+        UserRead: The authenticated user's public fields
+        
+    Raises:
+        HTTPException: 401 if user not found, 403 if inactive
+    """
     result = await db.execute(
-        select(User).where(User.id == user_id)
+        select(*USER_READ_COLUMNS).where(User.id == user_id)
     )
-    user = result.scalar_one_or_none()
+    user = result.first()
     
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
     
     if not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="User account is inactive",
-        )
+        raise _inactive_exception()
+    
+    return UserRead.from_orm_fast(user)
+
+
+async def get_current_user_snapshot(
+    user_id: Annotated[UUID, Depends(get_current_user_id)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> CachedUser:
+    """Get the current user's id, type and account flags, cached briefly.
+    
+    Serves from the in-process user cache when possible and otherwise
+    loads just the needed columns.
+    
+    Args:
+        user_id: Authenticated user ID from the JWT token
+        db: Database session
+        
+    Returns:
+        CachedUser: Detached snapshot of the authenticated user
+        
+    Raises:
+        HTTPException: 401 if user not found, 403 if inactive
+    """
+    user = await load_user_snapshot(db, user_id)
+    if user is None:
+        raise _credentials_exception()
+    
+    if not user.is_active:
+        raise _inactive_exception()
     
     return user
 
 
+def _snapshot(user: User) -> CachedUser:
+    return CachedUser(
+        id=user.id,  # type: ignore
+        user_type=user.user_type,  # type: ignore
+        is_active=user.is_active,  # type: ignore
+        is_verified=user.is_verified,  # type: ignore
+    )
+
+
+async def _with_user_claims(
+    claims: dict[str, Any],
+    db: AsyncSession,
+) -> dict[str, Any]:
+    """Fill in user claims from the cached snapshot for older tokens."""
+    user = await load_user_snapshot(db, UUID(claims["sub"]))
+    if user is None:
+        raise _credentials_exception()
+    return {**claims, **user_claims(user)}
+
+
 async def get_current_verified_user(
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> User:
-    """Get the current user and verify they have completed verification.
+    claims: Annotated[dict[str, Any], Depends(get_current_claims)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> dict[str, Any]:
+    """Get the current user's claims and verify they have completed verification.
+    
+    A ``ver`` claim of true is trusted for the token's lifetime, so verified
+    users pass without a DB query. A false or missing claim is re-checked
+    against the cached user snapshot, so users verified after their token
+    was issued are let through within the cache TTL instead of having to
+    wait for a new token.
     
     Args:
-        current_user: The authenticated user
+        claims: Verified access-token payload
+        db: Database session (only used when the claim is not true)
         
     Returns:
-        User: The verified user
+        dict: The token claims, with ``ut``/``act``/``ver`` filled in
         
     Raises:
-        HTTPException: 403 if user is not verified
+        HTTPException: 403 if user is inactive or not verified
     """
-    if not current_user.is_verified:
+    if not claims.get("ver"):
+        claims = await _with_user_claims(claims, db)
+    
+    if not claims.get("act", True):
+        raise _inactive_exception()
+    
+    if not claims["ver"]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User verification required. Please complete the verification process.",
         )
     
-    return current_user
+    return claims
 
 
 def require_user_type(*allowed_types: UserType):
     """Create a dependency that requires specific user types.
     
     This is a dependency factory that creates a dependency function
-    requiring the user to have one of the specified user types.
+    requiring the user to have one of the specified user types. The check
+    reads the ``ut``/``act`` claims from the access token, so it does not
+    touch the database; tokens without those claims fall back to the
+    cached user snapshot.
     
     Args:
         *allowed_types: UserType values that are allowed
         
     Returns:
-        A dependency function that validates user type
+        A dependency function that validates user type and returns the
+        token claims
         
     Example:
         ```python
         @router.post("/admin-only")
         async def admin_endpoint(
-            user: Annotated[User, Depends(require_user_type(UserType.ADMIN))]
+            claims: Annotated[dict, Depends(require_user_type(UserType.ADMIN))]
         ):
             # Only admins can access this
             pass
         ```
     """
+    allowed_values = {t.value for t in allowed_types}
+    
     async def check_user_type(
-        current_user: Annotated[User, Depends(get_current_user)],
-    ) -> User:
-        if current_user.user_type not in allowed_types:
+        claims: Annotated[dict[str, Any], Depends(get_current_claims)],
+        db: Annotated[AsyncSession, Depends(get_db)],
+    ) -> dict[str, Any]:
+        if "ut" not in claims:
+            claims = await _with_user_claims(claims, db)
+        
+        if not claims.get("act", True):
+            raise _inactive_exception()
+        
+        if claims["ut"] not in allowed_values:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"This endpoint requires one of these user types: {', '.join(t.value for t in allowed_types)}",
             )
-        return current_user
+        return claims
     
     return check_user_type
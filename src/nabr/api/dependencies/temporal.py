@@ -4,25 +4,52 @@ Temporal client dependency for API routes.
 Provides a singleton Temporal client for workflow execution and management.
 """
 
-from typing import Optional, AsyncGenerator
+import asyncio
+from typing import Optional
 from temporalio.client import Client as TemporalClient
 
 from nabr.core.config import get_settings
 
 settings = get_settings()
 
-# Global Temporal client instance (singleton)
+# Global Temporal client instance (singleton), connected once per process
 _temporal_client: Optional[TemporalClient] = None
+_temporal_client_lock = asyncio.Lock()
 
 
-async def get_temporal_client() -> AsyncGenerator[TemporalClient, None]:
+async def connect_temporal_client() -> TemporalClient:
+    """
+    Connect the process-wide Temporal client if it isn't connected yet.
+    
+    Called from the application lifespan on startup. The lock makes the
+    lazy path safe too: concurrent first requests (or tests that skip the
+    lifespan) share one connection instead of each opening their own.
+    
+    Returns:
+        TemporalClient: Connected Temporal client
+    """
+    global _temporal_client
+    
+    if _temporal_client is None:
+        async with _temporal_client_lock:
+            if _temporal_client is None:
+                _temporal_client = await TemporalClient.connect(
+                    settings.temporal_host,
+                    namespace=settings.temporal_namespace,
+                )
+    
+    return _temporal_client
+
+
+async def get_temporal_client() -> TemporalClient:
     """
     Dependency to get Temporal client for API routes.
     
-    Creates a singleton client connection to Temporal server.
-    Reuses the same connection across requests for efficiency.
+    Returns the client connected at startup, so requests never pay for
+    gRPC channel setup. Falls back to connecting lazily if startup could
+    not reach Temporal.
     
-    Yields:
+    Returns:
         TemporalClient: Connected Temporal client
         
     Example:
@@ -32,26 +59,18 @@ async def get_temporal_client() -> AsyncGenerator[TemporalClient, None]:
         ):
             await client.start_workflow(...)
     """
-    global _temporal_client
-    
-    # Create client if it doesn't exist
-    if _temporal_client is None:
-        _temporal_client = await TemporalClient.connect(
-            settings.temporal_host,
-            namespace=settings.temporal_namespace,
-        )
-    
-    yield _temporal_client
+    if _temporal_client is not None:
+        return _temporal_client
+    return await connect_temporal_client()
 
 
 async def close_temporal_client():
     """
-    Close the Temporal client connection.
+    Release the Temporal client connection.
     
-    Should be called on application shutdown.
+    Should be called on application shutdown. The client has no explicit
+    close; dropping the last reference closes its channel.
     """
     global _temporal_client
     
-    if _temporal_client is not None:
-        await _temporal_client.close()
-        _temporal_client = None
+    _temporal_client = None
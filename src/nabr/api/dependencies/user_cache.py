@@ -0,0 +1,78 @@
+"""In-process cache of authenticated user snapshots.
+
+Most protected endpoints only need the caller's id, type and account
+flags, yet resolving them meant a ``SELECT ... FROM users`` per request.
+This module keeps a short-lived, detached snapshot of those fields keyed
+by user id, so repeat requests within the TTL skip the database.
+
+Snapshots are plain dataclasses rather than ``User`` instances, so they
+are never bound to (or expired with) a request's ``AsyncSession``.
+Writes made in this process should call :func:`invalidate_user`; writes
+made elsewhere (e.g. Temporal activities in the worker) are picked up
+once the TTL lapses.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from nabr.core.cache import BoundedTTLCache
+from nabr.models.user import User, UserType
+
+USER_CACHE_TTL_SECONDS = 5.0
+USER_CACHE_MAX_ENTRIES = 50_000
+
+
+@dataclass(frozen=True, slots=True)
+class CachedUser:
+    """Detached view of the ``User`` fields read by request dependencies."""
+
+    id: UUID
+    user_type: UserType
+    is_active: bool
+    is_verified: bool
+
+
+_user_cache: BoundedTTLCache[UUID, CachedUser] = BoundedTTLCache(
+    USER_CACHE_MAX_ENTRIES, ttl=USER_CACHE_TTL_SECONDS
+)
+
+
+def get_cached_user(user_id: UUID) -> Optional[CachedUser]:
+    """Return the cached snapshot for ``user_id`` if it is still fresh."""
+    return _user_cache.get(user_id)
+
+
+def cache_user(snapshot: CachedUser) -> None:
+    """Store a snapshot, evicting the oldest entry when the cache is full."""
+    _user_cache.set(snapshot.id, snapshot)
+
+
+def invalidate_user(user_id: UUID) -> None:
+    """Drop the cached snapshot for a user whose row was just written."""
+    _user_cache.pop(user_id)
+
+
+async def load_user_snapshot(db: AsyncSession, user_id: UUID) -> Optional[CachedUser]:
+    """Return the user's snapshot from the cache, or load and cache it.
+
+    Only the snapshot columns are selected on a miss. Returns None if
+    the user does not exist.
+    """
+    snapshot = get_cached_user(user_id)
+    if snapshot is not None:
+        return snapshot
+
+    result = await db.execute(
+        select(User.id, User.user_type, User.is_active, User.is_verified)
+        .where(User.id == user_id)
+    )
+    row = result.one_or_none()
+    if row is None:
+        return None
+    snapshot = CachedUser(*row)
+    cache_user(snapshot)
+    return snapshot
@@ -0,0 +1,78 @@
+"""
+Verification state dependency for API routes.
+
+Reads the user's precomputed verification snapshot from their parent
+verification workflow.
+"""
+
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from fastapi import Depends
+from temporalio.client import Client as TemporalClient, WorkflowHandle
+from temporalio.service import RPCError
+
+from nabr.api.dependencies.auth import get_current_user_snapshot
+from nabr.api.dependencies.temporal import get_temporal_client
+from nabr.api.dependencies.user_cache import CachedUser
+from nabr.core.cache import BoundedTTLCache
+
+VERIFICATION_HANDLE_CACHE_MAX_ENTRIES = 4096
+
+# user_id -> (client, handle) for parent verification workflows. Handles
+# carry no run state, so one per user is reused across requests; the
+# client is stored to rebuild handles if the process reconnects. Keyed by
+# UUID only, so one user never occupies two slots.
+_handle_cache: BoundedTTLCache[UUID, tuple[TemporalClient, WorkflowHandle]] = BoundedTTLCache(
+    VERIFICATION_HANDLE_CACHE_MAX_ENTRIES
+)
+
+
+def verification_workflow_handle(
+    temporal_client: TemporalClient,
+    user_id: UUID,
+) -> WorkflowHandle:
+    """Return the handle of a user's parent verification workflow.
+    
+    Args:
+        temporal_client: Temporal client for the handle
+        user_id: User whose workflow (``verification-{user_id}``) to address
+    
+    Returns:
+        WorkflowHandle for the parent verification workflow
+    """
+    entry = _handle_cache.get(user_id)
+    if entry is not None and entry[0] is temporal_client:
+        return entry[1]
+    
+    handle = temporal_client.get_workflow_handle(f"verification-{user_id}")
+    _handle_cache.set(user_id, (temporal_client, handle))
+    return handle
+
+
+async def get_trust_snapshot(
+    current_user: CachedUser = Depends(get_current_user_snapshot),
+    temporal_client: TemporalClient = Depends(get_temporal_client),
+) -> Optional[Dict[str, Any]]:
+    """
+    Dependency to get the current user's verification status snapshot.
+    
+    The workflow keeps trust score, level and next-level requirements up to
+    date as signals arrive, so this is a single query that reads state
+    rather than recomputing it.
+    
+    Args:
+        current_user: Authenticated user
+        temporal_client: Temporal client for querying workflows
+    
+    Returns:
+        Snapshot dict from the workflow's get_status query, or None if the
+        user has no verification workflow yet
+    """
+    handle = verification_workflow_handle(temporal_client, current_user.id)
+    
+    try:
+        return await handle.query("get_status")
+    except RPCError:
+        # Workflow doesn't exist yet - user hasn't started verification
+        return None
@@ -9,34 +9,44 @@ Provides endpoints for:
 - Current user information
 """
 
-import json
-from datetime import timedelta
+from datetime import datetime
 from typing import Annotated
+from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
-from sqlalchemy import select
+from jose import JWTError
+from sqlalchemy import insert, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from temporalio.client import Client as TemporalClient
 
 from nabr.core.config import get_settings
 from nabr.core.security import (
+    ACCESS_TOKEN_TTL_SECONDS,
+    DUMMY_PASSWORD_HASH,
+    REFRESH_TOKEN,
+    aget_password_hash,
+    averify_password,
     create_access_token,
     create_refresh_token,
-    get_password_hash,
-    verify_password,
-    decode_token,
+    decode_token_cached,
+    token_kind,
+    user_claims,
 )
 from nabr.db.session import get_db
 from nabr.models.user import User, UserType, IndividualProfile, BusinessProfile, OrganizationProfile
+from nabr.models.verification import UserVerificationLevel
 from nabr.api.dependencies.temporal import get_temporal_client
 
-from nabr.api.dependencies.auth import get_current_user
+from nabr.api.dependencies.auth import get_current_user_read
+from nabr.api.dependencies.user_cache import load_user_snapshot
 from nabr.schemas.auth import (
     LoginRequest,
     RefreshTokenRequest,
     RegisterRequest,
     Token,
     # UN/PIN authentication schemas
+    AuthTokens,
     PINLoginRequest,
     PINLoginResponse,
     PINLoginError,
@@ -46,13 +56,64 @@ from nabr.schemas.auth import (
 from nabr.schemas.user import UserRead, UserResponse
 from nabr.temporal.workflows.signup import SignupWorkflow
 from nabr.temporal.activities.auth_activities import (
+    CreateSessionInput,
     ValidatePINLoginInput,
+    create_session,
     validate_pin_login,
 )
 
 settings = get_settings()
 router = APIRouter()
 
+# Settings are fixed for the process lifetime
+PASSWORD_MIN_LENGTH = settings.password_min_length
+_PASSWORD_TOO_SHORT_DETAIL = f"Password must be at least {PASSWORD_MIN_LENGTH} characters"
+
+# Signup fields copied into each user type's profile_data for the
+# SignupWorkflow, keyed by the signup union's user_type discriminator
+_SIGNUP_PROFILE_FIELDS = {
+    "INDIVIDUAL": frozenset({
+        "date_of_birth", "city", "state", "bio",
+        "skills", "interests", "languages", "availability",
+    }),
+    "BUSINESS": frozenset({
+        "business_name", "business_type", "street_address", "city", "state",
+        "zip_code", "website", "tax_id", "services", "business_hours",
+    }),
+    "ORGANIZATION": frozenset({
+        "organization_name", "organization_type", "mission_statement",
+        "street_address", "city", "state", "zip_code", "website", "tax_id",
+        "programs", "staff_count", "is_501c3",
+    }),
+}
+
+# Profile row created by /auth/register for each user type: the profile
+# model and its initial column values derived from the request
+_REGISTER_PROFILES = {
+    UserType.INDIVIDUAL: (IndividualProfile, lambda data: {"max_distance_km": 25.0}),
+    # full_name doubles as the business/organization name initially
+    UserType.BUSINESS: (BusinessProfile, lambda data: {"business_name": data.full_name}),
+    UserType.ORGANIZATION: (OrganizationProfile, lambda data: {"organization_name": data.full_name}),
+}
+
+# Columns read by the login paths. Selecting these as plain rows skips ORM
+# identity-map and attribute instrumentation for read-only lookups; each
+# path reads only what it checks, returns, or embeds as token claims.
+PASSWORD_LOGIN_COLUMNS = (
+    User.id,
+    User.hashed_password,
+    User.is_active,
+    User.is_verified,
+    User.user_type,
+)
+PIN_LOGIN_COLUMNS = (
+    User.id,
+    User.is_active,
+    User.is_verified,
+    User.user_type,
+    User.username,
+    User.full_name,
+)
 
 @router.post("/auth/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(
@@ -74,72 +135,52 @@ async def register(
     Raises:
         HTTPException: 400 if email already exists
     """
-    # Check if email already exists
-    result = await db.execute(
-        select(User).where(User.email == user_data.email)
-    )
-    existing_user = result.scalar_one_or_none()
-    
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered",
-        )
-    
     # Validate password length
-    if len(user_data.password) < settings.password_min_length:
+    if len(user_data.password) < PASSWORD_MIN_LENGTH:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Password must be at least {settings.password_min_length} characters",
+            detail=_PASSWORD_TOO_SHORT_DETAIL,
         )
     
-    # Create new user
-    new_user = User(
-        email=user_data.email,
-        username=user_data.email.split('@')[0],  # Generate username from email
-        hashed_password=get_password_hash(user_data.password),
-        full_name=user_data.full_name,
-        phone_number=user_data.phone_number,
-        user_type=user_data.user_type,
-        is_active=True,
-        is_verified=False,
-    )
-    
-    db.add(new_user)
-    await db.flush()  # Flush to get the user ID
+    # Argon2 hashing is CPU-bound; run it on the hashing pool (and before
+    # the transaction opens, so no connection is held while it runs)
+    hashed_password = await aget_password_hash(user_data.password)
     
-    # Create user-type-specific profile
-    if user_data.user_type == UserType.INDIVIDUAL:
-        profile = IndividualProfile(
-            user_id=new_user.id,
-            skills=json.dumps([]),
-            interests=json.dumps([]),
-            max_distance_km=25.0,
-        )
-        db.add(profile)
-    elif user_data.user_type == UserType.BUSINESS:
-        profile = BusinessProfile(
-            user_id=new_user.id,
-            business_name=user_data.full_name,  # Use full_name as business name initially
-            services_offered=json.dumps([]),
-            resources_available=json.dumps([]),
+    # User insert and profile insert share one transaction. ON CONFLICT
+    # (email) DO NOTHING replaces the separate existence probe, so a taken
+    # email (including one registered concurrently) yields no row
+    async with db.begin():
+        result = await db.execute(
+            pg_insert(User)
+            .values(
+                email=user_data.email,
+                username=user_data.email.partition('@')[0],  # Generate username from email
+                hashed_password=hashed_password,
+                full_name=user_data.full_name,
+                phone_number=user_data.phone_number,
+                user_type=user_data.user_type,
+                is_active=True,
+                is_verified=False,
+            )
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User)
         )
-        db.add(profile)
-    elif user_data.user_type == UserType.ORGANIZATION:
-        profile = OrganizationProfile(
-            user_id=new_user.id,
-            organization_name=user_data.full_name,  # Use full_name as org name initially
-            programs_offered=json.dumps([]),
-            service_areas=json.dumps([]),
+        new_user = result.scalar_one_or_none()
+        if new_user is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already registered",
+            )
+        
+        # Create user-type-specific profile
+        profile_model, profile_values = _REGISTER_PROFILES[user_data.user_type]
+        await db.execute(
+            insert(profile_model).values(user_id=new_user.id, **profile_values(user_data))
         )
-        db.add(profile)
-    
-    await db.commit()
-    await db.refresh(new_user)
     
     return UserResponse(
         success=True,
-        user=UserRead.model_validate(new_user),
+        user=UserRead.from_orm_fast(new_user),
     )
 
 
@@ -162,12 +203,19 @@ async def login(
     """
     # Find user by email
     result = await db.execute(
-        select(User).where(User.email == credentials.email)
+        select(*PASSWORD_LOGIN_COLUMNS).where(User.email == credentials.email)
     )
-    user = result.scalar_one_or_none()
-    
-    # Verify user exists and password is correct
-    if not user or not verify_password(credentials.password, str(user.hashed_password)):  # type: ignore
+    user = result.first()
+    
+    # Verify user exists and password is correct; always run one Argon2
+    # verify (off the event loop) so unknown emails take as long as wrong
+    # passwords
+    hashed_password = user.hashed_password if user is not None else None
+    password_ok = await averify_password(
+        credentials.password,
+        str(hashed_password) if hashed_password else DUMMY_PASSWORD_HASH,
+    )
+    if user is None or not hashed_password or not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -181,17 +229,18 @@ async def login(
         )
     
     # Create tokens
+    user_id = str(user.id)
     access_token = create_access_token(
-        subject=str(user.id),
-        expires_delta=timedelta(minutes=settings.access_token_expire_minutes),
+        subject=user_id,
+        claims=user_claims(user),
     )
-    refresh_token = create_refresh_token(subject=str(user.id))
+    refresh_token = create_refresh_token(subject=user_id)
     
     return Token(
         access_token=access_token,
         refresh_token=refresh_token,
         token_type="bearer",
-        expires_in=settings.access_token_expire_minutes * 60,
+        expires_in=ACCESS_TOKEN_TTL_SECONDS,
     )
 
 
@@ -220,34 +269,33 @@ async def refresh_token(
     
     try:
         # Decode refresh token
-        payload = decode_token(token_data.refresh_token)
+        payload = decode_token_cached(token_data.refresh_token)
         
-        # Verify token type
-        token_type = payload.get("type")
-        if token_type != "refresh":
+        # Verify token kind
+        if token_kind(payload) != REFRESH_TOKEN:
             raise credentials_exception
         
         # Extract user ID
-        user_id: str | None = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-            
-    except Exception:
+        user_id: str = payload["sub"]
+        user_uuid = UUID(user_id)
+        
+    except (JWTError, KeyError, TypeError, ValueError):
+        # Malformed or forged tokens are expected input; drop the chained
+        # traceback rather than carrying it into the 401
+        raise credentials_exception from None
+    
+    # Verify user exists and is active (cached snapshot when fresh)
+    user = await load_user_snapshot(db, user_uuid)
+    if user is None:
         raise credentials_exception
     
-    # Verify user exists
-    result = await db.execute(
-        select(User).where(User.id == user_id)
-    )
-    user = result.scalar_one_or_none()
-    
-    if not user or not user.is_active:  # type: ignore
+    if not user.is_active:
         raise credentials_exception
     
     # Create new tokens
     access_token = create_access_token(
         subject=user_id,
-        expires_delta=timedelta(minutes=settings.access_token_expire_minutes),
+        claims=user_claims(user),
     )
     new_refresh_token = create_refresh_token(subject=user_id)
     
@@ -255,25 +303,25 @@ async def refresh_token(
         access_token=access_token,
         refresh_token=new_refresh_token,
         token_type="bearer",
-        expires_in=settings.access_token_expire_minutes * 60,
+        expires_in=ACCESS_TOKEN_TTL_SECONDS,
     )
 
 
 @router.get("/auth/me", response_model=UserResponse)
 async def get_current_user_info(
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[UserRead, Depends(get_current_user_read)],
 ) -> UserResponse:
     """Get current authenticated user information.
     
     Args:
-        current_user: The authenticated user from JWT token
+        current_user: The authenticated user's public fields from JWT token
         
     Returns:
         UserResponse: Current user information
     """
     return UserResponse(
         success=True,
-        user=UserRead.model_validate(current_user),
+        user=current_user,
     )
 
 
@@ -305,6 +353,9 @@ async def signup_with_pin(
     7. Record signup event for analytics
     8. Start verification workflow as child workflow
     
+    The response is returned as soon as step 5 completes; steps 6-8 keep
+    running in the workflow.
+    
     Args:
         signup_data: Discriminated union (IndividualSignupData | BusinessSignupData | OrganizationSignupData)
         temporal_client: Temporal client for workflow execution
@@ -325,75 +376,33 @@ async def signup_with_pin(
             detail="PIN and confirmation PIN do not match",
         )
     
-    # Check if username already exists
-    result = await db.execute(
-        select(User).where(User.username == signup_data.username)
-    )
-    existing_user = result.scalar_one_or_none()
+    # Check username and email (if provided) in one round-trip
+    conflict = User.username == signup_data.username
+    if signup_data.email:
+        conflict = or_(conflict, User.email == signup_data.email)
+    result = await db.execute(select(User.username, User.email).where(conflict))
+    existing = result.all()
     
-    if existing_user:
+    if any(row.username == signup_data.username for row in existing):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Username '{signup_data.username}' is already taken",
         )
     
-    # Check if email already exists (if provided)
-    if signup_data.email:
-        result = await db.execute(
-            select(User).where(User.email == signup_data.email)
+    if existing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Email '{signup_data.email}' is already registered",
         )
-        existing_email = result.scalar_one_or_none()
-        
-        if existing_email:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Email '{signup_data.email}' is already registered",
-            )
     
-    # Prepare profile data based on user type
-    profile_data = {}
-    if signup_data.user_type == "INDIVIDUAL":
-        profile_data = {
-            "date_of_birth": signup_data.date_of_birth.isoformat() if hasattr(signup_data, 'date_of_birth') else None,
-            "city": getattr(signup_data, "city", None),
-            "state": getattr(signup_data, "state", None),
-            "bio": getattr(signup_data, "bio", None),
-            "skills": getattr(signup_data, "skills", []),
-            "interests": getattr(signup_data, "interests", []),
-            "languages": getattr(signup_data, "languages", []),
-            "availability": getattr(signup_data, "availability", None),
-        }
-    elif signup_data.user_type == "BUSINESS":
-        profile_data = {
-            "business_name": getattr(signup_data, "business_name"),
-            "business_type": getattr(signup_data, "business_type"),
-            "street_address": getattr(signup_data, "street_address"),
-            "city": getattr(signup_data, "city"),
-            "state": getattr(signup_data, "state"),
-            "zip_code": getattr(signup_data, "zip_code"),
-            "website": getattr(signup_data, "website", None),
-            "tax_id": getattr(signup_data, "tax_id", None),
-            "services": getattr(signup_data, "services", []),
-            "business_hours": getattr(signup_data, "business_hours", None),
-        }
-    elif signup_data.user_type == "ORGANIZATION":
-        profile_data = {
-            "organization_name": getattr(signup_data, "organization_name"),
-            "organization_type": getattr(signup_data, "organization_type"),
-            "mission_statement": getattr(signup_data, "mission_statement"),
-            "street_address": getattr(signup_data, "street_address"),
-            "city": getattr(signup_data, "city"),
-            "state": getattr(signup_data, "state"),
-            "zip_code": getattr(signup_data, "zip_code"),
-            "website": getattr(signup_data, "website", None),
-            "tax_id": getattr(signup_data, "tax_id", None),
-            "programs": getattr(signup_data, "programs", []),
-            "staff_count": getattr(signup_data, "staff_count", None),
-            "is_501c3": getattr(signup_data, "is_501c3", False),
-        }
+    # Prepare profile data based on user type (JSON-safe for the workflow)
+    profile_data = signup_data.model_dump(
+        mode="json",
+        include=_SIGNUP_PROFILE_FIELDS[signup_data.user_type],
+    )
     
     # Generate unique workflow ID
-    workflow_id = f"signup_{signup_data.username}_{int(timedelta(seconds=1).total_seconds())}"
+    workflow_id = f"signup_{signup_data.username}_{uuid4().hex[:12]}"
     
     try:
         # Start SignupWorkflow
@@ -414,8 +423,9 @@ async def signup_with_pin(
             task_queue="auth-tasks",
         )
         
-        # Wait for workflow result (with timeout)
-        result = await workflow_handle.result()
+        # Wait only until the user and tokens exist; the welcome message,
+        # analytics and verification start finish in the workflow
+        result = await workflow_handle.execute_update(SignupWorkflow.get_initial_result)
         
         # Return signup response
         return SignupResponse(**result)
@@ -454,21 +464,20 @@ async def login_with_pin(
         HTTPException: 423 for locked accounts
         HTTPException: 429 for rate limit exceeded
     """
+    # Activity input is a plain TypedDict; PINLoginRequest already validated it
+    login_input = ValidatePINLoginInput(
+        username=login_data.username,
+        pin=login_data.pin,
+        kiosk_id=login_data.kiosk_id,
+        ip_address=None,  # TODO: Extract from request
+        user_agent=None,  # TODO: Extract from request headers
+    )
+    
     # Execute validate_pin_login activity
     try:
         # For now, we'll call the activity directly
         # TODO: Consider running as a workflow for better observability
-        from nabr.temporal.activities.auth_activities import validate_pin_login
-        
-        login_result = await validate_pin_login(
-            ValidatePINLoginInput(
-                username=login_data.username,
-                pin=login_data.pin,
-                kiosk_id=login_data.kiosk_id,
-                ip_address=None,  # TODO: Extract from request
-                user_agent=None,  # TODO: Extract from request headers
-            )
-        )
+        login_result = await validate_pin_login(login_input)
         
         if not login_result["success"]:
             error_code = login_result["error_code"]
@@ -495,40 +504,32 @@ async def login_with_pin(
                     detail=login_result["error_message"],
                 )
         
-        # Get user details
+        # Get user details and verification level in one round-trip
         result = await db.execute(
-            select(User).where(User.id == login_result["user_id"])
+            select(*PIN_LOGIN_COLUMNS, UserVerificationLevel.current_level)
+            .outerjoin(UserVerificationLevel, UserVerificationLevel.user_id == User.id)
+            .where(User.id == login_result["user_id"])
         )
-        user = result.scalar_one_or_none()
+        user = result.first()
         
-        if not user:
+        if user is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found",
             )
         
         # Create session tokens using create_session activity
-        from nabr.temporal.activities.auth_activities import create_session, CreateSessionInput
-        
+        user_id = str(user.id)
         session_result = await create_session(
             CreateSessionInput(
-                user_id=str(user.id),
+                user_id=user_id,
                 auth_method_id="",  # TODO: Get from login_result
                 kiosk_id=login_data.kiosk_id,
                 location=None,  # TODO: Extract from request
+                claims=user_claims(user),
             )
         )
         
-        # Get verification level
-        from nabr.models.verification import UserVerificationLevel
-        from nabr.schemas.auth import AuthTokens
-        from datetime import datetime
-        
-        result = await db.execute(
-            select(UserVerificationLevel).where(UserVerificationLevel.user_id == user.id)
-        )
-        verification_level = result.scalar_one_or_none()
-        
         # Parse session_expires_at if it's a string
         session_expires_at = session_result.get("session_expires_at")
         session_expires_at_dt = None
@@ -538,11 +539,11 @@ async def login_with_pin(
             session_expires_at_dt = session_expires_at
         
         return PINLoginResponse(
-            user_id=str(user.id),
+            user_id=user_id,
             username=str(user.username),  # type: ignore
             user_type=user.user_type.value,  # type: ignore
             full_name=str(user.full_name),  # type: ignore
-            verification_level=str(verification_level.current_level) if verification_level else "TIER_0_UNVERIFIED",  # type: ignore
+            verification_level=str(user.current_level) if user.current_level is not None else "TIER_0_UNVERIFIED",
             tokens=AuthTokens(
                 access_token=session_result["access_token"],
                 refresh_token=session_result["refresh_token"],
@@ -10,21 +10,30 @@ Endpoints for:
 - Revoking verifications
 """
 
-from typing import Dict, List, Optional, Any
+import asyncio
+import base64
+import hashlib
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 from temporalio.client import Client as TemporalClient
 from temporalio.service import RPCError
 
-from nabr.api.dependencies.auth import get_current_user
+from nabr.api.dependencies.auth import get_current_user_snapshot
+from nabr.api.dependencies.user_cache import CachedUser
 from nabr.api.dependencies.temporal import get_temporal_client
-from nabr.schemas.user import UserRead
+from nabr.api.dependencies.verification import get_trust_snapshot, verification_workflow_handle
 from nabr.schemas.verification import (
     VerificationMethodStart,
     VerificationStatus,
+    VerificationHistoryPage,
     NextLevelInfo,
     VerifierConfirmationRequest,
+    VerifierConfirmationBatch,
     VerificationRevocation,
 )
 from nabr.models.verification_types import (
@@ -37,6 +46,11 @@ from nabr.models.verification_types import (
 
 router = APIRouter(prefix="/verification", tags=["verification"])
 
+# Method metadata is static configuration (METHOD_SCORES and the helpers
+# below), so responses built from it are cached in-process and by clients.
+# It only changes with a deploy, which also clears the in-process caches.
+METHOD_INFO_CACHE_CONTROL = "max-age=3600"
+
 
 # ============================================================================
 # Verification Workflow Management
@@ -45,7 +59,7 @@ router = APIRouter(prefix="/verification", tags=["verification"])
 @router.post("/start", response_model=Dict[str, Any])
 async def start_verification_method(
     request: VerificationMethodStart,
-    current_user: UserRead = Depends(get_current_user),
+    current_user: CachedUser = Depends(get_current_user_snapshot),
     temporal_client: TemporalClient = Depends(get_temporal_client),
 ) -> Dict[str, Any]:
     """
@@ -84,11 +98,10 @@ async def start_verification_method(
         )
     
     # Get parent workflow handle
-    workflow_id = f"verification-{current_user.id}"
+    handle = verification_workflow_handle(temporal_client, current_user.id)
     
     try:
         # Signal parent workflow to start verification method
-        handle = temporal_client.get_workflow_handle(workflow_id)
         await handle.signal(
             "start_verification_method",
             method=request.method,
@@ -96,7 +109,7 @@ async def start_verification_method(
         )
         
         return {
-            "workflow_id": workflow_id,
+            "workflow_id": handle.id,
             "method": request.method,
             "status": "started",
             "message": f"Verification method {request.method} started successfully"
@@ -115,53 +128,85 @@ async def start_verification_method(
 
 @router.get("/status", response_model=VerificationStatus)
 async def get_verification_status(
-    current_user: UserRead = Depends(get_current_user),
-    temporal_client: TemporalClient = Depends(get_temporal_client),
-) -> VerificationStatus:
+    response: Response,
+    current_user: CachedUser = Depends(get_current_user_snapshot),
+    snapshot: Optional[Dict[str, Any]] = Depends(get_trust_snapshot),
+    if_none_match: Optional[str] = Header(default=None),
+) -> Union[VerificationStatus, Response]:
     """
-    Get current trust score, verification level, and completed methods.
+    Get current trust score, verification level, history totals, and the
+    next level with points needed.
     
-    Uses Temporal workflow queries for instant status without blocking.
+    This is the single endpoint clients poll, and its size does not grow
+    with history: completed methods are paged from /history (refetch when
+    history_version changes) and suggested paths from /next-level (refetch
+    when suggested_paths_etag changes).
+    Served from the workflow's precomputed snapshot in a single query. The
+    response carries an ETag; clients sending it back in If-None-Match get
+    an empty 304 while nothing has changed.
     
     Args:
+        response: Response used to set the ETag header
         current_user: Authenticated user
-        temporal_client: Temporal client for querying workflows
+        snapshot: Workflow status snapshot (None if no workflow yet)
+        if_none_match: ETag from the client's previous response
     
     Returns:
-        VerificationStatus with trust_score, level, completed_methods, active_verifications
+        VerificationStatus with trust_score, level, history totals, active_verifications
     """
-    workflow_id = f"verification-{current_user.id}"
-    
-    try:
-        # Query parent workflow for status
-        handle = temporal_client.get_workflow_handle(workflow_id)
-        
-        trust_score = await handle.query("get_trust_score")
-        level = await handle.query("get_verification_level")
-        completed = await handle.query("get_completed_methods")
-        
-        return VerificationStatus(
-            user_id=str(current_user.id),
-            trust_score=trust_score,
-            verification_level=level,
-            completed_methods=completed,
-            active_verifications=[],
-        )
-        
-    except RPCError as e:
+    if snapshot:
+        verification_status = VerificationStatus(user_id=str(current_user.id), **snapshot)
+    else:
         # Workflow doesn't exist yet - user hasn't started verification
-        return VerificationStatus(
+        verification_status = VerificationStatus(
             user_id=str(current_user.id),
             trust_score=0,
             verification_level="unverified",
-            completed_methods={},
             active_verifications=[],
+            next_level="minimal",
+            points_needed=100,
         )
+    
+    etag = _etag(verification_status.model_dump_json())
+    if if_none_match == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    
+    response.headers["ETag"] = etag
+    return verification_status
+
+
+@router.get("/history", response_model=VerificationHistoryPage)
+async def get_verification_history(
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    current_user: CachedUser = Depends(get_current_user_snapshot),
+    temporal_client: TemporalClient = Depends(get_temporal_client),
+) -> VerificationHistoryPage:
+    """
+    Get completed verification methods, newest first, one page at a time.
+    
+    Args:
+        cursor: next_cursor from the previous page (omit for the first page)
+        limit: Page size
+        current_user: Authenticated user
+        temporal_client: Temporal client for querying workflows
+    
+    Returns:
+        VerificationHistoryPage with items and next_cursor
+    """
+    try:
+        handle = verification_workflow_handle(temporal_client, current_user.id)
+        page = await handle.query("get_history", args=[cursor, limit])
+    except RPCError:
+        # Workflow doesn't exist yet - no history
+        return VerificationHistoryPage()
+    
+    return VerificationHistoryPage(**page)
 
 
 @router.get("/next-level", response_model=NextLevelInfo)
 async def get_next_level_requirements(
-    current_user: UserRead = Depends(get_current_user),
+    current_user: CachedUser = Depends(get_current_user_snapshot),
     temporal_client: TemporalClient = Depends(get_temporal_client),
 ) -> NextLevelInfo:
     """
@@ -177,11 +222,9 @@ async def get_next_level_requirements(
     Returns:
         NextLevelInfo with current_score, current_level, next_level, points_needed, suggested_paths
     """
-    workflow_id = f"verification-{current_user.id}"
-    
     try:
         # Query parent workflow for next level info
-        handle = temporal_client.get_workflow_handle(workflow_id)
+        handle = verification_workflow_handle(temporal_client, current_user.id)
         next_level_info = await handle.query("get_next_level_info")
         
         return NextLevelInfo(
@@ -203,6 +246,65 @@ async def get_next_level_requirements(
         )
 
 
+@router.get(
+    "/qr/{workflow_id}/{verifier_index}",
+    response_class=Response,
+    responses={200: {"content": {"image/png": {}}}},
+)
+async def get_verification_qr_code(
+    workflow_id: str,
+    verifier_index: int,
+    current_user: CachedUser = Depends(get_current_user_snapshot),
+    temporal_client: TemporalClient = Depends(get_temporal_client),
+) -> Response:
+    """
+    Get a two-party verification QR code as a PNG image.
+    
+    The image is encoded once when the workflow starts and never changes
+    before it expires, so it is served as immutable for its remaining
+    lifetime: clients download it once, and status updates only carry
+    confirmation flags.
+    
+    Args:
+        workflow_id: Two-party verification child workflow ID
+        verifier_index: 1 or 2
+        current_user: Authenticated user (must own the workflow)
+        temporal_client: Temporal client for querying workflows
+    
+    Returns:
+        PNG image response
+    """
+    not_found = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="QR code not found",
+    )
+    
+    # Child workflow IDs are verification-{user_id}-{method}-{timestamp}
+    if not workflow_id.startswith(f"verification-{current_user.id}-") or verifier_index not in (1, 2):
+        raise not_found
+    
+    try:
+        handle = temporal_client.get_workflow_handle(workflow_id)
+        qr_code = await handle.query("get_qr_code", verifier_index)
+    except RPCError:
+        raise not_found
+    
+    if not qr_code:
+        raise not_found
+    
+    max_age = 0
+    if qr_code.get("expires_at"):
+        remaining = datetime.fromisoformat(qr_code["expires_at"]) - datetime.now(timezone.utc)
+        max_age = max(0, int(remaining.total_seconds()))
+    
+    # Private: the QR code embeds the verifier's one-time token
+    return Response(
+        content=base64.b64decode(qr_code["image"]),
+        media_type="image/png",
+        headers={"Cache-Control": f"private, max-age={max_age}, immutable"},
+    )
+
+
 # ============================================================================
 # Verifier Operations
 # ============================================================================
@@ -210,7 +312,7 @@ async def get_next_level_requirements(
 @router.post("/verifier/confirm", response_model=Dict[str, Any])
 async def verifier_confirm_identity(
     confirmation: VerifierConfirmationRequest,
-    current_user: UserRead = Depends(get_current_user),
+    current_user: CachedUser = Depends(get_current_user_snapshot),
     temporal_client: TemporalClient = Depends(get_temporal_client),
 ) -> Dict[str, Any]:
     """
@@ -227,43 +329,84 @@ async def verifier_confirm_identity(
     Returns:
         Dictionary with confirmation status
     """
-    # Get the user's verification workflow
-    workflow_id = f"verification-{confirmation.user_id}"
-    
     try:
-        # Signal the workflow with verifier confirmation
-        handle = temporal_client.get_workflow_handle(workflow_id)
-        await handle.signal(
-            "verifier_confirms_identity",
-            confirmation.method,
-            {
-                "verifier_id": str(current_user.id),
-                "location_lat": confirmation.location_lat,
-                "location_lon": confirmation.location_lon,
-                "device_fingerprint": confirmation.device_fingerprint,
-                "notes": confirmation.notes,
-            }
-        )
-        
-        return {
-            "confirmed": True,
-            "verifier_id": str(current_user.id),
-            "user_id": confirmation.user_id,
-            "method": confirmation.method,
-            "message": "Identity confirmation recorded successfully",
-        }
-        
+        await _signal_verifier_confirmation(temporal_client, confirmation, str(current_user.id))
     except RPCError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Verification workflow not found for user {confirmation.user_id}. Error: {str(e)}"
         )
+    
+    return {
+        "confirmed": True,
+        "verifier_id": str(current_user.id),
+        "user_id": confirmation.user_id,
+        "method": confirmation.method,
+        "message": "Identity confirmation recorded successfully",
+    }
+
+
+@router.post("/verifier/confirm-batch", response_model=Dict[str, Any])
+async def verifier_confirm_identity_batch(
+    batch: VerifierConfirmationBatch,
+    current_user: CachedUser = Depends(get_current_user_snapshot),
+    temporal_client: TemporalClient = Depends(get_temporal_client),
+) -> Dict[str, Any]:
+    """
+    Confirm several users' identities at once (e.g. at a verification event).
+    
+    Signals are sent concurrently, so the Temporal round-trips overlap
+    instead of running one after another. Each confirmation succeeds or
+    fails on its own; the response reports a result per item, in order.
+    
+    Args:
+        batch: Confirmations to submit (up to 50)
+        current_user: Authenticated verifier
+        temporal_client: Temporal client for signaling workflows
+    
+    Returns:
+        Dictionary with per-confirmation results and counts
+    """
+    verifier_id = str(current_user.id)
+    outcomes = await asyncio.gather(
+        *(
+            _signal_verifier_confirmation(temporal_client, confirmation, verifier_id)
+            for confirmation in batch.confirmations
+        ),
+        return_exceptions=True,
+    )
+    
+    results = []
+    for confirmation, outcome in zip(batch.confirmations, outcomes):
+        if isinstance(outcome, RPCError):
+            results.append({
+                "user_id": confirmation.user_id,
+                "method": confirmation.method,
+                "confirmed": False,
+                "error": f"Verification workflow not found for user {confirmation.user_id}",
+            })
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            results.append({
+                "user_id": confirmation.user_id,
+                "method": confirmation.method,
+                "confirmed": True,
+            })
+    
+    confirmed = sum(1 for result in results if result["confirmed"])
+    return {
+        "verifier_id": verifier_id,
+        "results": results,
+        "confirmed": confirmed,
+        "failed": len(results) - confirmed,
+    }
 
 
 @router.post("/revoke", response_model=Dict[str, Any])
 async def revoke_verification_method(
     revocation: VerificationRevocation,
-    current_user: UserRead = Depends(get_current_user),
+    current_user: CachedUser = Depends(get_current_user_snapshot),
     temporal_client: TemporalClient = Depends(get_temporal_client),
 ) -> Dict[str, Any]:
     """
@@ -284,11 +427,9 @@ async def revoke_verification_method(
     Returns:
         Dictionary with revocation status
     """
-    workflow_id = f"verification-{current_user.id}"
-    
     try:
         # Signal workflow to revoke method
-        handle = temporal_client.get_workflow_handle(workflow_id)
+        handle = verification_workflow_handle(temporal_client, current_user.id)
         await handle.signal(
             "revoke_verification",
             revocation.method,
@@ -315,7 +456,8 @@ async def revoke_verification_method(
 
 @router.get("/methods", response_model=List[Dict[str, Any]])
 async def get_applicable_methods_for_user(
-    current_user: UserRead = Depends(get_current_user),
+    response: Response,
+    current_user: CachedUser = Depends(get_current_user_snapshot),
 ) -> List[Dict[str, Any]]:
     """
     Get all verification methods applicable to the current user's type.
@@ -323,40 +465,29 @@ async def get_applicable_methods_for_user(
     Returns method name, points, expiry period, and requirements for each.
     
     Args:
+        response: Response used to set caching headers
         current_user: Authenticated user
     
     Returns:
         List of applicable verification methods with details
     """
-    user_type = UserType(current_user.user_type)
-    applicable = get_applicable_methods(user_type)
-    
-    methods = []
-    for method in applicable:
-        score_info = METHOD_SCORES.get(method)
-        if score_info:
-            methods.append({
-                "method": method.value,
-                "points": score_info.points,
-                "max_multiplier": score_info.max_multiplier,
-                "decay_days": score_info.decay_days,
-                "requires_human_review": score_info.requires_human_review,
-                "description": _get_method_description(method),
-            })
-    
-    return methods
+    # Varies by user type, so only the user's own client may cache it
+    response.headers["Cache-Control"] = f"private, {METHOD_INFO_CACHE_CONTROL}"
+    return list(_applicable_methods_info(UserType(current_user.user_type)))
 
 
 @router.get("/method/{method}/details", response_model=Dict[str, Any])
 async def get_method_details_endpoint(
     method: str,
-    current_user: UserRead = Depends(get_current_user),
+    response: Response,
+    current_user: CachedUser = Depends(get_current_user_snapshot),
 ) -> Dict[str, Any]:
     """
     Get detailed information about a specific verification method.
     
     Args:
         method: Verification method name
+        response: Response used to set caching headers
         current_user: Authenticated user
     
     Returns:
@@ -370,52 +501,112 @@ async def get_method_details_endpoint(
             detail=f"Method {method} not found"
         )
     
-    score_info = get_method_details(method_enum)
-    if not score_info:
+    details = _method_details_info(method_enum)
+    if details is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No details available for method {method}"
         )
     
+    response.headers["Cache-Control"] = f"public, {METHOD_INFO_CACHE_CONTROL}, immutable"
+    return details
+
+
+# ============================================================================
+# Helper Functions
+# ============================================================================
+
+async def _signal_verifier_confirmation(
+    temporal_client: TemporalClient,
+    confirmation: VerifierConfirmationRequest,
+    verifier_id: str,
+) -> None:
+    """Signal a user's verification workflow with one verifier confirmation."""
+    handle = verification_workflow_handle(temporal_client, confirmation.user_id)
+    await handle.signal(
+        "verifier_confirms_identity",
+        args=[
+            verifier_id,
+            confirmation.method,
+            {
+                "verifier_id": verifier_id,
+                "location_lat": confirmation.location_lat,
+                "location_lon": confirmation.location_lon,
+                "device_fingerprint": confirmation.device_fingerprint,
+                "notes": confirmation.notes,
+            },
+        ],
+    )
+
+
+def _etag(body: str) -> str:
+    """Strong ETag for a serialized response body."""
+    return f'"{hashlib.sha256(body.encode()).hexdigest()[:32]}"'
+
+
+@lru_cache(maxsize=8)
+def _applicable_methods_info(user_type: UserType) -> tuple:
+    """Build (once per user type) the method list served by /methods."""
+    methods = []
+    for method in get_applicable_methods(user_type):
+        score_info = METHOD_SCORES.get(method)
+        if score_info:
+            methods.append({
+                "method": method.value,
+                "points": score_info.points,
+                "max_multiplier": score_info.max_multiplier,
+                "decay_days": score_info.decay_days,
+                "requires_human_review": score_info.requires_human_review,
+                "description": _get_method_description(method),
+            })
+    return tuple(methods)
+
+
+@lru_cache(maxsize=64)
+def _method_details_info(method: VerificationMethod) -> Optional[Dict[str, Any]]:
+    """Build (once per method) the payload served by /method/{method}/details."""
+    score_info = get_method_details(method)
+    if not score_info:
+        return None
     return {
-        "method": method,
+        "method": method.value,
         "points": score_info.points,
         "max_multiplier": score_info.max_multiplier,
         "decay_days": score_info.decay_days,
         "requires_human_review": score_info.requires_human_review,
-        "description": _get_method_description(method_enum),
-        "requirements": _get_method_requirements(method_enum),
+        "description": _get_method_description(method),
+        "requirements": _get_method_requirements(method),
     }
 
 
-# ============================================================================
-# Helper Functions
-# ============================================================================
+# Read-only lookup tables, built once at import
+_METHOD_DESCRIPTIONS: Mapping[VerificationMethod, str] = MappingProxyType({
+    VerificationMethod.EMAIL: "Verify your email address with a 6-digit code",
+    VerificationMethod.PHONE: "Verify your phone number with an SMS code",
+    VerificationMethod.IN_PERSON_TWO_PARTY: "Two trusted community members confirm your identity in person (CORE INCLUSIVE METHOD)",
+    VerificationMethod.GOVERNMENT_ID: "Upload government-issued ID for human review",
+    VerificationMethod.BIOMETRIC: "Biometric verification (facial recognition, fingerprint, etc.)",
+    VerificationMethod.PERSONAL_REFERENCE: "Personal reference from verified community member",
+    VerificationMethod.COMMUNITY_ATTESTATION: "Community attestation of identity",
+    VerificationMethod.PLATFORM_HISTORY: "Accumulated platform activity history",
+    VerificationMethod.TRANSACTION_HISTORY: "Verified transaction history",
+})
+
+_METHOD_REQUIREMENTS: Mapping[VerificationMethod, Tuple[str, ...]] = MappingProxyType({
+    VerificationMethod.EMAIL: ("Valid email address",),
+    VerificationMethod.PHONE: ("Valid phone number (E.164 format)",),
+    VerificationMethod.IN_PERSON_TWO_PARTY: ("Two authorized verifiers", "In-person meeting"),
+    VerificationMethod.GOVERNMENT_ID: ("Government-issued ID document", "Clear photo/scan"),
+    VerificationMethod.BIOMETRIC: ("Device with camera/biometric sensor",),
+    VerificationMethod.PERSONAL_REFERENCE: ("Verified community member willing to vouch",),
+})
+
 
 def _get_method_description(method: VerificationMethod) -> str:
     """Get human-readable description of verification method."""
-    descriptions = {
-        VerificationMethod.EMAIL: "Verify your email address with a 6-digit code",
-        VerificationMethod.PHONE: "Verify your phone number with an SMS code",
-        VerificationMethod.IN_PERSON_TWO_PARTY: "Two trusted community members confirm your identity in person (CORE INCLUSIVE METHOD)",
-        VerificationMethod.GOVERNMENT_ID: "Upload government-issued ID for human review",
-        VerificationMethod.BIOMETRIC: "Biometric verification (facial recognition, fingerprint, etc.)",
-        VerificationMethod.PERSONAL_REFERENCE: "Personal reference from verified community member",
-        VerificationMethod.COMMUNITY_ATTESTATION: "Community attestation of identity",
-        VerificationMethod.PLATFORM_HISTORY: "Accumulated platform activity history",
-        VerificationMethod.TRANSACTION_HISTORY: "Verified transaction history",
-    }
-    return descriptions.get(method, f"Verification via {method.value}")
+    return _METHOD_DESCRIPTIONS.get(method, f"Verification via {method.value}")
 
 
 def _get_method_requirements(method: VerificationMethod) -> List[str]:
     """Get requirements list for verification method."""
-    requirements = {
-        VerificationMethod.EMAIL: ["Valid email address"],
-        VerificationMethod.PHONE: ["Valid phone number (E.164 format)"],
-        VerificationMethod.IN_PERSON_TWO_PARTY: ["Two authorized verifiers", "In-person meeting"],
-        VerificationMethod.GOVERNMENT_ID: ["Government-issued ID document", "Clear photo/scan"],
-        VerificationMethod.BIOMETRIC: ["Device with camera/biometric sensor"],
-        VerificationMethod.PERSONAL_REFERENCE: ["Verified community member willing to vouch"],
-    }
-    return requirements.get(method, ["Contact support for requirements"])
+    return list(_METHOD_REQUIREMENTS.get(method, ("Contact support for requirements",)))
@@ -0,0 +1,92 @@
+"""Bounded in-process cache with per-entry expiry.
+
+Several hot paths keep small process-local caches: verified JWT payloads,
+authenticated user snapshots, verification workflow handles and recently
+verified PINs. They all need the same thing: a dict capped at a fixed
+size that evicts its oldest entry in O(1) (dict order is insertion
+order) and drops entries once they expire.
+
+Caches are only touched from the event loop (or under the GIL with no
+awaits between read and write), so no locking is done.
+"""
+
+import time
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_NEVER = float("inf")
+
+
+class BoundedTTLCache(Generic[K, V]):
+    """Dict-backed cache bounded to ``max_entries`` with per-entry expiry.
+
+    Args:
+        max_entries: Entries held before the oldest is evicted
+        ttl: Default lifetime in seconds for :meth:`set`; None means
+            entries only leave through eviction or :meth:`pop`
+        clock: Time source that expiry times are measured against
+            (``time.time`` when entries expire at an absolute wall-clock
+            time such as a JWT ``exp``)
+        lru: Move entries to the back on every hit, so eviction drops the
+            least recently used entry instead of the oldest inserted one
+    """
+
+    __slots__ = ("max_entries", "ttl", "_clock", "_lru", "_entries")
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl: Optional[float] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        lru: bool = False,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._lru = lru
+        self._entries: dict[K, tuple[V, float]] = {}
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the value for ``key``, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= self._clock():
+            del self._entries[key]
+            return None
+        if self._lru:
+            del self._entries[key]
+            self._entries[key] = entry
+        return entry[0]
+
+    def set(self, key: K, value: V, expires_at: Optional[float] = None) -> None:
+        """Store ``value`` until ``expires_at`` (default: now + ``ttl``).
+
+        Evicts the oldest (or least recently used) entry when full.
+        """
+        if expires_at is None:
+            expires_at = _NEVER if self.ttl is None else self._clock() + self.ttl
+        entries = self._entries
+        if key in entries:
+            del entries[key]
+        elif len(entries) >= self.max_entries:
+            del entries[next(iter(entries))]
+        entries[key] = (value, expires_at)
+
+    def pop(self, key: K) -> Optional[V]:
+        """Remove ``key`` and return its value (None if absent)."""
+        entry = self._entries.pop(key, None)
+        return None if entry is None else entry[0]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key) is not None  # type: ignore[arg-type]
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,20 +1,24 @@
 """Application configuration using Pydantic Settings."""
 
-from functools import lru_cache
+from functools import cache
 from typing import Literal
 
-from pydantic import Field, PostgresDsn, field_validator
+from pydantic import Field, PostgresDsn, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
 
+    # Frozen: modules derive constants (JWT key, token TTLs, hasher cost)
+    # from the cached instance at import, so a later assignment would
+    # silently disagree with them.
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,
     )
 
     # Application
@@ -33,6 +37,14 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 7
     password_min_length: int = 8
+    # Argon2 cost. Hashing time grows linearly with both parameters, and
+    # login latency is dominated by it, so dev/staging may lower them;
+    # production must stay at or above the OWASP baseline (t=3, 64 MiB).
+    # Existing hashes keep the parameters they were created with.
+    argon2_time_cost: int = Field(default=3, ge=1, le=10, validation_alias="ARGON2_TIME_COST")
+    argon2_memory_cost: int = Field(  # KiB
+        default=65536, ge=8192, le=1048576, validation_alias="ARGON2_MEMORY_COST"
+    )
     
     # Database
     postgres_server: str = Field(default="localhost", validation_alias="POSTGRES_SERVER")
@@ -60,6 +72,17 @@ class Settings(BaseSettings):
             )
         )
 
+    @model_validator(mode="after")
+    def check_production_password_cost(self) -> "Settings":
+        """Refuse to start production with a weakened Argon2 cost."""
+        if self.environment == "production" and (
+            self.argon2_time_cost < 3 or self.argon2_memory_cost < 65536
+        ):
+            raise ValueError(
+                "Production requires ARGON2_TIME_COST >= 3 and ARGON2_MEMORY_COST >= 65536"
+            )
+        return self
+
     # Temporal
     temporal_host: str = Field(default="localhost:7233", validation_alias="TEMPORAL_HOST")
     temporal_namespace: str = Field(default="default", validation_alias="TEMPORAL_NAMESPACE")
@@ -86,8 +109,11 @@ class Settings(BaseSettings):
     rate_limit_requests: int = 100
     rate_limit_period: int = 60  # seconds
 
+    # Health checks
+    readiness_cache_seconds: float = 5.0  # reuse a passing readiness probe
+
 
-@lru_cache
+@cache
 def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
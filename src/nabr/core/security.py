@@ -1,27 +1,108 @@
 """Security utilities for authentication and authorization."""
 
-from datetime import datetime, timedelta, timezone
-from typing import Any
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import string
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Callable, TypeVar
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from jose import JWTError, jwk, jwt
+from jose.exceptions import ExpiredSignatureError, JWTClaimsError
 
+from nabr.core.cache import BoundedTTLCache
 from nabr.core.config import get_settings
 
 settings = get_settings()
 
-# Password hashing context
+# Password hashing
 # Using argon2 as recommended by FastAPI/OWASP for modern applications
-# Argon2 won the Password Hashing Competition in 2015
-pwd_context = CryptContext(
-    schemes=["argon2"],
-    deprecated="auto",
+# Argon2 won the Password Hashing Competition in 2015. argon2-cffi is
+# called directly: the hash is PHC-encoded ($argon2id$...), so hashes made
+# earlier through passlib (same default parameters) verify unchanged.
+password_hasher = PasswordHasher(
+    time_cost=settings.argon2_time_cost,
+    memory_cost=settings.argon2_memory_cost,
 )
 
 
+# Verified against when a login names no user (or a user without a
+# password), so the unknown-account path costs the same Argon2 verify as a
+# wrong password and login timing doesn't reveal which accounts exist.
+DUMMY_PASSWORD_HASH = password_hasher.hash(secrets.token_urlsafe(16))
+
+
+# JWT signing key, parsed once. Passing a prepared key to jose skips its
+# per-call key handling (a JSON-parse attempt on the secret, format checks
+# and key construction) on every encode and decode.
+_JWT_KEY = jwk.construct(settings.secret_key, settings.algorithm)
+_JWT_ALGORITHMS = [settings.algorithm]
+
+# HS256 (the default) is signed and verified here with a one-shot OpenSSL
+# HMAC (hmac.digest) instead of through jose, whose per-call layers
+# (algorithm lookup, key object dispatch, header building and claim
+# options) cost more than the MAC itself. Tokens are byte-identical to
+# jose's and the same claims are checked, so either side can read the
+# other's tokens. Other algorithms still go through jose.
+_HS256 = settings.algorithm == "HS256"
+_HS256_SECRET = settings.secret_key.encode()
+_JWT_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+# Tokens we issue carry exactly this header segment, so decode can accept
+# it by string comparison and only parse headers that differ
+_JWT_HEADER_SEGMENT = _JWT_HEADER_B64.decode("ascii")
+# Reused codec instances: json.dumps builds a fresh JSONEncoder whenever
+# options are passed, and json.loads sniffs the encoding of bytes input
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+_JSON_DECODER = json.JSONDecoder()
+
+# Token lifetimes, fixed for the life of the process
+ACCESS_TOKEN_TTL = timedelta(minutes=settings.access_token_expire_minutes)
+ACCESS_TOKEN_TTL_SECONDS = int(ACCESS_TOKEN_TTL.total_seconds())
+REFRESH_TOKEN_TTL = timedelta(days=settings.refresh_token_expire_days)
+REFRESH_TOKEN_TTL_SECONDS = int(REFRESH_TOKEN_TTL.total_seconds())
+
+# Token kinds, carried in the single-character ``t`` claim to keep every
+# bearer token (and its HMAC input) as small as possible
+ACCESS_TOKEN = 0
+REFRESH_TOKEN = 1
+_LEGACY_TOKEN_TYPES = {"access": ACCESS_TOKEN, "refresh": REFRESH_TOKEN}
+
+
+def token_kind(payload: dict[str, Any]) -> int | None:
+    """Return the token kind (``ACCESS_TOKEN``/``REFRESH_TOKEN``) of a payload.
+    
+    Tokens issued before the ``t`` claim carried ``"type": "access"`` or
+    ``"refresh"``; those are still recognized until they expire.
+    
+    Args:
+        payload: Decoded token payload
+        
+    Returns:
+        The token kind, or None if the payload carries neither claim
+    """
+    kind = payload.get("t")
+    if kind is None:
+        return _LEGACY_TOKEN_TYPES.get(payload.get("type"))
+    return kind
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plain password against a hashed password."""
-    return pwd_context.verify(plain_password, hashed_password)
+    """Verify a plain password against a hashed password.
+    
+    Returns False, rather than raising, for malformed stored hashes.
+    """
+    try:
+        return password_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
 
 
 def get_password_hash(password: str) -> str:
@@ -33,13 +114,129 @@ def get_password_hash(password: str) -> str:
     Returns:
         Hashed password string
     """
-    return pwd_context.hash(password)
+    return password_hasher.hash(password)
+
+
+# Argon2 calls are CPU-bound and each holds 64 MiB while it runs. Async
+# callers run them on this pool, sized to the CPU count, so a login burst
+# queues here instead of oversubscribing cores (and memory) through the
+# loop's default executor, which also serves DNS lookups.
+_hashing_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="argon2",
+)
+
+_T = TypeVar("_T")
+
+
+async def run_hashing(func: Callable[..., _T], *args: Any) -> _T:
+    """Run a blocking Argon2 call on the hashing pool without blocking the loop."""
+    return await asyncio.get_running_loop().run_in_executor(_hashing_executor, func, *args)
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """Async :func:`verify_password`, run on the hashing pool."""
+    return await run_hashing(verify_password, plain_password, hashed_password)
+
+
+async def aget_password_hash(password: str) -> str:
+    """Async :func:`get_password_hash`, run on the hashing pool."""
+    return await run_hashing(get_password_hash, password)
+
+
+def hash_token(token: str) -> bytes:
+    """Hash an opaque bearer token for storage and lookup.
+    
+    Bearer secrets (e.g. two-party verification QR tokens) are persisted
+    only as their SHA-256 digest, so a database dump does not leak usable
+    tokens. Lookups hash the presented token and compare digests.
+    
+    Args:
+        token: Raw token string
+        
+    Returns:
+        32-byte SHA-256 digest
+    """
+    return hashlib.sha256(token.encode()).digest()
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64url_decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _encode_token(claims: dict[str, Any]) -> str:
+    """Sign ``claims`` with the configured algorithm."""
+    if not _HS256:
+        return jwt.encode(claims, _JWT_KEY, algorithm=settings.algorithm)
+    payload = _JSON_ENCODER.encode(claims).encode()
+    signing_input = _JWT_HEADER_B64 + b"." + _b64url_encode(payload)
+    signature = hmac.digest(_HS256_SECRET, signing_input, "sha256")
+    return (signing_input + b"." + _b64url_encode(signature)).decode("ascii")
+
+
+def _hs256_decode(token: str) -> dict[str, Any]:
+    """Verify an HS256 token and its registered claims, like ``jwt.decode``.
+    
+    Raises:
+        JWTError: If the token is malformed, forged or its claims are invalid
+    """
+    segments = token.split(".")
+    if len(segments) != 3:
+        raise JWTError("Not enough segments")
+    header_segment, payload_segment, signature_segment = segments
+    try:
+        if header_segment != _JWT_HEADER_SEGMENT:
+            header = _JSON_DECODER.decode(_b64url_decode(header_segment).decode())
+            if not isinstance(header, dict) or header.get("alg") != "HS256":
+                raise JWTError("The specified alg value is not allowed")
+        # The MAC is checked before the payload is parsed, so unsigned
+        # input never reaches the JSON decoder beyond the small header
+        expected = hmac.digest(
+            _HS256_SECRET,
+            f"{header_segment}.{payload_segment}".encode("ascii"),
+            "sha256",
+        )
+        if not hmac.compare_digest(_b64url_decode(signature_segment), expected):
+            raise JWTError("Signature verification failed.")
+        payload = _JSON_DECODER.decode(_b64url_decode(payload_segment).decode())
+    except ValueError:
+        raise JWTError("Invalid token encoding") from None
+    if not isinstance(payload, dict):
+        raise JWTError("Invalid payload string: must be a json object")
+    _validate_claims(payload)
+    return payload
+
+
+def _validate_claims(claims: dict[str, Any]) -> None:
+    """Apply jose's default checks for the registered claims."""
+    now = int(time.time())
+    try:
+        if "iat" in claims:
+            int(claims["iat"])
+        if "nbf" in claims and int(claims["nbf"]) > now:
+            raise JWTClaimsError("The token is not yet valid (nbf)")
+        if "exp" in claims and int(claims["exp"]) < now:
+            raise ExpiredSignatureError("Signature has expired.")
+    except (TypeError, ValueError):
+        raise JWTClaimsError("Registered time claims must be integers.") from None
+    if "aud" in claims:
+        # No audience is configured, so jose rejects any token that names one
+        raise JWTClaimsError("Invalid audience")
+    if not isinstance(claims.get("sub", ""), str):
+        raise JWTClaimsError("Subject must be a string.")
+    if not isinstance(claims.get("jti", ""), str):
+        raise JWTClaimsError("JWT ID must be a string.")
 
 
 def create_access_token(
     subject: str | Any,
     expires_delta: timedelta | None = None,
     scopes: list[str] | None = None,
+    claims: dict[str, Any] | None = None,
 ) -> str:
     """Create a JWT access token.
     
@@ -47,32 +244,46 @@ def create_access_token(
         subject: The subject of the token (usually user ID)
         expires_delta: Token expiration time delta
         scopes: Optional list of permission scopes
+        claims: Optional extra claims, e.g. from :func:`user_claims`
         
     Returns:
         Encoded JWT token string
     """
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.access_token_expire_minutes
-        )
+    ttl = expires_delta.total_seconds() if expires_delta else ACCESS_TOKEN_TTL_SECONDS
     
     to_encode = {
-        "exp": expire,
+        **(claims or {}),
+        "exp": int(time.time() + ttl),
         "sub": str(subject),
-        "type": "access",
+        "t": ACCESS_TOKEN,
     }
     
     if scopes:
         to_encode["scopes"] = scopes
     
-    encoded_jwt = jwt.encode(
-        to_encode,
-        settings.secret_key,
-        algorithm=settings.algorithm,
-    )
-    return encoded_jwt
+    return _encode_token(to_encode)
+
+
+def user_claims(user: Any) -> dict[str, Any]:
+    """Build the user claims embedded in access tokens.
+    
+    ``user_type`` and the account flags are stable for an access token's
+    lifetime, so carrying them in the token lets type-gated endpoints
+    authorize without loading the user row.
+    
+    Args:
+        user: Anything with ``user_type``, ``is_active`` and ``is_verified``
+            (a ``User`` row or a cached snapshot)
+        
+    Returns:
+        Claims dict with ``ut`` (user type), ``act`` and ``ver`` keys
+    """
+    user_type = user.user_type
+    return {
+        "ut": getattr(user_type, "value", user_type),
+        "act": bool(user.is_active),
+        "ver": bool(user.is_verified),
+    }
 
 
 def create_refresh_token(subject: str | Any) -> str:
@@ -84,22 +295,13 @@ def create_refresh_token(subject: str | Any) -> str:
     Returns:
         Encoded JWT refresh token string
     """
-    expire = datetime.now(timezone.utc) + timedelta(
-        days=settings.refresh_token_expire_days
-    )
-    
     to_encode = {
-        "exp": expire,
+        "exp": int(time.time()) + REFRESH_TOKEN_TTL_SECONDS,
         "sub": str(subject),
-        "type": "refresh",
+        "t": REFRESH_TOKEN,
     }
     
-    encoded_jwt = jwt.encode(
-        to_encode,
-        settings.secret_key,
-        algorithm=settings.algorithm,
-    )
-    return encoded_jwt
+    return _encode_token(to_encode)
 
 
 def decode_token(token: str) -> dict[str, Any]:
@@ -115,16 +317,81 @@ def decode_token(token: str) -> dict[str, Any]:
         JWTError: If token is invalid or expired
     """
     try:
+        if _HS256:
+            return _hs256_decode(token)
         payload = jwt.decode(
             token,
-            settings.secret_key,
-            algorithms=[settings.algorithm],
+            _JWT_KEY,
+            algorithms=_JWT_ALGORITHMS,
         )
         return payload
     except JWTError as e:
         raise JWTError(f"Could not validate token: {str(e)}")
 
 
+# Verified JWT payloads keyed by a 128-bit BLAKE2b digest of the raw token.
+# Every authenticated request used to re-run the HMAC check and JSON decode
+# for the same bearer token; a hit here skips that until the token's own
+# ``exp`` (wall-clock, hence time.time). LRU, so tokens that keep being
+# presented survive eviction. Refresh tokens retried by clients within
+# their lifetime hit here as well.
+TOKEN_CACHE_MAX_ENTRIES = 10_000
+_token_cache: BoundedTTLCache[bytes, dict[str, Any]] = BoundedTTLCache(
+    TOKEN_CACHE_MAX_ENTRIES, clock=time.time, lru=True
+)
+
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def decode_token_cached(token: str) -> dict[str, Any]:
+    """Decode a JWT token, reusing a previously verified payload.
+    
+    Behaves like :func:`decode_token` but remembers the payload of tokens
+    that verified successfully until they expire. Callers must treat the
+    returned dict as read-only, since it is shared between requests.
+    
+    Args:
+        token: JWT token string
+        
+    Returns:
+        Decoded token payload
+        
+    Raises:
+        JWTError: If token is invalid or expired
+    """
+    key = _token_cache_key(token)
+    payload = _token_cache.get(key)
+    if payload is not None:
+        return payload
+    
+    payload = decode_token(token)
+    expires_at = payload.get("exp")
+    if isinstance(expires_at, (int, float)):
+        _token_cache.set(key, payload, expires_at=float(expires_at))
+    return payload
+
+
+# Character classes a strong password must contain, as bits of a mask
+_HAS_UPPER, _HAS_LOWER, _HAS_DIGIT, _HAS_SPECIAL = 1, 2, 4, 8
+_ALL_CLASSES = _HAS_UPPER | _HAS_LOWER | _HAS_DIGIT | _HAS_SPECIAL
+_SPECIAL_CHARACTERS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+# ASCII members of each class, tested with set.isdisjoint (a C-level scan)
+_ASCII_CLASSES = (
+    (_HAS_UPPER, frozenset(string.ascii_uppercase)),
+    (_HAS_LOWER, frozenset(string.ascii_lowercase)),
+    (_HAS_DIGIT, frozenset(string.digits)),
+    (_HAS_SPECIAL, _SPECIAL_CHARACTERS),
+)
+_MISSING_CLASS_MESSAGES = (
+    (_HAS_UPPER, "Password must contain at least one uppercase letter"),
+    (_HAS_LOWER, "Password must contain at least one lowercase letter"),
+    (_HAS_DIGIT, "Password must contain at least one digit"),
+    (_HAS_SPECIAL, "Password must contain at least one special character"),
+)
+
+
 def validate_password_strength(password: str) -> tuple[bool, str]:
     """Validate password meets security requirements.
     
@@ -137,16 +404,25 @@ def validate_password_strength(password: str) -> tuple[bool, str]:
     if len(password) < settings.password_min_length:
         return False, f"Password must be at least {settings.password_min_length} characters"
     
-    if not any(c.isupper() for c in password):
-        return False, "Password must contain at least one uppercase letter"
-    
-    if not any(c.islower() for c in password):
-        return False, "Password must contain at least one lowercase letter"
+    chars = set(password)
+    found = 0
+    for flag, members in _ASCII_CLASSES:
+        if not chars.isdisjoint(members):
+            found |= flag
     
-    if not any(c.isdigit() for c in password):
-        return False, "Password must contain at least one digit"
-    
-    if not any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password):
-        return False, "Password must contain at least one special character"
+    if found != _ALL_CLASSES:
+        # Non-ASCII letters and digits count too; classify the distinct
+        # characters with the Unicode-aware str predicates
+        for c in chars:
+            if c.isupper():
+                found |= _HAS_UPPER
+            elif c.islower():
+                found |= _HAS_LOWER
+            elif c.isdigit():
+                found |= _HAS_DIGIT
+        
+        for flag, message in _MISSING_CLASS_MESSAGES:
+            if not found & flag:
+                return False, message
     
     return True, ""
@@ -0,0 +1,26 @@
+"""Primary key generation."""
+
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+
+    The first 48 bits are the Unix timestamp in milliseconds and the rest is
+    random, so successive keys sort roughly by creation time. Inserts land at
+    the right edge of the primary key B-tree instead of on random leaf pages,
+    while the value stays a plain 16-byte UUID column.
+
+    Returns:
+        A new version 7 UUID
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= int.from_bytes(os.urandom(10), "big") & ((1 << 80) - 1)
+    # Set version (0111) and RFC 4122/9562 variant (10) bits
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
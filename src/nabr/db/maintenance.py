@@ -0,0 +1,97 @@
+"""Scheduled maintenance for the partitioned ``verification_events`` table.
+
+``verification_events`` is range-partitioned by month on ``created_at``.
+Monthly partitions have to exist before their month starts: rows with no
+matching partition land in ``verification_events_default``, and once
+that holds rows for a month, creating the month's partition fails on its
+constraint. Retention drops whole monthly partitions once they are past
+the retention window. pg_cron runs both where it is installed; this job
+is the application-side equivalent, so neither depends on it.
+
+Every API process runs the job at startup and then periodically. A
+transaction-scoped advisory lock lets only one process do the work per
+run; partition creation is idempotent, so overlapping runs are harmless.
+"""
+
+import asyncio
+import logging
+from datetime import date, datetime, timezone
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+# Partitions are kept this many months beyond the current one, so a few
+# missed runs never push rows into the default partition
+PARTITION_MONTHS_AHEAD = 2
+PARTITION_MAINTENANCE_INTERVAL_SECONDS = 6 * 60 * 60
+
+# Arbitrary application-wide key for pg_try_advisory_xact_lock
+_MAINTENANCE_LOCK_KEY = 0x6E616272  # "nabr"
+
+_TRY_LOCK = text("SELECT pg_try_advisory_xact_lock(:key)")
+_CREATE_PARTITION = text("SELECT create_verification_events_partition(CAST(:month AS date))")
+_DROP_EXPIRED_PARTITIONS = text("SELECT drop_expired_verification_events_partitions()")
+
+
+def _months_ahead(today: date, months: int = PARTITION_MONTHS_AHEAD) -> list[date]:
+    """First day of the current month and of each of the next ``months``."""
+    index = today.year * 12 + today.month - 1
+    return [date(i // 12, i % 12 + 1, 1) for i in range(index, index + months + 1)]
+
+
+async def maintain_verification_event_partitions(
+    engine: AsyncEngine,
+    today: Optional[date] = None,
+) -> None:
+    """Create upcoming monthly partitions and drop expired ones.
+
+    Skips the run if another process holds the maintenance lock. A month
+    that can't be created (e.g. its rows already sit in the default
+    partition) is logged and doesn't stop the others. Retention uses the
+    SQL function's default window and never touches the default partition.
+
+    Args:
+        engine: Engine for the application database
+        today: Reference date (UTC today by default)
+    """
+    today = today or datetime.now(timezone.utc).date()
+    async with engine.begin() as conn:
+        if not await conn.scalar(_TRY_LOCK, {"key": _MAINTENANCE_LOCK_KEY}):
+            return
+        for month in _months_ahead(today):
+            try:
+                async with conn.begin_nested():
+                    await conn.execute(_CREATE_PARTITION, {"month": month})
+            except SQLAlchemyError as e:
+                logger.error(
+                    f"Could not create verification_events partition for {month:%Y-%m}: {e}"
+                )
+        try:
+            async with conn.begin_nested():
+                dropped = (await conn.scalars(_DROP_EXPIRED_PARTITIONS)).all()
+        except SQLAlchemyError as e:
+            logger.error(f"verification_events retention failed: {e}")
+        else:
+            if dropped:
+                logger.info(f"Dropped expired verification_events partitions: {', '.join(dropped)}")
+
+
+async def run_partition_maintenance(
+    engine: AsyncEngine,
+    interval: float = PARTITION_MAINTENANCE_INTERVAL_SECONDS,
+) -> None:
+    """Run :func:`maintain_verification_event_partitions` forever.
+
+    Intended as a background task for the life of the process; errors
+    are logged and the next run retries.
+    """
+    while True:
+        try:
+            await maintain_verification_event_partitions(engine)
+        except Exception as e:
+            logger.error(f"verification_events partition maintenance failed: {e}")
+        await asyncio.sleep(interval)
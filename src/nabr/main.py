@@ -9,22 +9,82 @@ It configures the FastAPI app with:
 - Health check endpoints
 """
 
-from contextlib import asynccontextmanager
-from typing import Any, Union
+import asyncio
+import logging
+import queue
+import time
+from contextlib import asynccontextmanager, suppress
+from logging.handlers import QueueHandler, QueueListener
 
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 
+from nabr.api.dependencies.temporal import close_temporal_client, connect_temporal_client
 from nabr.api.routes import auth, verification
 from nabr.core.config import get_settings
+from nabr.core.security import DUMMY_PASSWORD_HASH, verify_password
+from nabr.db.maintenance import run_partition_maintenance
 from nabr.db.session import engine
 from nabr.schemas.base import ErrorResponse
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+def _start_log_listener() -> QueueListener:
+    """Route ``nabr`` logs through a queue drained by a background thread.
+
+    Callers (including the event loop) only enqueue records; formatting
+    output and writing to stderr happen on the listener's thread.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+    listener = QueueListener(log_queue, stream, respect_handler_level=True)
+    package_logger = logging.getLogger("nabr")
+    package_logger.addHandler(QueueHandler(log_queue))
+    package_logger.setLevel(logging.DEBUG if settings.debug else logging.INFO)
+    listener.start()
+    return listener
+
+
+def _stop_log_listener(listener: QueueListener) -> None:
+    """Flush queued records and detach the handler feeding ``listener``."""
+    listener.stop()
+    package_logger = logging.getLogger("nabr")
+    for handler in package_logger.handlers[:]:
+        if isinstance(handler, QueueHandler) and handler.queue is listener.queue:
+            package_logger.removeHandler(handler)
+
+# Connectivity check shared by startup and the readiness probe. One
+# TextClause object means one cached compiled form for every ping.
+_PING = text("SELECT 1")
+
+# Health payloads are fixed for the life of the process, so they are
+# rendered to JSON once instead of re-encoded on every probe
+_HEALTH_BODY = JSONResponse({
+    "status": "healthy",
+    "service": settings.app_name,
+    "version": settings.app_version,
+    "environment": settings.environment,
+}).body
+_READY_BODY = JSONResponse({"status": "ready", "database": "connected"}).body
+
+# Monotonic time of the last passing readiness probe. Orchestrators probe
+# every few seconds; within settings.readiness_cache_seconds the result is
+# reused instead of checking out a connection again. Failures aren't cached.
+_last_ready_at = float("-inf")
+
+
+async def _ping_database() -> None:
+    """Run ``SELECT 1`` in autocommit mode, skipping the BEGIN/COMMIT round trips."""
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.scalar(_PING)
 
 
 @asynccontextmanager
@@ -33,24 +93,49 @@ async def lifespan(app: FastAPI):
     
     Handles startup and shutdown tasks:
     - Database connection initialization
-    - Temporal client connection (future)
+    - Password hashing warmup
+    - Temporal client connection (one per process, shared by all requests)
+    - verification_events partition maintenance (background task)
     - Resource cleanup on shutdown
     """
     # Startup
+    log_listener = _start_log_listener()
     try:
         # Test database connection
         async with engine.begin() as conn:
-            await conn.execute(text("SELECT 1"))
-        print("✅ Database connection successful")
+            await conn.execute(_PING)
+        logger.info("✅ Database connection successful")
     except Exception as e:
-        print(f"❌ Database connection failed: {e}")
+        logger.error(f"❌ Database connection failed: {e}")
+        _stop_log_listener(log_listener)
         raise
     
+    # Run one Argon2 verify now, so the first login doesn't pay for loading
+    # the argon2-cffi bindings. PIN hashing uses the same library.
+    verify_password("warmup", DUMMY_PASSWORD_HASH)
+    logger.info("✅ Password hashing ready")
+    
+    try:
+        await connect_temporal_client()
+        logger.info("✅ Temporal client connected")
+    except Exception as e:
+        # Not fatal: routes that need Temporal retry the connection lazily
+        logger.warning(f"⚠️  Temporal connection failed, will retry on first use: {e}")
+    
+    # Keeps monthly verification_events partitions created ahead of time,
+    # whether or not the database has pg_cron
+    partition_maintenance = asyncio.create_task(run_partition_maintenance(engine))
+    
     yield
     
     # Shutdown
+    partition_maintenance.cancel()
+    with suppress(asyncio.CancelledError):
+        await partition_maintenance
+    await close_temporal_client()
     await engine.dispose()
-    print("✅ Database connections closed")
+    logger.info("✅ Database connections closed")
+    _stop_log_listener(log_listener)
 
 
 # Create FastAPI application
@@ -81,13 +166,14 @@ async def validation_exception_handler(
     exc: RequestValidationError,
 ) -> JSONResponse:
     """Handle validation errors with structured response."""
-    errors = []
-    for error in exc.errors():
-        errors.append({
-            "field": ".".join(str(x) for x in error["loc"][1:]),
+    errors = [
+        {
+            "field": ".".join(map(str, error["loc"][1:])),
             "message": error["msg"],
             "type": error["type"],
-        })
+        }
+        for error in exc.errors()
+    ]
     
     return JSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -105,8 +191,7 @@ async def database_exception_handler(
     exc: SQLAlchemyError,
 ) -> JSONResponse:
     """Handle database errors."""
-    # Log the error for debugging (in production, use proper logging)
-    print(f"Database error: {exc}")
+    logger.error(f"Database error: {exc}", exc_info=exc)
     
     return JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -124,8 +209,7 @@ async def general_exception_handler(
     exc: Exception,
 ) -> JSONResponse:
     """Handle general exceptions."""
-    # Log the error for debugging (in production, use proper logging)
-    print(f"Unhandled error: {exc}")
+    logger.error(f"Unhandled error: {exc}", exc_info=exc)
     
     return JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -138,36 +222,31 @@ async def general_exception_handler(
 
 
 # Health Check Endpoints
-@app.get("/health", tags=["Health"])
-async def health_check() -> dict[str, Any]:
+@app.get("/health", tags=["Health"], response_model=None)
+async def health_check() -> Response:
     """Basic health check endpoint."""
-    return {
-        "status": "healthy",
-        "service": settings.app_name,
-        "version": settings.app_version,
-        "environment": settings.environment,
-    }
+    return Response(_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/health/ready", tags=["Health"], response_model=None)
-async def readiness_check() -> Union[dict[str, Any], JSONResponse]:
+async def readiness_check() -> Response:
     """Readiness check - verifies database connectivity."""
-    try:
-        async with engine.begin() as conn:
-            await conn.execute(text("SELECT 1"))
-        return {
-            "status": "ready",
-            "database": "connected",
-        }
-    except Exception as e:
-        return JSONResponse(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            content={
-                "status": "not_ready",
-                "database": "disconnected",
-                "error": str(e) if settings.debug else "Database connection failed",
-            },
-        )
+    global _last_ready_at
+    now = time.monotonic()
+    if now - _last_ready_at >= settings.readiness_cache_seconds:
+        try:
+            await _ping_database()
+        except Exception as e:
+            return JSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content={
+                    "status": "not_ready",
+                    "database": "disconnected",
+                    "error": str(e) if settings.debug else "Database connection failed",
+                },
+            )
+        _last_ready_at = now
+    return Response(_READY_BODY, media_type="application/json")
 
 
 # API Router Registration
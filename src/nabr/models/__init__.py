@@ -8,7 +8,6 @@ from nabr.models.verification import (
     UserVerificationLevel,
     VerifierProfile,
     VerifierCredentialValidation,
-    VerificationMethodCompletion,
     VerificationEvent,
 )
 
@@ -26,7 +25,6 @@ __all__ = [
     "UserVerificationLevel",
     "VerifierProfile",
     "VerifierCredentialValidation",
-    "VerificationMethodCompletion",
     "VerificationEvent",
     # Request models
     "Request",
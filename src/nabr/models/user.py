@@ -11,15 +11,21 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
 from nabr.db.session import Base
 
+# Server default for profile list columns (skills, services, programs, ...)
+_EMPTY_JSONB_ARRAY = text("'[]'::jsonb")
+
 
 class UserType(str, PyEnum):
     """User account type enumeration.
@@ -156,11 +162,6 @@ class User(Base):
         back_populates="user",
         cascade="all, delete-orphan",
     )
-    method_completions = relationship(
-        "VerificationMethodCompletion",
-        back_populates="user",
-        cascade="all, delete-orphan",
-    )
     
     requests_created = relationship(
         "Request",
@@ -193,6 +194,10 @@ class User(Base):
         # This supports UN/PIN authentication without requiring email
         # User must have username (always required) OR email OR phone_number
         # In practice, username is always present, so this is a safety check
+        
+        # Emails differing only by case are the same account. The API
+        # lower-cases emails before writing or querying them.
+        Index("ix_users_email_lower", func.lower(email), unique=True),
     )
 
 
@@ -214,16 +219,16 @@ class IndividualProfile(Base):
     )
     
     # Skills and capabilities (for offering help)
-    skills = Column(Text, nullable=True)  # JSON array stored as text
-    interests = Column(Text, nullable=True)  # JSON array of interests
+    skills = Column(JSONB, nullable=True, server_default=_EMPTY_JSONB_ARRAY)
+    interests = Column(JSONB, nullable=True, server_default=_EMPTY_JSONB_ARRAY)
     
     # Availability
     availability_schedule = Column(Text, nullable=True)  # JSON schedule
     max_distance_km = Column(Float, default=25.0)
     
     # Preferences
-    preferred_assistance_types = Column(Text, nullable=True)  # JSON array
-    languages_spoken = Column(Text, nullable=True)  # JSON array
+    preferred_assistance_types = Column(JSONB, nullable=True, server_default=_EMPTY_JSONB_ARRAY)
+    languages_spoken = Column(JSONB, nullable=True, server_default=_EMPTY_JSONB_ARRAY)
     
     # Emergency contact
     emergency_contact_name = Column(String(100), nullable=True)
@@ -263,8 +268,8 @@ class BusinessProfile(Base):
     website = Column(String(255), nullable=True)
     
     # Services and resources
-    services_offered = Column(Text, nullable=True)  # JSON array
-    resources_available = Column(Text, nullable=True)  # JSON array
+    services_offered = Column(JSONB, nullable=True, server_default=_EMPTY_JSONB_ARRAY)
+    resources_available = Column(JSONB, nullable=True, server_default=_EMPTY_JSONB_ARRAY)
     
     # Operating details
     business_hours = Column(Text, nullable=True)  # JSON schedule
@@ -309,8 +314,8 @@ class OrganizationProfile(Base):
     mission_statement = Column(Text, nullable=True)
     
     # Programs and services
-    programs_offered = Column(Text, nullable=True)  # JSON array
-    service_areas = Column(Text, nullable=True)  # JSON array of geographic areas
+    programs_offered = Column(JSONB, nullable=True, server_default=_EMPTY_JSONB_ARRAY)
+    service_areas = Column(JSONB, nullable=True, server_default=_EMPTY_JSONB_ARRAY)  # Geographic areas
     
     # Capacity
     staff_count = Column(Integer, nullable=True)
@@ -318,7 +323,7 @@ class OrganizationProfile(Base):
     
     # Verification
     nonprofit_status_verified = Column(Boolean, default=False)
-    accreditation = Column(Text, nullable=True)  # JSON array of accreditations
+    accreditation = Column(JSONB, nullable=True, server_default=_EMPTY_JSONB_ARRAY)
     
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -2,27 +2,38 @@
 Enhanced verification models for tiered verification system.
 
 Models for multi-level verification, verifier credentials, and method tracking.
+
+Primary keys default to time-ordered UUIDs from nabr.db.ids.uuid7; code that
+assigns IDs for these tables explicitly should use the same helper so inserts
+stay at the right edge of the primary key indexes.
 """
 
-import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum as PyEnum
 
 from sqlalchemy import (
+    DDL,
     Boolean,
     Column,
+    Computed,
     DateTime,
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
+    LargeBinary,
+    SmallInteger,
     String,
     Text,
-    UniqueConstraint,
+    desc,
+    event,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 
+from nabr.db.ids import uuid7
 from nabr.db.session import Base
 from nabr.models.verification_types import (
     VerificationLevel,
@@ -31,6 +42,11 @@ from nabr.models.verification_types import (
 )
 
 
+def _utcnow() -> datetime:
+    """Timezone-aware UTC now, for TIMESTAMPTZ column defaults."""
+    return datetime.now(timezone.utc)
+
+
 class VerificationStatus(str, PyEnum):
     """Overall verification record status."""
 
@@ -55,13 +71,27 @@ class VerificationRecord(Base):
     """
 
     __tablename__ = "verification_records"
+    __table_args__ = (
+        Index("ix_verification_records_user_status", "user_id", "status"),
+        Index("ix_verification_records_user_created", "user_id", desc("created_at")),
+        Index(
+            "ix_verification_records_document_hash",
+            "document_hash",
+            postgresql_where=text("document_hash IS NOT NULL"),
+        ),
+        Index(
+            "ix_verification_records_credential_data_gin",
+            "credential_data",
+            postgresql_using="gin",
+            postgresql_ops={"credential_data": "jsonb_path_ops"},
+        ),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     
     # What method is being verified
@@ -72,7 +102,6 @@ class VerificationRecord(Base):
         Enum(VerificationStatus),
         nullable=False,
         default=VerificationStatus.PENDING,
-        index=True,
     )
     
     # Two-party verification (for IN_PERSON_TWO_PARTY method)
@@ -88,20 +117,22 @@ class VerificationRecord(Base):
         nullable=True,
         index=True,
     )
-    verifier1_confirmed_at = Column(DateTime, nullable=True)
-    verifier2_confirmed_at = Column(DateTime, nullable=True)
+    verifier1_confirmed_at = Column(DateTime(timezone=True), nullable=True)
+    verifier2_confirmed_at = Column(DateTime(timezone=True), nullable=True)
     verifier1_location = Column(Text, nullable=True)
     verifier2_location = Column(Text, nullable=True)
     verifier1_notes = Column(Text, nullable=True)
     verifier2_notes = Column(Text, nullable=True)
     
-    # QR code tokens for two-party verification
-    verifier1_token = Column(String(255), nullable=True, unique=True, index=True)
-    verifier2_token = Column(String(255), nullable=True, unique=True, index=True)
-    qr_expires_at = Column(DateTime, nullable=True)
+    # QR code tokens for two-party verification. Only the SHA-256 digest of
+    # each token is stored (see nabr.core.security.hash_token); the raw token
+    # lives solely in the QR code handed to the verifier.
+    verifier1_token_sha256 = Column(LargeBinary(32), nullable=True, unique=True, index=True)
+    verifier2_token_sha256 = Column(LargeBinary(32), nullable=True, unique=True, index=True)
+    qr_expires_at = Column(DateTime(timezone=True), nullable=True)
     
     # Document/credential data (stored securely, hashed where appropriate)
-    document_hash = Column(String(255), nullable=True)  # Hash of ID/document
+    document_hash = Column(LargeBinary(32), nullable=True)  # Raw SHA-256 of ID/document, for dedup
     document_type = Column(String(100), nullable=True)  # e.g., "passport", "drivers_license"
     credential_number = Column(String(255), nullable=True)  # License number, tax ID, etc.
     credential_data = Column(JSONB, nullable=True)  # Additional structured data
@@ -115,26 +146,28 @@ class VerificationRecord(Base):
     notes = Column(Text, nullable=True)
     rejection_reason = Column(Text, nullable=True)
     revocation_reason = Column(Text, nullable=True)
-    revoked_by = Column(
-        UUID(as_uuid=True),
-        ForeignKey("users.id", ondelete="SET NULL"),
-        nullable=True,
-    )
+    # Audit column: deliberately no FK to users so inserts/updates here never
+    # lock the users row, and the value survives the revoker's account deletion.
+    revoked_by = Column(UUID(as_uuid=True), nullable=True)
     
     # Temporal workflow tracking
     temporal_workflow_id = Column(String(255), nullable=True, index=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    verified_at = Column(DateTime, nullable=True)  # When verification completed
-    expires_at = Column(DateTime, nullable=True)  # When this verification expires
-    revoked_at = Column(DateTime, nullable=True)  # When revoked
+    created_at = Column(DateTime(timezone=True), default=_utcnow, nullable=False)
+    verified_at = Column(DateTime(timezone=True), nullable=True)  # When verification completed
+    expires_at = Column(DateTime(timezone=True), nullable=True)  # When this verification expires
+    revoked_at = Column(DateTime(timezone=True), nullable=True)  # When revoked
     
     # Relationships
     user = relationship("User", foreign_keys=[user_id], back_populates="verification_records")
     verifier1 = relationship("User", foreign_keys=[verifier1_id])
     verifier2 = relationship("User", foreign_keys=[verifier2_id])
-    revoker = relationship("User", foreign_keys=[revoked_by])
+    revoker = relationship(
+        "User",
+        primaryjoin="foreign(VerificationRecord.revoked_by) == User.id",
+        viewonly=True,
+    )
 
     def __repr__(self) -> str:
         return (
@@ -151,8 +184,22 @@ class UserVerificationLevel(Base):
     """
 
     __tablename__ = "user_verification_levels"
+    __table_args__ = (
+        Index(
+            "ix_user_verification_levels_completed_methods_gin",
+            "completed_methods",
+            postgresql_using="gin",
+            postgresql_ops={"completed_methods": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_user_verification_levels_in_progress_methods_gin",
+            "in_progress_methods",
+            postgresql_using="gin",
+            postgresql_ops={"in_progress_methods": "jsonb_path_ops"},
+        ),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
@@ -170,17 +217,23 @@ class UserVerificationLevel(Base):
     )
     
     # Progress tracking
+    # System of record for completed methods (list of method names). When a
+    # method was completed is in verification_events ("method" in event_data).
     completed_methods = Column(JSONB, nullable=False, default=list)  # List of completed method names
     in_progress_methods = Column(JSONB, nullable=False, default=list)  # List of in-progress methods
     
     # Statistics
-    total_methods_completed = Column(Integer, default=0, nullable=False)
+    total_methods_completed = Column(
+        Integer,
+        Computed("jsonb_array_length(completed_methods)", persisted=True),
+        nullable=False,
+    )  # Generated from completed_methods, never written by the app
     level_progress_percentage = Column(Float, default=0.0, nullable=False)  # Progress to next level
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    level_achieved_at = Column(DateTime, nullable=True)  # When current level was achieved
+    created_at = Column(DateTime(timezone=True), default=_utcnow, nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=_utcnow, onupdate=_utcnow)
+    level_achieved_at = Column(DateTime(timezone=True), nullable=True)  # When current level was achieved
     
     # Relationship
     user = relationship("User", back_populates="verification_level")
@@ -205,8 +258,22 @@ class VerifierProfile(Base):
     """
 
     __tablename__ = "verifier_profiles"
+    __table_args__ = (
+        # Active-verifier lookups; revoked/unauthorized rows never enter the index
+        Index(
+            "ix_verifier_profiles_active",
+            "user_id",
+            postgresql_where=text("is_authorized AND NOT revoked"),
+        ),
+        Index(
+            "ix_verifier_profiles_credentials_gin",
+            "credentials",
+            postgresql_using="gin",
+            postgresql_ops={"credentials": "jsonb_path_ops"},
+        ),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
@@ -216,7 +283,7 @@ class VerifierProfile(Base):
     )
     
     # Authorization status
-    is_authorized = Column(Boolean, default=False, nullable=False, index=True)
+    is_authorized = Column(Boolean, default=False, nullable=False)
     auto_qualified = Column(Boolean, default=False, nullable=False)  # Auto-qualified via credentials
     
     # Credentials (stored as list of VerifierCredential enum values)
@@ -225,32 +292,32 @@ class VerifierProfile(Base):
     # Statistics
     total_verifications_performed = Column(Integer, default=0, nullable=False)
     successful_verifications = Column(Integer, default=0, nullable=False)
-    rejected_verifications = Column(Integer, default=0, nullable=False)
+    rejected_verifications = Column(SmallInteger, default=0, nullable=False)
     verifier_rating = Column(Float, default=0.0, nullable=False)  # Based on verification quality
     
     # Revocation tracking
-    revoked = Column(Boolean, default=False, nullable=False, index=True)
-    revoked_at = Column(DateTime, nullable=True)
+    revoked = Column(Boolean, default=False, nullable=False)
+    revoked_at = Column(DateTime(timezone=True), nullable=True)
     revocation_reason = Column(Text, nullable=True)
-    revoked_by = Column(
-        UUID(as_uuid=True),
-        ForeignKey("users.id", ondelete="SET NULL"),
-        nullable=True,
-    )
+    revoked_by = Column(UUID(as_uuid=True), nullable=True)  # Audit only, no FK (see VerificationRecord)
     
     # Training and compliance
     training_completed = Column(Boolean, default=False, nullable=False)
-    training_completed_at = Column(DateTime, nullable=True)
-    last_activity_check = Column(DateTime, nullable=True)  # Last time credentials were verified
+    training_completed_at = Column(DateTime(timezone=True), nullable=True)
+    last_activity_check = Column(DateTime(timezone=True), nullable=True)  # Last time credentials were verified
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    authorized_at = Column(DateTime, nullable=True)  # When first authorized
+    created_at = Column(DateTime(timezone=True), default=_utcnow, nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=_utcnow, onupdate=_utcnow)
+    authorized_at = Column(DateTime(timezone=True), nullable=True)  # When first authorized
     
     # Relationships
     user = relationship("User", back_populates="verifier_profile", foreign_keys=[user_id])
-    revoker = relationship("User", foreign_keys=[revoked_by])
+    revoker = relationship(
+        "User",
+        primaryjoin="foreign(VerifierProfile.revoked_by) == User.id",
+        viewonly=True,
+    )
     credential_validations = relationship(
         "VerifierCredentialValidation",
         back_populates="verifier_profile",
@@ -273,7 +340,7 @@ class VerifierCredentialValidation(Base):
 
     __tablename__ = "verifier_credential_validations"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     verifier_profile_id = Column(
         UUID(as_uuid=True),
         ForeignKey("verifier_profiles.id", ondelete="CASCADE"),
@@ -298,10 +365,10 @@ class VerifierCredentialValidation(Base):
     validation_source = Column(String(255), nullable=True)  # API endpoint, manual verifier, etc.
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    validated_at = Column(DateTime, nullable=True)
-    expires_at = Column(DateTime, nullable=True)  # When credential expires
-    last_checked_at = Column(DateTime, nullable=True)  # Last time validity was confirmed
+    created_at = Column(DateTime(timezone=True), default=_utcnow, nullable=False)
+    validated_at = Column(DateTime(timezone=True), nullable=True)
+    expires_at = Column(DateTime(timezone=True), nullable=True)  # When credential expires
+    last_checked_at = Column(DateTime(timezone=True), nullable=True)  # Last time validity was confirmed
     
     # Relationship
     verifier_profile = relationship("VerifierProfile", back_populates="credential_validations")
@@ -313,56 +380,6 @@ class VerifierCredentialValidation(Base):
         )
 
 
-# ============================================================================
-# Method Completion Tracking
-# ============================================================================
-
-class VerificationMethodCompletion(Base):
-    """
-    Tracks completion of individual verification methods.
-    
-    One record per user per completed method, for audit trail.
-    """
-
-    __tablename__ = "verification_method_completions"
-    __table_args__ = (
-        UniqueConstraint("user_id", "method", name="uq_user_method"),
-    )
-
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(
-        UUID(as_uuid=True),
-        ForeignKey("users.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True,
-    )
-    
-    # Method completed
-    method = Column(Enum(VerificationMethod), nullable=False, index=True)
-    
-    # Reference to the verification record
-    verification_record_id = Column(
-        UUID(as_uuid=True),
-        ForeignKey("verification_records.id", ondelete="SET NULL"),
-        nullable=True,
-    )
-    
-    # Completion details
-    completed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    level_before = Column(Enum(VerificationLevel), nullable=True)  # Level before this completion
-    level_after = Column(Enum(VerificationLevel), nullable=True)  # Level after this completion
-    
-    # Relationships
-    user = relationship("User", back_populates="method_completions")
-    verification_record = relationship("VerificationRecord")
-
-    def __repr__(self) -> str:
-        return (
-            f"<VerificationMethodCompletion(user_id={self.user_id}, "
-            f"method={self.method}, level={self.level_after})>"
-        )
-
-
 # ============================================================================
 # Verification Events/Audit Trail
 # ============================================================================
@@ -372,50 +389,88 @@ class VerificationEvent(Base):
     Immutable audit trail of verification-related events.
     
     Tracks all significant events in the verification process.
+    Range-partitioned by month on created_at, so the primary key is
+    (id, created_at).
     """
 
     __tablename__ = "verification_events"
+    __table_args__ = (
+        Index("ix_verification_events_user_created", "user_id", desc("created_at")),
+        Index(
+            "ix_verification_events_record_created",
+            "verification_record_id",
+            desc("created_at"),
+            postgresql_where=text("verification_record_id IS NOT NULL"),
+        ),
+        Index(
+            "ix_verification_events_method",
+            text("(event_data ->> 'method')"),
+            postgresql_where=text("event_data ->> 'method' IS NOT NULL"),
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     verification_record_id = Column(
         UUID(as_uuid=True),
         ForeignKey("verification_records.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
     )
     
     # Event details
     event_type = Column(String(100), nullable=False, index=True)  # e.g., "qr_generated", "verifier_confirmed", "level_increased"
     event_data = Column(JSONB, nullable=True)  # Additional structured event data
     
-    # Actor (who caused this event)
-    actor_id = Column(
-        UUID(as_uuid=True),
-        ForeignKey("users.id", ondelete="SET NULL"),
-        nullable=True,
-    )
+    # Actor (who caused this event). Audit column: no FK to users, so event
+    # inserts never lock the users row and history outlives account deletion.
+    actor_id = Column(UUID(as_uuid=True), nullable=True)
     
     # Context
     temporal_workflow_id = Column(String(255), nullable=True, index=True)
     ip_address = Column(String(45), nullable=True)  # IPv4 or IPv6
     user_agent = Column(Text, nullable=True)
     
-    # Timestamp (immutable)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    # Timestamp (immutable, partition key)
+    created_at = Column(DateTime(timezone=True), default=_utcnow, nullable=False, primary_key=True)
     
     # Relationships
     user = relationship("User", foreign_keys=[user_id])
     verification_record = relationship("VerificationRecord")
-    actor = relationship("User", foreign_keys=[actor_id])
+    actor = relationship(
+        "User",
+        primaryjoin="foreign(VerificationEvent.actor_id) == User.id",
+        viewonly=True,
+    )
 
     def __repr__(self) -> str:
         return (
             f"<VerificationEvent(type={self.event_type}, user_id={self.user_id}, "
             f"created_at={self.created_at})>"
         )
+
+
+# A partitioned table rejects inserts until a partition exists. The Alembic
+# migration manages monthly partitions; for create_all() (create_tables.py,
+# init_db) attach a DEFAULT partition so the table is usable straight away.
+event.listen(
+    VerificationEvent.__table__,
+    "after_create",
+    DDL(
+        "CREATE TABLE IF NOT EXISTS verification_events_default "
+        "PARTITION OF verification_events DEFAULT"
+    ),
+)
+
+# Heavily updated in place; leave free space on each page for HOT updates
+# (mirrors the fillfactor set by the Alembic migration).
+for _table in (
+    VerificationRecord.__table__,
+    UserVerificationLevel.__table__,
+    VerifierProfile.__table__,
+):
+    event.listen(_table, "after_create", DDL("ALTER TABLE %(table)s SET (fillfactor = 70)"))
@@ -44,8 +44,8 @@ TEMPORAL WORKFLOW ARCHITECTURE:
   - Compensation for revoked verifications
 """
 
-from enum import Enum as PyEnum
-from typing import Dict, List, Set, Optional
+from enum import Enum as PyEnum, IntFlag
+from typing import Dict, Iterable, List, Set, Optional, Tuple, Union
 from dataclasses import dataclass
 
 
@@ -556,6 +556,55 @@ SUGGESTED_PATHS: Dict[UserType, Dict[VerificationLevel, List[Set[VerificationMet
 }
 
 
+# One bit per method, so completed-method checks against a path are a single
+# AND instead of set operations. Bits follow VerificationMethod declaration
+# order; add new methods at the end so existing masks keep their meaning.
+MethodFlag = IntFlag(
+    "MethodFlag",
+    {method.name: 1 << position for position, method in enumerate(VerificationMethod)},
+)
+
+METHOD_BITS: Dict[VerificationMethod, int] = {
+    method: int(MethodFlag[method.name]) for method in VerificationMethod
+}
+
+
+def methods_to_mask(methods: Iterable[VerificationMethod]) -> int:
+    """Pack a collection of methods into a METHOD_BITS bitmask."""
+    mask = 0
+    for method in methods:
+        mask |= METHOD_BITS[method]
+    return mask
+
+
+def mask_to_methods(mask: int) -> Set[VerificationMethod]:
+    """Unpack a METHOD_BITS bitmask into the set of methods it contains."""
+    return {method for method, bit in METHOD_BITS.items() if mask & bit}
+
+
+def is_method_completed(mask: int, method: VerificationMethod) -> bool:
+    """Check a single method against a completed-methods bitmask."""
+    return bool(mask & METHOD_BITS[method])
+
+
+# SUGGESTED_PATHS precomputed once as (mask, method count, total points, path)
+_SUGGESTED_PATH_MASKS: Dict[UserType, Dict[VerificationLevel, List[Tuple[int, int, int, Set[VerificationMethod]]]]] = {
+    user_type: {
+        level: [
+            (
+                methods_to_mask(path),
+                len(path),
+                sum(METHOD_SCORES[method].points for method in path if method in METHOD_SCORES),
+                path,
+            )
+            for path in paths
+        ]
+        for level, paths in levels.items()
+    }
+    for user_type, levels in SUGGESTED_PATHS.items()
+}
+
+
 # ============================================================================
 # AUTHORIZED VERIFIER SYSTEM
 # ============================================================================
@@ -656,7 +705,7 @@ def calculate_verification_level(
 def get_next_level_requirements(
     current_score: int,
     user_type: UserType,
-    completed_methods: Set[VerificationMethod],
+    completed_methods: Union[Set[VerificationMethod], int],
 ) -> tuple[VerificationLevel, int, List[Set[VerificationMethod]]]:
     """
     Get requirements to reach the next verification level.
@@ -664,7 +713,8 @@ def get_next_level_requirements(
     Args:
         current_score: Current trust score
         user_type: Type of user account
-        completed_methods: Methods already completed
+        completed_methods: Methods already completed, as a set or a
+            METHOD_BITS bitmask
         
     Returns:
         Tuple of (next_level, points_needed, suggested_method_combinations)
@@ -686,16 +736,24 @@ def get_next_level_requirements(
     points_needed = max(0, next_threshold - current_score)
     
     # Get suggested paths for next level
-    suggested_paths = SUGGESTED_PATHS.get(user_type, {}).get(next_level, [])
-    
-    # Filter to paths that don't require already-completed methods
-    # (show alternative paths)
-    filtered_paths = []
-    for path in suggested_paths:
-        if not path.issubset(completed_methods):
-            filtered_paths.append(path)
+    suggested_paths = _SUGGESTED_PATH_MASKS.get(user_type, {}).get(next_level, [])
+    if isinstance(completed_methods, int):
+        completed_mask = completed_methods
+    else:
+        completed_mask = methods_to_mask(completed_methods)
+    
+    # Skip paths that are already fully completed (show alternative paths),
+    # then rank by fewest remaining methods, most already completed, and
+    # highest points
+    ranked_paths = []
+    for path_mask, path_size, path_points, path in suggested_paths:
+        if path_mask & ~completed_mask == 0:
+            continue
+        done = (path_mask & completed_mask).bit_count()
+        ranked_paths.append(((path_size - done, -done, -path_points), path))
+    ranked_paths.sort(key=lambda ranked: ranked[0])
     
-    return next_level, points_needed, filtered_paths
+    return next_level, points_needed, [path for _, path in ranked_paths]
 
 
 def get_applicable_methods(user_type: UserType) -> Set[VerificationMethod]:
@@ -14,6 +14,28 @@ import re
 from nabr.schemas.base import BaseSchema
 
 
+# Ascending 3-digit runs rejected in PINs ("012" ... "789")
+_SEQUENTIAL_RUNS = frozenset("0123456789"[i:i+3] for i in range(8))
+
+
+def _check_pin_strength(v: str) -> str:
+    """Reject PINs containing an ascending run or a single repeated digit."""
+    # Check for sequential numbers
+    if any(v[i:i+3] in _SEQUENTIAL_RUNS for i in range(len(v) - 2)):
+        raise ValueError("PIN cannot contain sequential numbers")
+    
+    # Check for repeated digits
+    if len(set(v)) == 1:
+        raise ValueError("PIN cannot be all the same digit")
+    
+    return v
+
+
+def _normalize_email(v: Optional[str]) -> Optional[str]:
+    """Lower-case emails so lookups match the lower(email) unique index."""
+    return v.strip().lower() if v is not None else None
+
+
 # ========================
 # PIN Authentication Schemas
 # ========================
@@ -57,18 +79,7 @@ class PINLoginRequest(BaseSchema):
     @classmethod
     def validate_pin_strength(cls, v: str) -> str:
         """Validate PIN is not sequential or repeated."""
-        # Check for sequential numbers
-        if any(
-            v[i:i+3] in ["012", "123", "234", "345", "456", "567", "678", "789"]
-            for i in range(len(v) - 2)
-        ):
-            raise ValueError("PIN cannot contain sequential numbers")
-        
-        # Check for repeated digits
-        if len(set(v)) == 1:
-            raise ValueError("PIN cannot be all the same digit")
-        
-        return v
+        return _check_pin_strength(v)
 
 
 # ========================
@@ -118,6 +129,12 @@ class BaseSignupData(BaseSchema):
         examples=["+1234567890"]
     )
     
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, v: Optional[str]) -> Optional[str]:
+        """Store and look up emails in lower case."""
+        return _normalize_email(v)
+    
     @field_validator("username")
     @classmethod
     def validate_username(cls, v: str) -> str:
@@ -132,18 +149,7 @@ class BaseSignupData(BaseSchema):
     @classmethod
     def validate_pin_strength(cls, v: str) -> str:
         """Validate PIN is not sequential or repeated."""
-        # Check for sequential numbers
-        if any(
-            v[i:i+3] in ["012", "123", "234", "345", "456", "567", "678", "789"]
-            for i in range(len(v) - 2)
-        ):
-            raise ValueError("PIN cannot contain sequential numbers")
-        
-        # Check for repeated digits
-        if len(set(v)) == 1:
-            raise ValueError("PIN cannot be all the same digit")
-        
-        return v
+        return _check_pin_strength(v)
 
 
 class IndividualSignupData(BaseSignupData):
@@ -521,6 +527,12 @@ class LoginRequest(BaseSchema):
         examples=["SecurePass123!"]
     )
     
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, v: str) -> str:
+        """Store and look up emails in lower case."""
+        return _normalize_email(v)
+    
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
@@ -561,12 +573,18 @@ class RegisterRequest(BaseSchema):
         description="Optional phone number",
         examples=["+1234567890"]
     )
-    user_type: str = Field(
+    user_type: Literal["individual", "business", "organization"] = Field(
         default="individual",
         description="Type of user account: individual, business, or organization",
         examples=["individual", "business", "organization"]
     )
     
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, v: str) -> str:
+        """Store and look up emails in lower case."""
+        return _normalize_email(v)
+    
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
@@ -680,6 +698,12 @@ class PasswordResetRequest(BaseSchema):
         description="Email address of account to reset"
     )
     
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, v: str) -> str:
+        """Store and look up emails in lower case."""
+        return _normalize_email(v)
+    
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
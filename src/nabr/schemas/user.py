@@ -5,7 +5,7 @@ Defines all schemas for user management, profiles, and volunteer information.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID
 from pydantic import EmailStr, Field, ConfigDict
 
@@ -150,6 +150,17 @@ class UserRead(UserBase, TimestampSchema):
         description="Total number of reviews received"
     )
     
+    @classmethod
+    def from_orm_fast(cls, user: Any) -> "UserRead":
+        """
+        Build from a trusted ``User`` row or entity without validation.
+        
+        The columns already have the schema's types, so re-validating
+        them (notably the email check) only costs time. Use only for
+        data read back from our own database.
+        """
+        return cls.model_construct(**{name: getattr(user, name) for name in cls.model_fields})
+    
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
@@ -198,13 +198,32 @@ class VerificationMethodStart(BaseSchema):
 
 
 class VerificationStatus(BaseSchema):
-    """Schema for current verification status."""
+    """Schema for current verification status (including next level summary)."""
     
     user_id: str
     trust_score: int
     verification_level: str
-    completed_methods: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
+    completed_method_count: int = 0
+    active_points: int = 0
+    expired_points: int = 0
+    history_version: Optional[str] = Field(
+        None, description="Changes when /history contents change"
+    )
     active_verifications: List[str] = Field(default_factory=list)
+    next_level: Optional[str] = None
+    points_needed: int = 0
+    suggested_paths_etag: Optional[str] = Field(
+        None, description="Changes when /next-level suggested paths change"
+    )
+
+
+class VerificationHistoryPage(BaseSchema):
+    """Schema for one page of completed verification methods (newest first)."""
+    
+    items: List[Dict[str, Any]] = Field(default_factory=list)
+    next_cursor: Optional[str] = Field(
+        None, description="Pass as cursor to get the next page; null on the last page"
+    )
 
 
 class NextLevelInfo(BaseSchema):
@@ -220,12 +239,19 @@ class NextLevelInfo(BaseSchema):
 class VerifierConfirmationRequest(BaseSchema):
     """Schema for verifier confirmation of identity."""
     
-    user_id: str
+    user_id: UUID
     method: str
     qr_code: str
     location_lat: Optional[float] = None
     location_lon: Optional[float] = None
     device_fingerprint: Optional[str] = None
+    notes: Optional[str] = None
+
+
+class VerifierConfirmationBatch(BaseSchema):
+    """Schema for submitting several verifier confirmations in one request."""
+    
+    confirmations: List[VerifierConfirmationRequest] = Field(..., min_length=1, max_length=50)
 
 
 class VerificationRevocation(BaseSchema):
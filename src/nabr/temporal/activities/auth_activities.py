@@ -5,13 +5,14 @@ Implements activities for user signup, PIN authentication, and session managemen
 All activities follow OWASP security best practices and include proper error handling.
 """
 
-import asyncio
+import hashlib
 import secrets
 from datetime import datetime, timedelta
-from typing import Optional, TypedDict
-from passlib.hash import argon2
+from typing import NotRequired, Optional, TypedDict
+from uuid import UUID
+from argon2 import PasswordHasher
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import select
+from sqlalchemy import insert, or_, select
 from temporalio import activity
 
 from nabr.db.session import AsyncSessionLocal
@@ -27,7 +28,50 @@ from nabr.models.user import (
     OrganizationProfile,
 )
 from nabr.models.verification import UserVerificationLevel
-from nabr.core.security import create_access_token, create_refresh_token
+from nabr.core.cache import BoundedTTLCache
+from nabr.core.security import (
+    create_access_token,
+    create_refresh_token,
+    averify_password,
+    run_hashing,
+    user_claims,
+)
+
+# Argon2 parameters for PIN hashes (OWASP recommended)
+_pin_hasher = PasswordHasher(
+    time_cost=3,  # Iterations
+    memory_cost=65536,  # 64 MB
+    parallelism=4,  # Threads
+    salt_len=16,
+)
+
+# Session lifetimes by device type
+_KIOSK_SESSION_TTL = timedelta(minutes=30)  # Shared device
+_PERSONAL_SESSION_TTL = timedelta(days=7)  # Personal device
+
+# Verified against when the username or PIN method doesn't exist, so every
+# login attempt costs one Argon2 verify and response times don't reveal
+# whether a username is registered
+_DUMMY_PIN_HASH = _pin_hasher.hash(secrets.token_urlsafe(16))
+
+# PINs that passed Argon2 recently, so kiosk session renewals presenting
+# the same PIN within the TTL skip another verify. Entries are keyed by
+# the auth method, its stored hash (a PIN change invalidates them) and
+# the PIN, under a per-process BLAKE2b key so the cached digests alone
+# can't be brute-forced back to 6-digit PINs. Only successful
+# verifies are stored and hits don't extend the TTL; lockout and
+# deactivation are still checked against the row on every attempt.
+PIN_CACHE_TTL_SECONDS = 30.0
+PIN_CACHE_MAX_ENTRIES = 10_000
+_PIN_CACHE_KEY = secrets.token_bytes(32)
+_verified_pins: BoundedTTLCache[bytes, bool] = BoundedTTLCache(
+    PIN_CACHE_MAX_ENTRIES, ttl=PIN_CACHE_TTL_SECONDS
+)
+
+
+def _pin_cache_key(auth_method_id: object, hashed_secret: object, pin: str) -> bytes:
+    material = f"{auth_method_id}\x00{hashed_secret}\x00{pin}".encode()
+    return hashlib.blake2b(material, key=_PIN_CACHE_KEY, digest_size=16).digest()
 
 
 # ========================
@@ -95,6 +139,7 @@ class CreateSessionInput(TypedDict):
     auth_method_id: str
     kiosk_id: Optional[str]
     location: Optional[dict]
+    claims: NotRequired[dict]  # user_claims() of a user the caller already loaded
 
 
 class CreateSessionResult(TypedDict):
@@ -182,37 +227,33 @@ async def create_user_account(input: CreateUserAccountInput) -> CreateUserAccoun
     
     async with AsyncSessionLocal() as db:
         try:
-            # Check if username already exists
-            result = await db.execute(
-                select(User).filter(User.username == input["username"])
-            )
-            existing_user = result.scalar_one_or_none()
-            if existing_user:
+            # Check username and email (if provided) in one round-trip
+            conflict = User.username == input["username"]
+            if input.get("email"):
+                conflict = or_(conflict, User.email == input["email"])
+            result = await db.execute(select(User.username, User.email).where(conflict))
+            existing = result.all()
+            if any(row.username == input["username"] for row in existing):
                 raise ValueError(f"Username '{input['username']}' is already taken")
+            if existing:
+                raise ValueError(f"Email '{input['email']}' is already registered")
             
-            # Check if email already exists (if provided)
-            if input.get("email"):
-                result = await db.execute(
-                    select(User).filter(User.email == input["email"])
+            # Create user (RETURNING avoids a flush/refresh round-trip)
+            result = await db.execute(
+                insert(User)
+                .values(
+                    username=input["username"],
+                    full_name=input["full_name"],
+                    user_type=UserType[input["user_type"]],
+                    email=input.get("email"),
+                    phone_number=input.get("phone"),
+                    hashed_password=None,  # UN/PIN auth doesn't use password field
+                    is_active=True,
                 )
-                existing_email = result.scalar_one_or_none()
-                if existing_email:
-                    raise ValueError(f"Email '{input['email']}' is already registered")
-            
-            # Create user
-            user = User(
-                username=input["username"],
-                full_name=input["full_name"],
-                user_type=UserType[input["user_type"]],
-                email=input.get("email"),
-                phone_number=input.get("phone"),
-                hashed_password=None,  # UN/PIN auth doesn't use password field
-                is_active=True,
+                .returning(User.id, User.username, User.created_at)
             )
-            
-            db.add(user)
+            user = result.one()
             await db.commit()
-            await db.refresh(user)
             
             activity.logger.info(f"User account created successfully: {user.id}")
             
@@ -250,27 +291,28 @@ async def create_pin_auth_method(
     async with AsyncSessionLocal() as db:
         try:
             # Hash PIN using Argon2 (OWASP recommended)
-            hashed_pin = argon2.using(
-                time_cost=3,  # Iterations
-                memory_cost=65536,  # 64 MB
-                parallelism=4,  # Threads
-                salt_size=16,
-            ).hash(input["pin"])
+            hashed_pin = await run_hashing(_pin_hasher.hash, input["pin"])
             
             # Create authentication method
-            auth_method = UserAuthenticationMethod(
-                user_id=input["user_id"],
-                method_type=AuthMethodType.PIN,
-                method_identifier=input["user_id"],  # PIN is user-specific
-                hashed_secret=hashed_pin,
-                is_active=True,
-                is_primary=input["is_primary"],
-                failed_attempts=0,
+            result = await db.execute(
+                insert(UserAuthenticationMethod)
+                .values(
+                    user_id=input["user_id"],
+                    method_type=AuthMethodType.PIN,
+                    method_identifier=input["user_id"],  # PIN is user-specific
+                    hashed_secret=hashed_pin,
+                    is_active=True,
+                    is_primary=input["is_primary"],
+                    failed_attempts=0,
+                )
+                .returning(
+                    UserAuthenticationMethod.id,
+                    UserAuthenticationMethod.method_type,
+                    UserAuthenticationMethod.created_at,
+                )
             )
-            
-            db.add(auth_method)
+            auth_method = result.one()
             await db.commit()
-            await db.refresh(auth_method)
             
             activity.logger.info(f"PIN auth method created successfully: {auth_method.id}")
             
@@ -306,7 +348,7 @@ async def create_user_profile(input: CreateProfileInput) -> CreateProfileResult:
             profile_data = input["profile_data"]
             
             if input["user_type"] == "INDIVIDUAL":
-                profile = IndividualProfile(
+                profile_model, values = IndividualProfile, dict(
                     user_id=input["user_id"],
                     date_of_birth=profile_data.get("date_of_birth"),
                     city=profile_data.get("city"),
@@ -318,7 +360,7 @@ async def create_user_profile(input: CreateProfileInput) -> CreateProfileResult:
                     availability=profile_data.get("availability"),
                 )
             elif input["user_type"] == "BUSINESS":
-                profile = BusinessProfile(
+                profile_model, values = BusinessProfile, dict(
                     user_id=input["user_id"],
                     business_name=profile_data["business_name"],
                     business_type=profile_data["business_type"],
@@ -332,7 +374,7 @@ async def create_user_profile(input: CreateProfileInput) -> CreateProfileResult:
                     business_hours=profile_data.get("business_hours"),
                 )
             elif input["user_type"] == "ORGANIZATION":
-                profile = OrganizationProfile(
+                profile_model, values = OrganizationProfile, dict(
                     user_id=input["user_id"],
                     organization_name=profile_data["organization_name"],
                     organization_type=profile_data["organization_type"],
@@ -350,14 +392,16 @@ async def create_user_profile(input: CreateProfileInput) -> CreateProfileResult:
             else:
                 raise ValueError(f"Unknown user type: {input['user_type']}")
             
-            db.add(profile)
+            result = await db.execute(
+                insert(profile_model).values(**values).returning(profile_model.id)
+            )
+            profile_id = result.scalar_one()
             await db.commit()
-            await db.refresh(profile)
             
-            activity.logger.info(f"Profile created successfully: {profile.id}")
+            activity.logger.info(f"Profile created successfully: {profile_id}")
             
             return CreateProfileResult(
-                profile_id=str(profile.id),
+                profile_id=str(profile_id),
                 user_type=input["user_type"],
             )
         
@@ -384,15 +428,17 @@ async def initialize_verification_level(
     
     async with AsyncSessionLocal() as db:
         try:
-            verification_level = UserVerificationLevel(
-                user_id=input["user_id"],
-                current_level="TIER_0_UNVERIFIED",
-                verification_score=0,
+            result = await db.execute(
+                insert(UserVerificationLevel)
+                .values(
+                    user_id=input["user_id"],
+                    current_level="TIER_0_UNVERIFIED",
+                    verification_score=0,
+                )
+                .returning(UserVerificationLevel.id, UserVerificationLevel.current_level)
             )
-            
-            db.add(verification_level)
+            verification_level = result.one()
             await db.commit()
-            await db.refresh(verification_level)
             
             activity.logger.info(
                 f"Verification level initialized: {str(verification_level.current_level)}"
@@ -425,19 +471,22 @@ async def create_session(input: CreateSessionInput) -> CreateSessionResult:
     async with AsyncSessionLocal() as db:
         try:
             # Determine session expiry based on device type
-            if input.get("kiosk_id"):
-                # Kiosk (shared device): 30 minutes
-                expires_in = 1800
-                expires_at = datetime.utcnow() + timedelta(seconds=expires_in)
-            else:
-                # Personal device: 7 days
-                expires_in = 604800
-                expires_at = datetime.utcnow() + timedelta(seconds=expires_in)
+            session_ttl = _KIOSK_SESSION_TTL if input.get("kiosk_id") else _PERSONAL_SESSION_TTL
+            expires_in = int(session_ttl.total_seconds())
+            expires_at = datetime.utcnow() + session_ttl
+            
+            # Embed user type and account flags so type-gated endpoints
+            # can authorize from the token alone
+            claims = input.get("claims")
+            if claims is None:
+                user = await db.get(User, UUID(input["user_id"]))
+                claims = user_claims(user) if user else None
             
             # Generate JWT tokens with correct function signatures
             access_token = create_access_token(
                 subject=input["user_id"],
-                expires_delta=timedelta(seconds=expires_in),
+                expires_delta=session_ttl,
+                claims=claims,
             )
             refresh_token = create_refresh_token(
                 subject=input["user_id"],
@@ -533,6 +582,11 @@ async def record_signup_event(input: RecordSignupEventInput) -> str:
 # Authentication Activities
 # ========================
 
+def _pin_is_valid_format(pin: str) -> bool:
+    """Return True if ``pin`` is exactly six ASCII digits."""
+    return len(pin) == 6 and pin.isascii() and pin.isdigit()
+
+
 @activity.defn
 async def validate_pin_login(
     input: ValidatePINLoginInput
@@ -548,17 +602,28 @@ async def validate_pin_login(
     """
     activity.logger.info(f"Validating PIN login for username: {input['username']}")
     
+    # Malformed PINs can never match; reject them before the DB and Argon2
+    if not _pin_is_valid_format(input["pin"]):
+        return ValidatePINLoginResult(
+            success=False,
+            user_id=None,
+            error_code="INVALID_CREDENTIALS",
+            error_message="Invalid username or PIN",
+            attempts_remaining=None,
+            locked_until=None,
+        )
+    
     async with AsyncSessionLocal() as db:
         try:
             # Find user by username
             result = await db.execute(
-                select(User).filter(User.username == input["username"])
+                select(User.id).filter(User.username == input["username"])
             )
-            user = result.scalar_one_or_none()
+            user = result.first()
             
             if not user:
-                # Timing attack protection: Random sleep for invalid usernames
-                await asyncio.sleep(secrets.randbelow(200) / 1000 + 0.1)  # 0.1-0.3s
+                # Timing attack protection: same Argon2 cost as a real attempt
+                await averify_password(input["pin"], _DUMMY_PIN_HASH)
                 return ValidatePINLoginResult(
                     success=False,
                     user_id=None,
@@ -580,6 +645,7 @@ async def validate_pin_login(
             auth_method = result.scalar_one_or_none()
             
             if not auth_method:
+                await averify_password(input["pin"], _DUMMY_PIN_HASH)
                 return ValidatePINLoginResult(
                     success=False,
                     user_id=None,
@@ -605,8 +671,15 @@ async def validate_pin_login(
                 auth_method.failed_attempts = 0  # type: ignore
                 auth_method.locked_until = None  # type: ignore
             
-            # Verify PIN using timing-safe comparison
-            pin_valid = argon2.verify(input["pin"], auth_method.hashed_secret)  # type: ignore
+            # Verify PIN using timing-safe comparison. Argon2 is CPU-bound
+            # (tens of ms), so it runs on the hashing pool, keeping the
+            # event loop free for other requests and activities
+            pin_key = _pin_cache_key(auth_method.id, auth_method.hashed_secret, input["pin"])
+            pin_valid = pin_key in _verified_pins
+            if not pin_valid:
+                pin_valid = await averify_password(input["pin"], auth_method.hashed_secret)  # type: ignore
+                if pin_valid:
+                    _verified_pins.set(pin_key, True)
             
             if pin_valid:
                 # Success: Reset failed attempts
@@ -132,6 +132,10 @@ async def calculate_match_scores(
     from nabr.core.config import get_settings
     
     settings = get_settings()
+    skill_weight = settings.matching_skill_weight
+    distance_weight = settings.matching_distance_weight
+    rating_weight = settings.matching_rating_weight
+    availability_weight = settings.matching_availability_weight
     
     async with AsyncSessionLocal() as db:
         # Get request details
@@ -155,7 +159,7 @@ async def calculate_match_scores(
                 request.required_skills or [],
                 candidate["skills"] or []
             )
-            score += skill_score * settings.matching_skill_weight
+            score += skill_score * skill_weight
             
             # Distance score (10% weight)
             distance_score = _calculate_distance_score(
@@ -165,16 +169,16 @@ async def calculate_match_scores(
                 candidate["longitude"],
                 candidate["max_distance_km"]
             )
-            score += distance_score * settings.matching_distance_weight
+            score += distance_score * distance_weight
             
             # Rating score (20% weight)
             rating_score = (candidate["rating"] or 0.0) / 5.0
-            score += rating_score * settings.matching_rating_weight
+            score += rating_score * rating_weight
             
             # Availability score (30% weight)
             # TODO: Implement availability matching
             availability_score = 0.8  # Placeholder
-            score += availability_score * settings.matching_availability_weight
+            score += availability_score * availability_weight
             
             candidate["match_score"] = round(score, 3)
             scored_candidates.append(candidate)
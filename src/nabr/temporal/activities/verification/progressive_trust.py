@@ -106,7 +106,6 @@ async def award_verification_points(
                 current_level=VerificationLevel.UNVERIFIED,
                 completed_methods=[],
                 in_progress_methods=[],
-                total_methods_completed=0,
             )
             db.add(level_record)
             await db.flush()
@@ -118,7 +117,6 @@ async def award_verification_points(
         if method not in completed_list:
             completed_list.append(method)
             level_record.completed_methods = completed_list
-            level_record.total_methods_completed = len(completed_list)
         
         # Calculate new trust score
         # Build method count dict
@@ -14,6 +14,7 @@ from uuid import UUID
 import qrcode
 from temporalio import activity
 
+from nabr.core.security import hash_token
 from nabr.db.session import AsyncSessionLocal
 from nabr.models.verification import VerificationRecord, VerificationStatus
 
@@ -88,12 +89,12 @@ async def generate_verification_qr_codes(
     
     activity.logger.info(f"Generated QR codes for user {user_name}")
     
-    # Store tokens in database for validation
+    # Store token digests in database for validation (raw tokens never persist)
     async with AsyncSessionLocal() as db:
         verification = await db.get(VerificationRecord, UUID(verification_id))
         if verification:
-            verification.verifier1_token = token_1
-            verification.verifier2_token = token_2
+            verification.verifier1_token_sha256 = hash_token(token_1)
+            verification.verifier2_token_sha256 = hash_token(token_2)
             verification.qr_expires_at = expires_at
             verification.status = VerificationStatus.PENDING
             await db.commit()
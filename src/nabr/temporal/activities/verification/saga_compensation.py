@@ -11,6 +11,7 @@ from uuid import UUID
 from temporalio import activity
 from sqlalchemy import select
 
+from nabr.core.security import hash_token
 from nabr.db.session import AsyncSessionLocal
 from nabr.models.verification import VerificationRecord, VerificationStatus
 
@@ -34,11 +35,12 @@ async def invalidate_qr_codes(
     
     async with AsyncSessionLocal() as db:
         for token in qr_codes:
-            # Find verification record by token
+            # Find verification record by token digest
+            token_digest = hash_token(token)
             result = await db.execute(
                 select(VerificationRecord).where(
-                    (VerificationRecord.verifier1_token == token) |
-                    (VerificationRecord.verifier2_token == token)
+                    (VerificationRecord.verifier1_token_sha256 == token_digest) |
+                    (VerificationRecord.verifier2_token_sha256 == token_digest)
                 )
             )
             verification = result.scalar_one_or_none()
@@ -54,7 +54,9 @@ class SignupWorkflow:
     7. Record signup event for analytics
     8. Start verification workflow as child workflow
     
-    On failure at any step, compensation activities rollback previous work.
+    On failure in steps 1-5, compensation activities rollback previous work.
+    Once step 5 completes, the get_initial_result update returns the
+    user and tokens to the caller while steps 6-8 continue in the background.
     """
     
     def __init__(self) -> None:
@@ -63,6 +65,11 @@ class SignupWorkflow:
         self._profile_id: Optional[str] = None
         self._verification_level_id: Optional[str] = None
         self._session_token: Optional[str] = None
+        # Set once the account, PIN, profile and session exist; returned to
+        # the API through the get_initial_result update before the
+        # non-critical tail (welcome message, analytics, verification) runs
+        self._initial_result: Optional[dict] = None
+        self._signup_error: Optional[str] = None
     
     @workflow.run
     async def run(
@@ -185,51 +192,85 @@ class SignupWorkflow:
             )
             self._session_token = session_result["session_token"]
             workflow.logger.info("Session created successfully")
-            
-            # Step 6: Send welcome message (optional, non-critical)
-            if email or phone:
-                workflow.logger.info(f"Sending welcome message to user: {self._user_id}")
-                try:
-                    await workflow.execute_activity(
-                        "send_welcome_message",
-                        SendWelcomeMessageInput(
-                            user_id=self._user_id,
-                            contact_method="email" if email else "sms",
-                            recipient=email or phone,
-                            username=username,
-                        ),
-                        start_to_close_timeout=timedelta(seconds=60),
-                        retry_policy=RetryPolicy(maximum_attempts=2),  # Less critical
-                    )
-                    workflow.logger.info("Welcome message sent")
-                except Exception as e:
-                    # Non-critical failure - log and continue
-                    workflow.logger.warning(f"Failed to send welcome message: {e}")
-            
-            # Step 7: Record signup event (fire-and-forget for analytics)
-            workflow.logger.info(f"Recording signup event for user: {self._user_id}")
+        
+        except Exception as e:
+            # Saga compensation: Rollback all created resources
+            workflow.logger.error(f"Signup failed, starting compensation: {e}")
+            self._signup_error = str(e)
+            await self._compensate()
+            raise ApplicationError(
+                f"Signup failed: {str(e)}",
+                non_retryable=True,  # Don't retry after compensation
+            )
+        
+        # The user can log in from here on; release the API response
+        self._initial_result = {
+            "user_id": self._user_id,
+            "username": username,
+            "user_type": user_type,
+            "full_name": full_name,
+            "verification_level": verification_result["current_level"],
+            "tokens": {
+                "access_token": session_result["access_token"],
+                "refresh_token": session_result["refresh_token"],
+                "token_type": "bearer",
+                "expires_in": session_result["expires_in"],
+            },
+            "session_id": session_result.get("session_id"),
+            "session_expires_at": session_result.get("session_expires_at"),
+            "workflow_id": workflow.info().workflow_id,
+            "next_steps": self._get_next_steps(user_type),
+        }
+        
+        # Steps 6-8 are non-critical: the account already exists and the
+        # client already holds its tokens, so failures here are logged
+        # rather than compensated
+        
+        # Step 6: Send welcome message (optional, non-critical)
+        if email or phone:
+            workflow.logger.info(f"Sending welcome message to user: {self._user_id}")
             try:
                 await workflow.execute_activity(
-                    "record_signup_event",
-                    RecordSignupEventInput(
+                    "send_welcome_message",
+                    SendWelcomeMessageInput(
                         user_id=self._user_id,
+                        contact_method="email" if email else "sms",
+                        recipient=email or phone,
                         username=username,
-                        user_type=user_type,
-                        signup_method="PIN",
-                        location=location,
-                        kiosk_id=kiosk_id,
                     ),
-                    start_to_close_timeout=timedelta(seconds=30),
+                    start_to_close_timeout=timedelta(seconds=60),
                     retry_policy=RetryPolicy(maximum_attempts=2),  # Less critical
                 )
+                workflow.logger.info("Welcome message sent")
             except Exception as e:
                 # Non-critical failure - log and continue
-                workflow.logger.warning(f"Failed to record signup event: {e}")
-            
-            # Step 8: Start verification workflow as child workflow
-            workflow.logger.info(f"Starting verification workflow for user: {self._user_id}")
-            verification_workflow_id = f"verification_{self._user_id}_{workflow.info().workflow_id}"
-            
+                workflow.logger.warning(f"Failed to send welcome message: {e}")
+        
+        # Step 7: Record signup event (fire-and-forget for analytics)
+        workflow.logger.info(f"Recording signup event for user: {self._user_id}")
+        try:
+            await workflow.execute_activity(
+                "record_signup_event",
+                RecordSignupEventInput(
+                    user_id=self._user_id,
+                    username=username,
+                    user_type=user_type,
+                    signup_method="PIN",
+                    location=location,
+                    kiosk_id=kiosk_id,
+                ),
+                start_to_close_timeout=timedelta(seconds=30),
+                retry_policy=RetryPolicy(maximum_attempts=2),  # Less critical
+            )
+        except Exception as e:
+            # Non-critical failure - log and continue
+            workflow.logger.warning(f"Failed to record signup event: {e}")
+        
+        # Step 8: Start verification workflow as child workflow
+        workflow.logger.info(f"Starting verification workflow for user: {self._user_id}")
+        verification_workflow_id = f"verification_{self._user_id}_{workflow.info().workflow_id}"
+        
+        try:
             # Start child workflow (non-blocking)
             await workflow.start_child_workflow(
                 IdentityVerificationWorkflow.run,
@@ -243,35 +284,16 @@ class SignupWorkflow:
                 task_queue="verification-tasks",
             )
             workflow.logger.info(f"Verification workflow started: {verification_workflow_id}")
-            
-            # Return success response
-            return {
-                "user_id": self._user_id,
-                "username": username,
-                "user_type": user_type,
-                "full_name": full_name,
-                "verification_level": verification_result["current_level"],
-                "tokens": {
-                    "access_token": session_result["access_token"],
-                    "refresh_token": session_result["refresh_token"],
-                    "token_type": "bearer",
-                    "expires_in": session_result["expires_in"],
-                },
-                "session_id": session_result.get("session_id"),
-                "session_expires_at": session_result.get("session_expires_at"),
-                "workflow_id": workflow.info().workflow_id,
-                "verification_workflow_id": verification_workflow_id,
-                "next_steps": self._get_next_steps(user_type),
-            }
-        
         except Exception as e:
-            # Saga compensation: Rollback all created resources
-            workflow.logger.error(f"Signup failed, starting compensation: {e}")
-            await self._compensate()
-            raise ApplicationError(
-                f"Signup failed: {str(e)}",
-                non_retryable=True,  # Don't retry after compensation
-            )
+            # Non-critical failure - log and continue
+            workflow.logger.warning(f"Failed to start verification workflow: {e}")
+            verification_workflow_id = None
+        
+        # Return success response
+        return {
+            **self._initial_result,
+            "verification_workflow_id": verification_workflow_id,
+        }
     
     async def _compensate(self) -> None:
         """
@@ -362,6 +384,28 @@ class SignupWorkflow:
         await self._compensate()
         raise ApplicationError("Signup cancelled by user", non_retryable=True)
     
+    @workflow.update
+    async def get_initial_result(self) -> dict:
+        """
+        Wait for the account, PIN, profile and session to exist.
+        
+        Lets the API respond as soon as the user can log in, instead of
+        waiting for the welcome message, analytics and verification
+        start that follow.
+        
+        Returns:
+            Dict with user_id, username, tokens, verification_level, workflow_id
+        
+        Raises:
+            ApplicationError: If signup failed (resources were compensated)
+        """
+        await workflow.wait_condition(
+            lambda: self._initial_result is not None or self._signup_error is not None
+        )
+        if self._initial_result is None:
+            raise ApplicationError(f"Signup failed: {self._signup_error}", non_retryable=True)
+        return self._initial_result
+    
     @workflow.query
     def get_status(self) -> dict:
         """Query current signup status."""
@@ -11,6 +11,7 @@ Uses Temporal advanced patterns:
 - Continue-As-New for indefinite lifetime (can run for years)
 """
 
+import hashlib
 from datetime import timedelta, datetime
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
@@ -29,6 +30,7 @@ with workflow.unsafe.imports_passed_through():
         get_next_level_requirements,
         is_method_expired,
         get_applicable_methods,
+        methods_to_mask,
         METHOD_SCORES,
     )
     from nabr.temporal.workflows.verification.methods import (
@@ -50,6 +52,18 @@ class MethodCompletion:
     expires_at: Optional[datetime] = None
 
 
+def _completion_to_dict(completion: MethodCompletion) -> Dict[str, Any]:
+    """Serialize a method completion for query results."""
+    return {
+        "method": completion.method.value,
+        "completed_at": completion.completed_at.isoformat(),
+        "points_awarded": completion.points_awarded,
+        "count": completion.count,
+        "expires_at": completion.expires_at.isoformat() if completion.expires_at else None,
+        "is_expired": is_method_expired(completion.method, completion.completed_at.isoformat()),
+    }
+
+
 @dataclass
 class VerificationState:
     """Current state of user's verification."""
@@ -129,6 +143,10 @@ class IndividualVerificationWorkflow:
     
     def __init__(self) -> None:
         self.state: Optional[VerificationState] = None
+        # Next-level requirements (including suggested paths) only change when
+        # the trust score does, so they are computed once per recalculation
+        # instead of on every status query.
+        self._next_level_info: Dict[str, Any] = {}
     
     @workflow.run
     async def run(self, user_id: str, user_type: str = "INDIVIDUAL", state_dict: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -150,6 +168,7 @@ class IndividualVerificationWorkflow:
                 user_id=user_id,
                 user_type=UserType(user_type)
             )
+        self._refresh_next_level_info()
         
         workflow.logger.info(
             f"Individual verification workflow started for user {user_id}",
@@ -442,47 +461,113 @@ class IndividualVerificationWorkflow:
             return {}
         
         return {
-            k: {
-                "method": v.method.value,
-                "completed_at": v.completed_at.isoformat(),
-                "points_awarded": v.points_awarded,
-                "count": v.count,
-                "expires_at": v.expires_at.isoformat() if v.expires_at else None,
-                "is_expired": is_method_expired(v.method, v.completed_at.isoformat()),
-            }
+            k: _completion_to_dict(v)
             for k, v in self.state.completed_methods.items()
         }
     
+    @workflow.query
+    def get_history(self, cursor: Optional[str] = None, limit: int = 20) -> Dict[str, Any]:
+        """Get one page of completed methods, newest first.
+        
+        Keyset pagination on (completed_at, method): the cursor is the
+        "completed_at|method" key of the last item of the previous page.
+        
+        Args:
+            cursor: Key of the last item already returned (None for first page)
+            limit: Maximum number of items to return
+        
+        Returns:
+            Dict with items and next_cursor (None on the last page)
+        """
+        if not self.state:
+            return {"items": [], "next_cursor": None}
+        
+        keyed = sorted(
+            (
+                (f"{v.completed_at.isoformat()}|{k}", v)
+                for k, v in self.state.completed_methods.items()
+            ),
+            key=lambda item: (item[1].completed_at, item[0]),
+            reverse=True,
+        )
+        if cursor:
+            position = next((i for i, (key, _) in enumerate(keyed) if key == cursor), None)
+            keyed = keyed[position + 1:] if position is not None else []
+        
+        page = keyed[:limit]
+        return {
+            "items": [_completion_to_dict(v) for _, v in page],
+            "next_cursor": page[-1][0] if len(keyed) > limit else None,
+        }
+    
     @workflow.query
     def get_next_level_info(self) -> Dict[str, Any]:
-        """Get information about next verification level."""
+        """Get information about next verification level (precomputed)."""
+        return self._next_level_info
+    
+    @workflow.query
+    def get_status(self) -> Dict[str, Any]:
+        """Get trust score, level, history totals and active methods in one query."""
         if not self.state:
             return {}
         
-        # Convert completed method keys to VerificationMethod enum set
-        completed_method_enums = {
-            VerificationMethod(key) for key in self.state.completed_methods.keys()
+        active_points = expired_points = 0
+        for completion in self.state.completed_methods.values():
+            if is_method_expired(completion.method, completion.completed_at.isoformat()):
+                expired_points += completion.points_awarded
+            else:
+                active_points += completion.points_awarded
+        
+        # Changes whenever a method is completed, revoked or expires, so
+        # clients know when to refetch /history
+        history_key = "|".join(sorted(
+            f"{k}@{v.completed_at.isoformat()}" for k, v in self.state.completed_methods.items()
+        ))
+        
+        return {
+            "trust_score": self.state.trust_score,
+            "verification_level": self.state.verification_level.value,
+            "completed_method_count": len(self.state.completed_methods),
+            "active_points": active_points,
+            "expired_points": expired_points,
+            "history_version": hashlib.sha256(history_key.encode()).hexdigest()[:16],
+            "active_verifications": list(self.state.active_verifications),
+            "next_level": self._next_level_info.get("next_level"),
+            "points_needed": self._next_level_info.get("points_needed", 0),
+            "suggested_paths_etag": self._next_level_info.get("suggested_paths_etag"),
         }
+    
+    @workflow.query
+    def get_active_verifications(self) -> List[str]:
+        """Get list of active verification workflow IDs."""
+        return self.state.active_verifications if self.state else []
+    
+    def _refresh_next_level_info(self) -> None:
+        """Recompute the cached next-level requirements from current state."""
+        if not self.state:
+            return
         
         next_level, points_needed, suggested = get_next_level_requirements(
             current_score=self.state.trust_score,
             user_type=self.state.user_type,
-            completed_methods=completed_method_enums
+            completed_methods=methods_to_mask(
+                completion.method for completion in self.state.completed_methods.values()
+            ),
         )
         
-        return {
+        # Changes only when the suggestions do; lets clients skip refetching
+        # suggested paths on every status update
+        paths_key = "|".join(",".join(sorted(m.value for m in path)) for path in suggested)
+        
+        self._next_level_info = {
             "current_score": self.state.trust_score,
             "current_level": self.state.verification_level.value,
             "next_level": next_level.value if next_level else None,
             "points_needed": points_needed,
             "suggested_paths": suggested,
+            "suggested_paths_etag": hashlib.sha256(paths_key.encode()).hexdigest()[:16],
         }
     
-    @workflow.query
-    def get_active_verifications(self) -> List[str]:
-        """Get list of active verification workflow IDs."""
-        return self.state.active_verifications if self.state else []
-    
     async def _check_and_handle_expiry(self) -> None:
         """Check for expired methods and handle renewal."""
         if not self.state:
@@ -592,6 +677,7 @@ class IndividualVerificationWorkflow:
         
         # Calculate new verification level
         self.state.verification_level = calculate_verification_level(self.state.trust_score)
+        self._refresh_next_level_info()
         
         workflow.logger.info(
             f"Trust score recalculated",
@@ -8,6 +8,7 @@ This method is OPTIONAL - not required for any verification level.
 
 from datetime import timedelta, datetime
 from typing import Dict, Optional, Any
+import hmac
 import secrets
 
 from temporalio import workflow
@@ -106,8 +107,11 @@ class EmailVerificationWorkflow:
                 non_retryable=True
             )
         
-        # Step 4: Validate code
-        if self.user_submitted_code != self.verification_code:
+        # Step 4: Validate code (constant-time, so response timing does
+        # not reveal how many leading digits were right)
+        if not hmac.compare_digest(
+            self.user_submitted_code.encode(), self.verification_code.encode()
+        ):
             workflow.logger.warning(
                 f"Invalid verification code",
                 extra={"user_id": user_id, "email": email, "attempts": self.attempts}
@@ -22,6 +22,7 @@ Compensation (if revoked):
 from datetime import timedelta, datetime
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
+import hmac
 
 from temporalio import workflow
 from temporalio.common import RetryPolicy
@@ -31,6 +32,13 @@ with workflow.unsafe.imports_passed_through():
     from nabr.models.verification_types import VerificationMethod, METHOD_SCORES
 
 
+def _qr_code_matches(scanned: str, expected: Optional[str]) -> bool:
+    """Compare a scanned QR code to an issued one in constant time."""
+    if expected is None:
+        return False
+    return hmac.compare_digest(scanned.encode(), expected.encode())
+
+
 @dataclass
 class VerifierConfirmation:
     """Record of a verifier confirmation."""
@@ -47,6 +55,7 @@ class TwoPartyState:
     user_id: str
     qr_code_1: Optional[str] = None
     qr_code_2: Optional[str] = None
+    qr_expires_at: Optional[str] = None  # ISO datetime; QR images never change before this
     verifier_1: Optional[VerifierConfirmation] = None
     verifier_2: Optional[VerifierConfirmation] = None
     saga_step: int = 0
@@ -114,6 +123,7 @@ class TwoPartyInPersonWorkflow:
             
             self.state.qr_code_1 = qr_codes["qr_code_1"]
             self.state.qr_code_2 = qr_codes["qr_code_2"]
+            self.state.qr_expires_at = qr_codes.get("expires_at")
             
             workflow.logger.info(
                 f"Generated QR codes for two-party verification",
@@ -284,13 +294,13 @@ class TwoPartyInPersonWorkflow:
         )
         
         # Assign to first available verifier slot
-        if qr_code == self.state.qr_code_1 and self.state.verifier_1 is None:
+        if _qr_code_matches(qr_code, self.state.qr_code_1) and self.state.verifier_1 is None:
             self.state.verifier_1 = confirmation
             workflow.logger.info(
                 f"Verifier 1 confirmed",
                 extra={"user_id": self.state.user_id, "verifier_id": verifier_id}
             )
-        elif qr_code == self.state.qr_code_2 and self.state.verifier_2 is None:
+        elif _qr_code_matches(qr_code, self.state.qr_code_2) and self.state.verifier_2 is None:
             self.state.verifier_2 = confirmation
             workflow.logger.info(
                 f"Verifier 2 confirmed",
@@ -316,12 +326,25 @@ class TwoPartyInPersonWorkflow:
             "saga_step": self.state.saga_step,
             "qr_code_1_generated": self.state.qr_code_1 is not None,
             "qr_code_2_generated": self.state.qr_code_2 is not None,
+            "qr_expires_at": self.state.qr_expires_at,
             "verifier_1_confirmed": self.state.verifier_1 is not None,
             "verifier_2_confirmed": self.state.verifier_2 is not None,
             "completed": self.state.completed,
             "points_awarded": self.state.points_awarded,
         }
     
+    @workflow.query
+    def get_qr_code(self, verifier_index: int) -> Optional[Dict[str, Any]]:
+        """Get the QR code image for verifier 1 or 2 (generated once per workflow)."""
+        if not self.state:
+            return None
+        
+        image = {1: self.state.qr_code_1, 2: self.state.qr_code_2}.get(verifier_index)
+        if image is None:
+            return None
+        
+        return {"image": image, "expires_at": self.state.qr_expires_at}
+    
     async def _compensate_saga(self) -> None:
         """Compensate saga based on which step failed."""
         if not self.state:
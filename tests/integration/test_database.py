@@ -153,7 +153,6 @@ class TestVerificationModels:
                     VerificationMethod.IN_PERSON_TWO_PARTY.value,
                 ],
                 in_progress_methods=[],
-                total_methods_completed=3,
                 level_progress_percentage=50.0,
             )
             db.add(level)
@@ -169,6 +168,7 @@ class TestVerificationModels:
             assert fetched_level is not None
             assert fetched_level.current_level == VerificationLevel.MINIMAL
             assert len(fetched_level.completed_methods) == 3
+            assert fetched_level.total_methods_completed == 3
             assert VerificationMethod.EMAIL.value in fetched_level.completed_methods
             
             # Cleanup
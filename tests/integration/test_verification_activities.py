@@ -7,8 +7,11 @@ and Temporal activity execution.
 
 import pytest
 from datetime import datetime, timezone
-from uuid import uuid4
+from uuid import UUID, uuid4
 
+from sqlalchemy import select
+
+from nabr.core.security import hash_token
 from nabr.temporal.activities.verification import (
     generate_verification_qr_codes,
     check_verifier_authorization,
@@ -24,6 +27,7 @@ from nabr.models.verification import (
     VerificationStatus,
     UserVerificationLevel,
     VerifierProfile,
+    VerificationEvent,
 )
 
 
@@ -80,7 +84,6 @@ async def test_verifier():
             user_id=verifier.id,
             current_level="MINIMAL",
             completed_methods=["EMAIL", "PHONE", "IN_PERSON_TWO_PARTY"],
-            total_methods_completed=3,
         )
         db.add(verification_level)
         
@@ -134,8 +137,8 @@ class TestQRCodeGeneration:
         # Verify tokens are stored in database
         async with AsyncSessionLocal() as db:
             verification = await db.get(VerificationRecord, uuid4(verification_id))
-            assert verification.verifier1_token == result["token_1"]
-            assert verification.verifier2_token == result["token_2"]
+            assert verification.verifier1_token_sha256 == hash_token(result["token_1"])
+            assert verification.verifier2_token_sha256 == hash_token(result["token_2"])
             assert verification.qr_expires_at is not None
             
             # Cleanup
@@ -315,7 +318,12 @@ class TestEventRecording:
         # Verify database record
         async with AsyncSessionLocal() as db:
             event_id = result["event_id"]
-            event = await db.get(VerificationEvent, uuid4(event_id))
+            # verification_events is partitioned (PK is id + created_at), so
+            # look the row up by id rather than with db.get()
+            result = await db.execute(
+                select(VerificationEvent).where(VerificationEvent.id == UUID(event_id))
+            )
+            event = result.scalar_one_or_none()
             assert event is not None
             assert event.user_id == test_user.id
             assert event.event_type == "test_event"
@@ -0,0 +1,82 @@
+"""
+Unit tests for the bounded TTL cache (core/cache.py).
+"""
+
+from nabr.core.cache import BoundedTTLCache
+
+
+class _Clock:
+    """Manually advanced time source."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestBoundedTTLCache:
+    """Test expiry, eviction and invalidation."""
+
+    def test_hit_within_ttl(self):
+        """A value is returned until its TTL lapses, then dropped."""
+        clock = _Clock()
+        cache = BoundedTTLCache(10, ttl=5.0, clock=clock)
+        cache.set("a", 1)
+        clock.now = 4.9
+        assert cache.get("a") == 1
+        clock.now = 5.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_explicit_expiry_overrides_ttl(self):
+        """Entries can carry their own absolute expiry (e.g. a JWT exp)."""
+        clock = _Clock()
+        cache = BoundedTTLCache(10, ttl=5.0, clock=clock)
+        cache.set("a", 1, expires_at=100.0)
+        clock.now = 50.0
+        assert cache.get("a") == 1
+
+    def test_without_ttl_entries_do_not_expire(self):
+        """With no TTL, entries leave only through eviction or pop."""
+        clock = _Clock()
+        cache = BoundedTTLCache(10, clock=clock)
+        cache.set("a", 1)
+        clock.now = 1e12
+        assert "a" in cache
+
+    def test_oldest_entry_evicted_when_full(self):
+        """Inserting past the cap evicts the oldest entry."""
+        cache = BoundedTTLCache(2)
+        for key in "abc":
+            cache.set(key, key)
+        assert len(cache) == 2
+        assert "a" not in cache
+        assert cache.get("c") == "c"
+
+    def test_overwrite_does_not_evict(self):
+        """Replacing an existing key never evicts another entry."""
+        cache = BoundedTTLCache(2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 3)
+        assert cache.get("a") == 3
+        assert cache.get("b") == 2
+
+    def test_lru_keeps_recently_read_entries(self):
+        """In LRU mode a hit protects the entry from the next eviction."""
+        cache = BoundedTTLCache(3, lru=True)
+        for key in "abc":
+            cache.set(key, key)
+        cache.get("a")
+        cache.set("d", "d")
+        assert "a" in cache
+        assert "b" not in cache
+
+    def test_pop_removes_entry(self):
+        """Invalidation removes the entry and returns its value."""
+        cache = BoundedTTLCache(10)
+        cache.set("a", 1)
+        assert cache.pop("a") == 1
+        assert cache.pop("a") is None
+        assert cache.get("a") is None
@@ -0,0 +1,21 @@
+"""
+Unit tests for application settings (core/config.py).
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from nabr.core.config import get_settings
+
+
+class TestSettings:
+    """Test the cached settings instance."""
+
+    def test_settings_are_cached(self):
+        """Every caller shares one validated instance."""
+        assert get_settings() is get_settings()
+
+    def test_settings_are_frozen(self):
+        """Values derived at import can't drift from a mutated instance."""
+        with pytest.raises(ValidationError):
+            get_settings().debug = True
@@ -0,0 +1,57 @@
+"""
+Unit tests for the health endpoints (main.py).
+"""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from nabr import main
+
+
+@pytest.fixture(autouse=True)
+def _reset_readiness():
+    main._last_ready_at = float("-inf")
+    yield
+    main._last_ready_at = float("-inf")
+
+
+class TestHealthCheck:
+    """Test the liveness endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_body_matches_settings(self):
+        """The prerendered body carries the service identity."""
+        body = json.loads((await main.health_check()).body)
+        assert body == {
+            "status": "healthy",
+            "service": main.settings.app_name,
+            "version": main.settings.app_version,
+            "environment": main.settings.environment,
+        }
+
+
+class TestReadinessCheck:
+    """Test caching of passing readiness probes."""
+
+    @pytest.mark.asyncio
+    async def test_passing_probe_is_reused(self):
+        """Probes within the cache window don't touch the database."""
+        with patch.object(main, "_ping_database", AsyncMock()) as ping:
+            first = await main.readiness_check()
+            second = await main.readiness_check()
+        assert json.loads(first.body) == json.loads(second.body) == {
+            "status": "ready",
+            "database": "connected",
+        }
+        ping.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_is_not_cached(self):
+        """A failure is reported and the next probe checks again."""
+        with patch.object(main, "_ping_database", AsyncMock(side_effect=OSError)) as ping:
+            first = await main.readiness_check()
+            second = await main.readiness_check()
+        assert first.status_code == second.status_code == 503
+        assert ping.await_count == 2
@@ -0,0 +1,35 @@
+"""
+Unit tests for primary key generation (db/ids.py).
+"""
+
+import time
+
+from nabr.db.ids import uuid7
+
+
+class TestUUID7:
+    """Test time-ordered UUID generation."""
+
+    def test_version_and_variant(self):
+        """Generated IDs are RFC 9562 version 7 UUIDs."""
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_embeds_current_timestamp(self):
+        """The leading 48 bits hold the creation time in milliseconds."""
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+        assert before <= value.int >> 80 <= after
+
+    def test_ordered_across_milliseconds(self):
+        """IDs generated in later milliseconds sort after earlier ones."""
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+        assert first < second
+
+    def test_unique(self):
+        """IDs generated within the same millisecond do not collide."""
+        assert len({uuid7() for _ in range(1000)}) == 1000
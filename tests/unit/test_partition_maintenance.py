@@ -0,0 +1,82 @@
+"""
+Unit tests for verification_events partition maintenance (db/maintenance.py).
+"""
+
+from contextlib import asynccontextmanager
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.exc import ProgrammingError
+
+from nabr.db.maintenance import _months_ahead, maintain_verification_event_partitions
+
+
+def _engine(conn):
+    @asynccontextmanager
+    async def begin():
+        yield conn
+
+    engine = MagicMock()
+    engine.begin = begin
+    return engine
+
+
+def _connection(locked=True, execute=None):
+    @asynccontextmanager
+    async def begin_nested():
+        yield
+
+    conn = MagicMock()
+    conn.scalar = AsyncMock(return_value=locked)
+    conn.execute = execute or AsyncMock()
+    conn.scalars = AsyncMock(return_value=MagicMock(all=MagicMock(return_value=[])))
+    conn.begin_nested = begin_nested
+    return conn
+
+
+def _created_months(conn) -> list[date]:
+    return [call.args[1]["month"] for call in conn.execute.await_args_list]
+
+
+class TestPartitionMaintenance:
+    """Test that monthly partitions are created ahead of time."""
+
+    def test_months_ahead_cross_year_boundary(self):
+        """The current month and the next two are covered, across December."""
+        assert _months_ahead(date(2025, 11, 17)) == [
+            date(2025, 11, 1),
+            date(2025, 12, 1),
+            date(2026, 1, 1),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_creates_each_upcoming_month(self):
+        """Every month in the window is passed to the partition function."""
+        conn = _connection()
+        await maintain_verification_event_partitions(_engine(conn), today=date(2025, 12, 3))
+        assert _created_months(conn) == [date(2025, 12, 1), date(2026, 1, 1), date(2026, 2, 1)]
+
+    @pytest.mark.asyncio
+    async def test_skips_run_when_another_process_holds_the_lock(self):
+        """Only one process maintains partitions per run."""
+        conn = _connection(locked=False)
+        await maintain_verification_event_partitions(_engine(conn), today=date(2025, 12, 3))
+        conn.execute.assert_not_awaited()
+        conn.scalars.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_runs_retention_after_creating_partitions(self):
+        """Expired monthly partitions are dropped on every run, without pg_cron."""
+        conn = _connection()
+        await maintain_verification_event_partitions(_engine(conn), today=date(2025, 12, 3))
+        conn.scalars.assert_awaited_once()
+        assert "drop_expired_verification_events_partitions" in str(conn.scalars.await_args.args[0])
+
+    @pytest.mark.asyncio
+    async def test_failed_month_does_not_stop_later_months(self):
+        """A month that can't be created is logged and the rest still run."""
+        execute = AsyncMock(side_effect=[ProgrammingError("stmt", {}, Exception("boom")), None, None])
+        conn = _connection(execute=execute)
+        await maintain_verification_event_partitions(_engine(conn), today=date(2025, 12, 3))
+        assert len(_created_months(conn)) == 3
@@ -0,0 +1,93 @@
+"""
+Unit tests for the recently-verified PIN cache (temporal/activities/auth_activities.py).
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from nabr.temporal.activities import auth_activities
+from nabr.temporal.activities.auth_activities import _pin_cache_key, validate_pin_login
+
+
+def _session_returning(user, auth_method):
+    """AsyncSessionLocal stand-in answering the user then the PIN method lookup."""
+    user_result = MagicMock()
+    user_result.first.return_value = user
+    method_result = MagicMock()
+    method_result.scalar_one_or_none.return_value = auth_method
+    db = MagicMock()
+    db.execute = AsyncMock(side_effect=[user_result, method_result])
+    db.commit = AsyncMock()
+    session = MagicMock()
+    session.__aenter__ = AsyncMock(return_value=db)
+    session.__aexit__ = AsyncMock(return_value=False)
+    return MagicMock(return_value=session)
+
+
+def _login_input(pin: str = "123456") -> dict:
+    return {
+        "username": "kiosk-user",
+        "pin": pin,
+        "kiosk_id": None,
+        "ip_address": None,
+        "user_agent": None,
+    }
+
+
+def _pin_method(**overrides) -> SimpleNamespace:
+    fields = dict(
+        id=uuid4(),
+        hashed_secret="$argon2id$hash",
+        locked_until=None,
+        failed_attempts=0,
+        last_used_at=None,
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+class TestVerifiedPinCache:
+    """Test reuse of recent successful PIN verifications."""
+
+    def test_key_depends_on_pin_and_stored_hash(self):
+        """A different PIN, or a changed PIN hash, never matches."""
+        method_id = uuid4()
+        key = _pin_cache_key(method_id, "$argon2id$old", "123456")
+        assert key != _pin_cache_key(method_id, "$argon2id$old", "654321")
+        assert key != _pin_cache_key(method_id, "$argon2id$new", "123456")
+
+    @pytest.mark.asyncio
+    async def test_lockout_is_checked_before_the_cache(self):
+        """A cached PIN does not let a locked account log in."""
+        auth_method = _pin_method(
+            locked_until=datetime.utcnow() + timedelta(minutes=5),
+            failed_attempts=5,
+        )
+        auth_activities._verified_pins.set(
+            _pin_cache_key(auth_method.id, auth_method.hashed_secret, "123456"), True
+        )
+        session = _session_returning(SimpleNamespace(id=uuid4()), auth_method)
+        with patch.object(auth_activities, "AsyncSessionLocal", session), \
+                patch.object(auth_activities, "averify_password", AsyncMock()) as verify:
+            result = await validate_pin_login(_login_input())
+        assert result["success"] is False
+        assert result["error_code"] == "ACCOUNT_LOCKED"
+        verify.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_cached_pin_skips_argon2(self):
+        """A renewal with a recently verified PIN succeeds without a verify."""
+        auth_method = _pin_method()
+        auth_activities._verified_pins.set(
+            _pin_cache_key(auth_method.id, auth_method.hashed_secret, "123456"), True
+        )
+        session = _session_returning(SimpleNamespace(id=uuid4()), auth_method)
+        with patch.object(auth_activities, "AsyncSessionLocal", session), \
+                patch.object(auth_activities, "averify_password", AsyncMock()) as verify:
+            result = await validate_pin_login(_login_input())
+        assert result["success"] is True
+        verify.assert_not_awaited()
@@ -0,0 +1,195 @@
+"""
+Unit tests for JWT payload caching (core/security.py).
+"""
+
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from jose import JWTError, jwt
+
+from nabr.core import security
+from nabr.core.security import (
+    ACCESS_TOKEN,
+    REFRESH_TOKEN,
+    create_access_token,
+    create_refresh_token,
+    aget_password_hash,
+    decode_token,
+    averify_password,
+    decode_token_cached,
+    get_password_hash,
+    token_kind,
+    user_claims,
+    validate_password_strength,
+    verify_password,
+)
+from nabr.models.user import UserType
+
+
+@pytest.fixture(autouse=True)
+def _clear_token_cache():
+    security._token_cache.clear()
+    yield
+    security._token_cache.clear()
+
+
+class TestDecodeTokenCached:
+    """Test the verified-payload cache in front of decode_token."""
+
+    def test_second_decode_is_served_from_cache(self):
+        """A token is only verified once while it is still valid."""
+        token = create_access_token(subject="user-1")
+        with patch.object(security, "decode_token", wraps=security.decode_token) as decode:
+            first = decode_token_cached(token)
+            second = decode_token_cached(token)
+        assert first == second
+        assert first["sub"] == "user-1"
+        assert decode.call_count == 1
+
+    def test_expired_entry_is_decoded_again(self):
+        """Cached payloads are not reused past the token's exp claim."""
+        token = create_access_token(subject="user-1", expires_delta=timedelta(seconds=-1))
+        with pytest.raises(JWTError):
+            decode_token_cached(token)
+        assert len(security._token_cache) == 0
+
+
+class TestHS256Tokens:
+    """Test the direct HS256 codec against python-jose."""
+
+    def _jose_token(self, **claims):
+        return jwt.encode(claims, security.settings.secret_key, algorithm="HS256")
+
+    def test_tokens_match_jose(self):
+        """Our encoding is byte-identical to jose's and jose accepts it."""
+        token = create_access_token(subject="user-1", scopes=["read"])
+        payload = jwt.decode(token, security.settings.secret_key, algorithms=["HS256"])
+        assert self._jose_token(**payload) == token
+
+    def test_decodes_jose_tokens(self):
+        """Tokens issued through jose still verify."""
+        token = self._jose_token(sub="user-1", exp=int(time.time()) + 60, t=ACCESS_TOKEN)
+        assert decode_token(token)["sub"] == "user-1"
+
+    def test_reordered_header_is_accepted(self):
+        """Headers other than our own constant are parsed, not rejected."""
+        token = jwt.encode(
+            {"sub": "user-1"}, security.settings.secret_key, algorithm="HS256",
+            headers={"kid": "k1"},
+        )
+        assert token.split(".")[0] != security._JWT_HEADER_SEGMENT
+        assert decode_token(token)["sub"] == "user-1"
+
+    def test_tampered_signature_is_rejected(self):
+        """Changing the payload invalidates the MAC."""
+        header, _, signature = create_access_token(subject="user-1").split(".")
+        forged = self._jose_token(sub="admin").split(".")[1]
+        with pytest.raises(JWTError):
+            decode_token(f"{header}.{forged}.{signature}")
+
+    @pytest.mark.parametrize("token", ["", "a.b", "a.b.c.d", "é.é.é"])
+    def test_malformed_token_is_rejected(self, token):
+        """Garbage input raises JWTError rather than leaking other errors."""
+        with pytest.raises(JWTError):
+            decode_token(token)
+
+    def test_other_algorithms_are_rejected(self):
+        """A token whose header names another algorithm fails even if signed."""
+        token = jwt.encode({"sub": "user-1"}, security.settings.secret_key, algorithm="HS512")
+        with pytest.raises(JWTError):
+            decode_token(token)
+
+    def test_registered_claims_are_validated(self):
+        """Claims jose rejects by default are rejected here too."""
+        for claims in ({"aud": "x"}, {"sub": 1}, {"nbf": int(time.time()) + 60}, {"exp": "soon"}):
+            with pytest.raises(JWTError):
+                decode_token(self._jose_token(**claims))
+
+
+class TestUserClaims:
+    """Test user claims embedded in access tokens."""
+
+    def test_access_token_carries_user_claims(self):
+        """ut/act/ver round-trip through the token."""
+        user = SimpleNamespace(user_type=UserType.BUSINESS, is_active=True, is_verified=False)
+        token = create_access_token(subject="user-1", claims=user_claims(user))
+        payload = decode_token_cached(token)
+        assert payload["ut"] == UserType.BUSINESS.value
+        assert payload["act"] is True
+        assert payload["ver"] is False
+
+    def test_claims_cannot_override_reserved_fields(self):
+        """Extra claims never replace sub, t or exp."""
+        token = create_access_token(subject="user-1", claims={"sub": "other", "t": REFRESH_TOKEN})
+        payload = decode_token_cached(token)
+        assert payload["sub"] == "user-1"
+        assert payload["t"] == ACCESS_TOKEN
+
+
+class TestTokenKind:
+    """Test the compact token-kind claim."""
+
+    def test_access_and_refresh_tokens(self):
+        """New tokens carry an integer t claim and no type claim."""
+        access = decode_token_cached(create_access_token(subject="user-1"))
+        refresh = decode_token_cached(create_refresh_token(subject="user-1"))
+        assert token_kind(access) == ACCESS_TOKEN
+        assert token_kind(refresh) == REFRESH_TOKEN
+        assert "type" not in access
+
+    def test_legacy_type_claim(self):
+        """Tokens issued with the old type claim are still recognized."""
+        assert token_kind({"type": "access"}) == ACCESS_TOKEN
+        assert token_kind({"type": "refresh"}) == REFRESH_TOKEN
+        assert token_kind({}) is None
+
+
+class TestPasswordHashing:
+    """Test Argon2 password hashing via argon2-cffi."""
+
+    def test_hash_round_trip(self):
+        """A hash verifies its own password and rejects others."""
+        hashed = get_password_hash("correct horse")
+        assert hashed.startswith("$argon2id$")
+        assert verify_password("correct horse", hashed)
+        assert not verify_password("wrong horse", hashed)
+
+    def test_malformed_hash_is_rejected(self):
+        """A corrupt stored hash fails verification instead of raising."""
+        assert not verify_password("anything", "not-an-argon2-hash")
+
+    @pytest.mark.asyncio
+    async def test_async_variants_run_on_hashing_pool(self):
+        """The awaitable wrappers hash and verify like the sync functions."""
+        hashed = await aget_password_hash("correct horse")
+        assert await averify_password("correct horse", hashed)
+        assert not await averify_password("wrong horse", hashed)
+
+
+class TestValidatePasswordStrength:
+    """Test the single-pass password strength check."""
+
+    def test_strong_password_is_accepted(self):
+        assert validate_password_strength("SecurePass123!") == (True, "")
+
+    def test_non_ascii_letters_count(self):
+        """Unicode upper/lower-case letters satisfy the letter classes."""
+        assert validate_password_strength("ÉCOLE-été-2025") == (True, "")
+
+    @pytest.mark.parametrize(
+        "password, message",
+        [
+            ("Ab1!", "Password must be at least 8 characters"),
+            ("securepass123!", "Password must contain at least one uppercase letter"),
+            ("SECUREPASS123!", "Password must contain at least one lowercase letter"),
+            ("SecurePass!!!!", "Password must contain at least one digit"),
+            ("SecurePass1234", "Password must contain at least one special character"),
+            ("securepass", "Password must contain at least one uppercase letter"),
+        ],
+    )
+    def test_first_missing_class_is_reported(self, password, message):
+        """Errors keep the original precedence: length, upper, lower, digit, special."""
+        assert validate_password_strength(password) == (False, message)
@@ -0,0 +1,48 @@
+"""
+Unit tests for the process-wide Temporal client (api/dependencies/temporal.py).
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from nabr.api.dependencies import temporal
+
+
+@pytest.fixture(autouse=True)
+def _reset_client():
+    temporal._temporal_client = None
+    yield
+    temporal._temporal_client = None
+
+
+class TestTemporalClient:
+    """Test one-time connection of the shared Temporal client."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_cold_start_connects_once(self):
+        """Requests racing before startup share a single connection."""
+        client = object()
+
+        async def slow_connect(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return client
+
+        with patch.object(temporal.TemporalClient, "connect", AsyncMock(side_effect=slow_connect)) as connect:
+            results = await asyncio.gather(
+                *(temporal.get_temporal_client() for _ in range(10))
+            )
+
+        assert connect.await_count == 1
+        assert all(result is client for result in results)
+
+    @pytest.mark.asyncio
+    async def test_returns_client_connected_at_startup(self):
+        """After startup the dependency never reconnects."""
+        with patch.object(temporal.TemporalClient, "connect", AsyncMock(return_value=object())) as connect:
+            first = await temporal.connect_temporal_client()
+            second = await temporal.get_temporal_client()
+
+        assert first is second
+        assert connect.await_count == 1
@@ -0,0 +1,58 @@
+"""
+Unit tests for the authenticated user snapshot cache (api/dependencies/user_cache.py).
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from nabr.api.dependencies.user_cache import (
+    CachedUser,
+    cache_user,
+    get_cached_user,
+    invalidate_user,
+    load_user_snapshot,
+)
+from nabr.models.user import UserType
+
+
+def _snapshot() -> CachedUser:
+    return CachedUser(
+        id=uuid4(),
+        user_type=UserType.INDIVIDUAL,
+        is_active=True,
+        is_verified=False,
+    )
+
+
+class TestUserCache:
+    """Test caching and invalidation of user snapshots."""
+
+    def test_invalidate_removes_entry(self):
+        """Writers can evict a user so the next request reloads the row."""
+        snapshot = _snapshot()
+        cache_user(snapshot)
+        invalidate_user(snapshot.id)
+        assert get_cached_user(snapshot.id) is None
+
+    @pytest.mark.asyncio
+    async def test_load_skips_database_on_hit(self):
+        """A cached snapshot is served without querying."""
+        snapshot = _snapshot()
+        cache_user(snapshot)
+        db = MagicMock(execute=AsyncMock())
+        assert await load_user_snapshot(db, snapshot.id) is snapshot
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_load_caches_row_on_miss(self):
+        """A miss selects the snapshot columns and caches the result."""
+        snapshot = _snapshot()
+        result = MagicMock()
+        result.one_or_none.return_value = (
+            snapshot.id, snapshot.user_type, snapshot.is_active, snapshot.is_verified,
+        )
+        db = MagicMock(execute=AsyncMock(return_value=result))
+        assert await load_user_snapshot(db, snapshot.id) == snapshot
+        assert get_cached_user(snapshot.id) == snapshot
@@ -0,0 +1,43 @@
+"""
+Unit tests for user schemas (schemas/user.py).
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+from nabr.models.user import UserType, VerificationStatus
+from nabr.schemas.user import UserRead
+
+
+def _user_row(**overrides):
+    fields = dict(
+        id=uuid4(),
+        email="user@nabr.app",
+        full_name="Jane Doe",
+        phone_number=None,
+        user_type=UserType.BUSINESS,
+        is_active=True,
+        is_verified=False,
+        verification_status=VerificationStatus.PENDING,
+        rating=4.5,
+        total_reviews=3,
+        created_at=datetime(2025, 10, 1, 12, 0),
+        updated_at=datetime(2025, 10, 2, 12, 0),
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+class TestUserReadFromOrmFast:
+    """Test the unvalidated constructor used for trusted database rows."""
+
+    def test_matches_validated_model(self):
+        """Skipping validation yields the same serialized output."""
+        row = _user_row()
+        assert UserRead.from_orm_fast(row).model_dump_json() == UserRead.model_validate(row).model_dump_json()
+
+    def test_reads_only_schema_fields(self):
+        """Extra attributes on the row (e.g. the password hash) are ignored."""
+        row = _user_row(hashed_password="secret")
+        assert "hashed_password" not in UserRead.from_orm_fast(row).model_dump()
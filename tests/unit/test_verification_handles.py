@@ -0,0 +1,60 @@
+"""
+Unit tests for cached verification workflow handles (api/dependencies/verification.py).
+"""
+
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from nabr.api.dependencies.verification import verification_workflow_handle
+from nabr.schemas.verification import VerifierConfirmationBatch
+
+
+class TestVerificationWorkflowHandle:
+    """Test reuse of parent verification workflow handles."""
+
+    def test_handle_is_reused_per_user(self):
+        """The same user's handle is built once per client."""
+        client = MagicMock()
+        user_id = uuid4()
+
+        first = verification_workflow_handle(client, user_id)
+        second = verification_workflow_handle(client, user_id)
+
+        assert first is second
+        client.get_workflow_handle.assert_called_once_with(f"verification-{user_id}")
+
+    def test_new_client_gets_a_new_handle(self):
+        """Handles bound to a replaced client are not returned."""
+        old_client, new_client = MagicMock(), MagicMock()
+        user_id = uuid4()
+
+        verification_workflow_handle(old_client, user_id)
+        handle = verification_workflow_handle(new_client, user_id)
+
+        assert handle is new_client.get_workflow_handle.return_value
+
+
+class TestVerifierConfirmationUserIds:
+    """Test that confirmation ids are parsed before they reach the handle cache."""
+
+    def _batch(self, user_id: str) -> dict:
+        return {"confirmations": [{"user_id": user_id, "method": "two_party_in_person", "qr_code": "x"}]}
+
+    def test_invalid_user_id_is_rejected(self):
+        """Arbitrary strings fail validation (a 422) instead of taking cache slots."""
+        with pytest.raises(ValidationError):
+            VerifierConfirmationBatch.model_validate(self._batch("not-a-user"))
+
+    def test_user_id_spellings_share_one_handle(self):
+        """An upper-case id addresses the same cached handle as the UUID itself."""
+        client = MagicMock()
+        user_id = uuid4()
+        batch = VerifierConfirmationBatch.model_validate(self._batch(str(user_id).upper()))
+
+        handle = verification_workflow_handle(client, batch.confirmations[0].user_id)
+
+        assert handle is verification_workflow_handle(client, user_id)
+        client.get_workflow_handle.assert_called_once_with(f"verification-{user_id}")
@@ -20,6 +20,9 @@ from nabr.models.verification_types import (
     get_next_level_requirements,
     is_method_expired,
     get_applicable_methods,
+    methods_to_mask,
+    mask_to_methods,
+    is_method_completed,
     METHOD_SCORES,
     LEVEL_THRESHOLDS,
 )
@@ -204,6 +207,69 @@ class TestNextLevelRequirements:
         assert next_level == VerificationLevel.COMPLETE
         assert points_needed == 0
         assert len(suggested_paths) == 0
+    
+    def test_suggested_paths_ranked_by_remaining_methods(self):
+        """Test paths are ordered by fewest remaining, then most completed, then points."""
+        completed_methods = {VerificationMethod.EMAIL}
+        
+        _, _, suggested_paths = get_next_level_requirements(
+            0, UserType.INDIVIDUAL, completed_methods
+        )
+        
+        ranks = [
+            (
+                len(path - completed_methods),
+                -len(path & completed_methods),
+                -sum(METHOD_SCORES[method].points for method in path),
+            )
+            for path in suggested_paths
+        ]
+        assert ranks == sorted(ranks)
+        # Two-party alone is the shortest path to MINIMAL
+        assert suggested_paths[0] == {VerificationMethod.IN_PERSON_TWO_PARTY}
+    
+    def test_completed_paths_not_suggested(self):
+        """Test that a fully completed path is not suggested again."""
+        completed_methods = {
+            VerificationMethod.GOVERNMENT_ID,
+            VerificationMethod.PLATFORM_HISTORY,
+        }
+        
+        _, _, suggested_paths = get_next_level_requirements(
+            0, UserType.INDIVIDUAL, completed_methods
+        )
+        
+        assert completed_methods not in suggested_paths
+        assert len(suggested_paths) > 0
+    
+    def test_accepts_completed_methods_bitmask(self):
+        """Test that a bitmask gives the same result as the equivalent set."""
+        completed_methods = {VerificationMethod.IN_PERSON_TWO_PARTY, VerificationMethod.EMAIL}
+        
+        assert get_next_level_requirements(
+            180, UserType.INDIVIDUAL, methods_to_mask(completed_methods)
+        ) == get_next_level_requirements(180, UserType.INDIVIDUAL, completed_methods)
+
+
+class TestMethodBitmask:
+    """Test the completed-methods bitmask representation."""
+    
+    def test_round_trip(self):
+        """Test packing and unpacking a set of methods."""
+        methods = {VerificationMethod.EMAIL, VerificationMethod.GOVERNMENT_ID}
+        assert mask_to_methods(methods_to_mask(methods)) == methods
+    
+    def test_distinct_bits_fit_in_bigint(self):
+        """Test every method has its own bit within a signed 64-bit integer."""
+        mask = methods_to_mask(VerificationMethod)
+        assert mask.bit_count() == len(VerificationMethod)
+        assert mask < 2 ** 63
+    
+    def test_is_method_completed(self):
+        """Test single-method membership check."""
+        mask = methods_to_mask({VerificationMethod.PHONE})
+        assert is_method_completed(mask, VerificationMethod.PHONE)
+        assert not is_method_completed(mask, VerificationMethod.EMAIL)
 
 
 class TestMethodExpiry: